@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Library Capacity Audit
+
+Estimates how large a library of PPTX decks will be once converted, and how
+long conversion will take, without converting it. Image sizes come from
+headers only (see diagnose_pptx.py --json); output sizes use the same crop
+and resize rules as parse_pptx.py. Encoded size and conversion time are
+extrapolated from a full conversion of a few sampled slides per deck.
+
+Usage:
+    python scripts/audit_library.py decks_dir/
+    python scripts/audit_library.py decks_dir/ --quality 80 --quota-gb 2
+
+Requirements:
+    pip install python-pptx pillow
+"""
+
+import argparse
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from diagnose_pptx import scan_pptx
+from parse_pptx import ConversionOptions, add_conversion_arguments, calculate_output_size, convert_image
+
+# base64 data URLs are 4/3 the size of the encoded image bytes
+BASE64_OVERHEAD = 4 / 3
+
+
+@dataclass
+class DeckEstimate:
+    """Projected conversion cost of a single deck."""
+    file: str
+    slides: int = 0
+    unknown_images: int = 0
+    source_pixels: int = 0
+    output_pixels: int = 0
+    encoded_bytes: float = 0.0
+    seconds: float = 0.0
+    sampled: int = 0
+    error: str | None = None
+
+    @property
+    def stored_bytes(self) -> float:
+        """Approximate size as base64 data URLs, as stored by the app."""
+        return self.encoded_bytes * BASE64_OVERHEAD
+
+
+def sample_slides(slides: list, count: int) -> list:
+    """Pick up to count slides spread evenly through the deck."""
+    if len(slides) <= count:
+        return slides
+    step = len(slides) / count
+    return [slides[int(i * step)] for i in range(count)]
+
+
+def audit_deck(file_path: Path, options: ConversionOptions, samples: int = 3) -> DeckEstimate:
+    """
+    Estimate a deck's converted size and conversion time.
+
+    Sampled slides are converted for real to measure bytes per output pixel
+    and seconds per source pixel, which are then applied to the whole deck.
+    """
+    estimate = DeckEstimate(file=file_path.name)
+    scan = scan_pptx(file_path)
+    if 'error' in scan:
+        estimate.error = scan['error']
+        return estimate
+
+    slides = []
+    for slide in scan['slides']:
+        image = slide['image']
+        if not image:
+            continue
+        estimate.slides += 1
+        if image['width'] is None:
+            estimate.unknown_images += 1
+            continue
+        crop = tuple(slide['crop'][side] for side in ('left', 'top', 'right', 'bottom'))
+        out_width, out_height = calculate_output_size(
+            image['width'], image['height'], crop, options.max_width, options.max_height
+        )
+        slide_pixels = (image['width'] * image['height'], out_width * out_height)
+        estimate.source_pixels += slide_pixels[0]
+        estimate.output_pixels += slide_pixels[1]
+        slides.append((slide, crop, slide_pixels))
+
+    sampled_bytes = 0
+    sampled_seconds = 0.0
+    sampled_source_pixels = 0
+    sampled_output_pixels = 0
+    with zipfile.ZipFile(file_path) as zf:
+        for slide, crop, (source_pixels, output_pixels) in sample_slides(slides, samples):
+            start = time.perf_counter()
+            try:
+                image_bytes = zf.read(slide['image']['part'])
+                encoded = convert_image(image_bytes, crop, options)
+            except Exception:
+                continue
+            sampled_seconds += time.perf_counter() - start
+            sampled_bytes += len(encoded)
+            sampled_source_pixels += source_pixels
+            sampled_output_pixels += output_pixels
+            estimate.sampled += 1
+
+    if sampled_output_pixels:
+        estimate.encoded_bytes = estimate.output_pixels * sampled_bytes / sampled_output_pixels
+    if sampled_source_pixels:
+        estimate.seconds = estimate.source_pixels * sampled_seconds / sampled_source_pixels
+
+    return estimate
+
+
+def format_mb(num_bytes: float) -> str:
+    return f"{num_bytes / (1024 * 1024):.1f}MB"
+
+
+def print_report(estimates: list[DeckEstimate], quota_gb: float | None, jobs: int) -> None:
+    """Print per-deck estimates and library totals."""
+    print(f"{'Deck':<40} {'Slides':>6} {'Src MP':>8} {'Out MP':>8} {'Encoded':>10} {'Stored':>10} {'Time':>8}")
+    print("-" * 96)
+    for est in estimates:
+        if est.error:
+            print(f"{est.file:<40} ✗ {est.error}")
+            continue
+        note = f"  ({est.unknown_images} unreadable image headers)" if est.unknown_images else ""
+        if not est.sampled and est.slides:
+            note += "  (no sample converted, size unknown)"
+        print(f"{est.file[:40]:<40} {est.slides:>6} {est.source_pixels / 1e6:>8.1f} "
+              f"{est.output_pixels / 1e6:>8.1f} {format_mb(est.encoded_bytes):>10} "
+              f"{format_mb(est.stored_bytes):>10} {est.seconds:>7.1f}s{note}")
+
+    total_slides = sum(e.slides for e in estimates)
+    total_encoded = sum(e.encoded_bytes for e in estimates)
+    total_stored = sum(e.stored_bytes for e in estimates)
+    total_seconds = sum(e.seconds for e in estimates)
+
+    print("=" * 96)
+    print(f"Library: {len(estimates)} decks, {total_slides} slides")
+    print(f"  Encoded images:       {format_mb(total_encoded)}")
+    print(f"  Stored (base64):      {format_mb(total_stored)}")
+    print(f"  Conversion CPU time:  {total_seconds / 60:.1f} min "
+          f"(~{total_seconds / 60 / jobs:.1f} min across {jobs} workers)")
+    if quota_gb is not None:
+        quota_bytes = quota_gb * 1024 ** 3
+        verdict = "fits" if total_stored <= quota_bytes else "DOES NOT FIT"
+        print(f"  Browser quota:        {quota_gb:.1f}GB -> {verdict} "
+              f"({total_stored / quota_bytes * 100:.0f}% used)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Estimate converted size and conversion time for a library of PPTX decks"
+    )
+    parser.add_argument("input", type=Path, help="PPTX file or directory of PPTX files")
+    add_conversion_arguments(parser, default_quality=85)
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=3,
+        help="Slides per deck to convert for size and time estimates (default: 3)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Decks audited in parallel (default: CPU count)"
+    )
+    parser.add_argument(
+        "--quota-gb",
+        type=float,
+        help="Browser storage quota to check the library against (optional)"
+    )
+
+    args = parser.parse_args()
+
+    if not args.input.exists():
+        print(f"Error: Input not found: {args.input}", file=sys.stderr)
+        sys.exit(1)
+
+    pptx_files = sorted(args.input.glob("*.pptx")) if args.input.is_dir() else [args.input]
+    if not pptx_files:
+        print(f"No PPTX files found in: {args.input}", file=sys.stderr)
+        sys.exit(1)
+
+    options = ConversionOptions.from_args(args)
+
+    jobs = args.jobs or os.cpu_count() or 1
+
+    print(f"Auditing {len(pptx_files)} PPTX files...\n", file=sys.stderr)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        estimates = list(executor.map(partial(audit_deck, options=options, samples=args.samples), pptx_files))
+
+    print_report(estimates, args.quota_gb, jobs)
+    sys.exit(1 if any(e.error for e in estimates) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,513 @@
 """
 Batch PPTX to JSON Converter
 
+Converts every deck in a directory using a slide-level pipeline:
+
+- a producer thread opens each deck (largest first), reads the picture part,
+  crop, speaker notes and censor boxes of every slide, and queues the image
+- worker processes decode, crop, resize and encode images from one shared
+  bounded queue, so a large deck is spread over all workers instead of
+  holding up a single one
+- the main thread collects finished slides and writes each deck's output,
+  in slide order, as soon as its last slide is done
+
+Each slide runs under a time and memory limit. A slide that fails, times out
+or takes its worker down is retried once in a separate single-worker pool; if
+it fails again, --on-error decides what is embedded (a substitute image by
+default), and the rest of the deck is unaffected. --error-report lists every
+slide that was not converted.
+
+Output is the same as running parse_pptx.py on each deck. With --bundle, the
+deck outputs are also combined into a single file the app imports in one pass.
+
 Usage:
-    python batch_convert.py <input_dir> <output_dir> [--category "Category Name"]
+    python batch_convert.py <input_dir> <output_dir> [--category "Category Name"] [--jobs 8]
+    python batch_convert.py <input_dir> <output_dir> --contestants contestants.json \
+        --output-format ndjson --bundle season.ndjson
+    python batch_convert.py <input_dir> <output_dir> --on-error drop --error-report errors.json
 """
 
 import argparse
-import subprocess
+import json
+import os
+import queue
+import shutil
+import signal
 import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 
+try:
+    from pptx import Presentation
+except ImportError as e:
+    print(f"Error: Missing required library: {e}")
+    print("Install with: pip install python-pptx pillow")
+    sys.exit(1)
+
+try:
+    import resource
+except ImportError:  # Windows: no per-process memory limit
+    resource = None
+
+from parse_pptx import (
+    Category,
+    CensorBox,
+    ConversionOptions,
+    EncodeStats,
+    ImageTooLargeError,
+    ParseWarning,
+    Slide,
+    SlideImage,
+    add_conversion_arguments,
+    build_parsed_data,
+    category_header,
+    convert_slide_image,
+    extract_censor_boxes,
+    fallback_slide_image,
+    extract_speaker_notes,
+    find_image_shape,
+    get_image_crop_info,
+    get_image_data,
+    slide_content_hash,
+    slide_source_hash,
+    write_json,
+    write_output,
+)
+
+# Warning codes for slides that were not converted, listed in --error-report
+FAILED_SLIDE_CODES = ('image-fallback', 'image-dropped', 'image-too-large')
+# Seconds past --slide-timeout before a worker stuck in native code is killed
+SLIDE_KILL_GRACE = 10
+# The app reads a JSON file as one string, and V8 strings hold at most 2^29 - 24 characters.
+# Keep in sync with MAX_JSON_FILE_BYTES in src/utils/jsonImport.ts
+JSON_BUNDLE_MAX_BYTES = 2 ** 29 - 24
+
+
+class SlideTimeoutError(Exception):
+    """A slide took longer than its time limit to convert."""
+
+
+class Watchdog:
+    """
+    Exits the worker process once a deadline passes, for a slide stuck in
+    native code where SIGALRM cannot interrupt it. The thread is started
+    once per worker, before its memory limit, so it cannot fail to start.
+    """
+
+    def __init__(self):
+        self._deadline: float | None = None
+        self._changed = threading.Condition()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def set(self, seconds: float | None) -> None:
+        """Exit after seconds from now; None clears the deadline."""
+        with self._changed:
+            self._deadline = None if seconds is None else time.monotonic() + seconds
+            self._changed.notify()
+
+    def _run(self) -> None:
+        with self._changed:
+            while True:
+                if self._deadline is None:
+                    self._changed.wait()
+                elif (remaining := self._deadline - time.monotonic()) > 0:
+                    self._changed.wait(remaining)
+                else:
+                    os._exit(1)
+
+
+# The worker process's Watchdog, set by init_worker
+watchdog: Watchdog | None = None
+
+
+@dataclass
+class DeckJob:
+    """Progress of one deck through the pipeline."""
+    path: Path
+    output: Path
+    category: str
+    contestant: str | None = None
+    # (answer, censor boxes, source hash) per slide with an image, in slide order
+    slides: list[tuple[str, list[CensorBox], str]] = field(default_factory=list)
+    # Converted image per slide position; None if the slide was skipped
+    images: dict[int, SlideImage | None] = field(default_factory=dict)
+    warnings: list[ParseWarning] = field(default_factory=list)
+    # convert_in_worker arguments per slide position still in progress, kept for a retry
+    pending: dict[int, tuple] = field(default_factory=dict)
+    # Positions of slides that failed once and were retried
+    retried: set[int] = field(default_factory=set)
+    read_complete: bool = False
+    error: str | None = None
+    # NDJSON header of the written output, used as its bundle index entry
+    header: dict | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.error is not None or (
+            self.read_complete and len(self.images) == len(self.slides)
+        )
+
+
+def init_worker(memory_mb: int) -> None:
+    """
+    Worker process initializer: start its Watchdog, raise SlideTimeoutError
+    on SIGALRM and cap its address space.
+    """
+    global watchdog
+    watchdog = Watchdog()
+    if memory_mb and resource is not None:
+        limit = memory_mb * 1024 * 1024
+        try:
+            hard = resource.getrlimit(resource.RLIMIT_AS)[1]
+            if hard != resource.RLIM_INFINITY:
+                limit = min(limit, hard)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+        except (ValueError, OSError) as e:
+            # Some platforms and containers refuse it; a failing initializer would break the pool
+            print(f"Warning: Could not limit worker memory to {memory_mb}MB: {e}")
+    if hasattr(signal, 'SIGALRM'):
+        signal.signal(signal.SIGALRM, raise_slide_timeout)
+
+
+def raise_slide_timeout(signum, frame) -> None:
+    raise SlideTimeoutError("conversion timed out")
+
+
+def convert_in_worker(image_bytes: bytes, ext: str, crop: tuple[float, float, float, float],
+                      slide_index: int, options: ConversionOptions, timeout: float = 0
+                      ) -> tuple[SlideImage | None, EncodeStats, list[ParseWarning]]:
+    """
+    Worker process entry point: convert one slide image.
+
+    Returns None instead of an image when it is above the pixel limit, so
+    one oversized image skips its slide rather than failing the deck. Other
+    conversion errors are raised, so the caller can retry the slide.
+
+    With a timeout, SlideTimeoutError is raised once it has passed; a worker
+    still busy SLIDE_KILL_GRACE seconds later (stuck in native code, where
+    the signal cannot interrupt it) exits, which breaks its pool.
+    """
+    stats = EncodeStats()
+    warnings: list[ParseWarning] = []
+    if timeout:
+        if hasattr(signal, 'SIGALRM'):
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        if watchdog is not None:
+            watchdog.set(timeout + SLIDE_KILL_GRACE)
+    try:
+        image = convert_slide_image(
+            image_bytes, ext, crop, slide_index, options, stats, on_warning=warnings.append,
+            fallback=False
+        )
+    except ImageTooLargeError as e:
+        image = None
+        warnings.append(ParseWarning(
+            slide_index + 1, 'image-too-large', f"Image on slide {slide_index + 1} skipped: {e}"
+        ))
+    except SlideTimeoutError:
+        raise SlideTimeoutError(f"conversion took longer than {timeout:g}s") from None
+    finally:
+        if timeout:
+            if hasattr(signal, 'SIGALRM'):
+                signal.setitimer(signal.ITIMER_REAL, 0)
+            if watchdog is not None:
+                watchdog.set(None)
+    return image, stats, warnings
+
+
+class WorkerPool:
+    """
+    A ProcessPoolExecutor of limited workers (see init_worker) that is
+    replaced when it breaks, i.e. when a worker was killed or ran out of
+    memory outside Python. Slides that were in the broken pool fail with
+    BrokenProcessPool and are retried like any other failure.
+    """
+
+    def __init__(self, workers: int, memory_mb: int):
+        self._workers = workers
+        self._memory_mb = memory_mb
+        self._lock = threading.Lock()
+        self._executor = self._start()
+
+    def _start(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._workers, initializer=init_worker, initargs=(self._memory_mb,)
+        )
+
+    def submit(self, fn, *args) -> Future:
+        with self._lock:
+            try:
+                return self._executor.submit(fn, *args)
+            except BrokenProcessPool:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._start()
+                return self._executor.submit(fn, *args)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._executor.shutdown(cancel_futures=True)
+
+
+def produce(decks: list[DeckJob], pool: WorkerPool, options: ConversionOptions, timeout: float,
+            slots: threading.BoundedSemaphore, events: queue.Queue) -> None:
+    """
+    Read every deck's slides and submit their images to the worker pool.
+
+    slots bounds how many images are queued or in progress at once, so
+    source images are read only as fast as workers can take them.
+    """
+    for deck_id, deck in enumerate(decks):
+        try:
+            prs = Presentation(str(deck.path))
+            for idx, pptx_slide in enumerate(prs.slides):
+                image_shape = find_image_shape(pptx_slide)
+                if image_shape is None:
+                    continue
+                censor_boxes = extract_censor_boxes(pptx_slide, prs)
+                position = len(deck.slides)
+                deck.slides.append((
+                    extract_speaker_notes(pptx_slide), censor_boxes,
+                    slide_source_hash(pptx_slide, prs, options)
+                ))
+
+                image_bytes, ext = get_image_data(image_shape)
+                work = (image_bytes, ext, get_image_crop_info(image_shape), idx)
+                deck.pending[position] = work
+                slots.acquire()
+                future = pool.submit(convert_in_worker, *work, options, timeout)
+                future.add_done_callback(partial(slide_done, slots, events, deck_id, position))
+        except Exception as e:
+            events.put(("error", deck_id, str(e)))
+        else:
+            events.put(("read", deck_id, None))
+
+
+def slide_done(slots: threading.BoundedSemaphore, events: queue.Queue, deck_id: int,
+               position: int, future: Future) -> None:
+    """Done callback for a slide's conversion: free its slot and hand it to the writer."""
+    slots.release()
+    events.put(("slide", deck_id, (position, future)))
+
+
+def retry_slides(retries: queue.Queue, options: ConversionOptions, timeout: float,
+                 memory_mb: int, events: queue.Queue) -> None:
+    """
+    Retry failed slides one at a time in their own single-worker pool, so a
+    slide that takes its worker down again cannot fail any other slide.
+    Stops at a None item.
+    """
+    pool = WorkerPool(1, memory_mb)
+    try:
+        while (item := retries.get()) is not None:
+            deck_id, position, work = item
+            future = pool.submit(convert_in_worker, *work, options, timeout)
+            wait([future])
+            events.put(("slide", deck_id, (position, future)))
+    finally:
+        pool.shutdown()
+
+
+def describe_failure(error: BaseException) -> str:
+    if isinstance(error, BrokenProcessPool):
+        return "worker process died (out of memory, crashed or stuck past the time limit)"
+    if isinstance(error, MemoryError):
+        return "out of memory"
+    return str(error) or type(error).__name__
+
+
+def write_deck(deck: DeckJob, output_format: str) -> None:
+    """Assemble a deck's slides in order and write its output file."""
+    slides = []
+    for position, (answer, censor_boxes, source_hash) in enumerate(deck.slides):
+        image = deck.images[position]
+        if image is None:
+            continue
+        slide = Slide(
+            imageUrl=image.url,
+            answer=answer,
+            censorBoxes=censor_boxes,
+            sourceHash=source_hash,
+            imageWidth=image.width,
+            imageHeight=image.height,
+            placeholderUrl=image.placeholder
+        )
+        slide.contentHash = slide_content_hash(slide)
+        slides.append(slide)
+    category = Category(name=deck.category, slides=slides)
+    parsed_data = build_parsed_data(category, deck.contestant)
+    write_output(parsed_data, deck.output, output_format)
+    deck.header = category_header(parsed_data)
+
+
+def write_bundle(decks: list[DeckJob], bundle_path: Path, output_format: str) -> None:
+    """
+    Combine written deck outputs into one file, in deck file name order.
+
+    JSON bundles are {"index": [...], "categories": [<deck output>, ...]};
+    NDJSON bundles are an {"index": [...]} line followed by each deck's
+    lines. Index entries are the categories' NDJSON headers (name, metadata
+    with contentHash and contestantName, slideCount). Deck files are copied
+    byte for byte, so the library is never held in memory.
+
+    Raises:
+        ValueError: If a JSON bundle would be larger than the app can read
+            (JSON_BUNDLE_MAX_BYTES); NDJSON bundles have no such limit
+    """
+    decks = sorted(decks, key=lambda deck: deck.path.name)
+    if output_format != "ndjson":
+        size = sum(deck.output.stat().st_size for deck in decks)
+        if size > JSON_BUNDLE_MAX_BYTES:
+            raise ValueError(
+                f"a JSON bundle would be over {size / 1e6:.0f}MB, more than the app can read as "
+                f"one JSON document ({JSON_BUNDLE_MAX_BYTES / 1e6:.0f}MB); use --output-format "
+                f"ndjson with a .ndjson bundle"
+            )
+    with open(bundle_path, "wb") as f:
+        if output_format == "ndjson":
+            write_json({"index": [deck.header for deck in decks]}, f)
+            f.write(b"\n")
+        else:
+            f.write(b'{"index":')
+            write_json([deck.header for deck in decks], f)
+            f.write(b',"categories":[')
+        for i, deck in enumerate(decks):
+            if i and output_format != "ndjson":
+                f.write(b",")
+            with open(deck.output, "rb") as deck_file:
+                shutil.copyfileobj(deck_file, f)
+        if output_format != "ndjson":
+            f.write(b"]}")
+
+
+def read_contestants(path: Path) -> dict[str, str]:
+    """Read a JSON object mapping deck file names (with or without .pptx) to contestant names."""
+    with open(path, encoding="utf-8") as f:
+        contestants = json.load(f)
+    if not isinstance(contestants, dict) or not all(
+        isinstance(name, str) for name in contestants.values()
+    ):
+        raise ValueError("expected a JSON object of deck name -> contestant name")
+    return {Path(deck).stem if deck.lower().endswith(".pptx") else deck: name
+            for deck, name in contestants.items()}
+
+
+def run_pipeline(decks: list[DeckJob], options: ConversionOptions, jobs: int,
+                 queue_size: int, output_format: str, slide_timeout: float = 0,
+                 memory_mb: int = 0) -> tuple[int, int, int, EncodeStats]:
+    """
+    Convert all decks; returns (successful, failed, skipped slides, encode stats).
+
+    A slide that fails is retried once (see retry_slides); if the retry
+    fails too, fallback_slide_image() applies options.on_error and the
+    failure is recorded in the deck's warnings.
+    """
+    events: queue.Queue = queue.Queue()
+    retries: queue.Queue = queue.Queue()
+    slots = threading.BoundedSemaphore(queue_size)
+    stats = EncodeStats()
+    successful = 0
+    failed = 0
+    skipped = 0
+
+    pool = WorkerPool(jobs, memory_mb)
+    retrier = threading.Thread(
+        target=retry_slides, args=(retries, options, slide_timeout, memory_mb, events), daemon=True
+    )
+    retrier.start()
+    try:
+        producer = threading.Thread(
+            target=produce, args=(decks, pool, options, slide_timeout, slots, events), daemon=True
+        )
+        producer.start()
+
+        remaining = len(decks)
+        while remaining:
+            kind, deck_id, payload = events.get()
+            deck = decks[deck_id]
+            if deck.finished:
+                continue  # Late results for a deck that already failed
+
+            if kind == "error":
+                deck.error = payload
+            elif kind == "read":
+                deck.read_complete = True
+            else:
+                position, future = payload
+                try:
+                    image, slide_stats, slide_warnings = future.result()
+                except Exception as e:
+                    work = deck.pending[position]
+                    if position not in deck.retried:
+                        deck.retried.add(position)
+                        print(f"  Retrying slide {work[3] + 1} of {deck.path.name}: {describe_failure(e)}")
+                        retries.put((deck_id, position, work))
+                        continue
+                    image_bytes, ext, _, idx = work
+                    image = fallback_slide_image(
+                        image_bytes, ext, idx, options, describe_failure(e), deck.warnings.append
+                    )
+                else:
+                    deck.warnings.extend(slide_warnings)
+                    stats.merge(slide_stats)
+                deck.images[position] = image
+                del deck.pending[position]
+
+            if not deck.finished:
+                continue
+            remaining -= 1
+            if deck.error is None:
+                try:
+                    write_deck(deck, output_format)
+                except Exception as e:
+                    deck.error = f"could not write output: {e}"
+            if deck.error is None:
+                converted = sum(1 for image in deck.images.values() if image is not None)
+                print(f"✓ Success: {deck.output.name} ({converted} slides)")
+                for warning in sorted(deck.warnings, key=lambda w: w.slide):
+                    print(f"  Warning: {warning.message}")
+                skipped += sum(1 for w in deck.warnings if w.code in ('image-too-large', 'image-dropped'))
+                successful += 1
+            else:
+                print(f"✗ Failed: {deck.path.name}")
+                print(f"  Error: {deck.error[:200]}")
+                failed += 1
+            # Slides are no longer needed once written
+            deck.slides.clear()
+            deck.images.clear()
+            deck.pending.clear()
+
+        producer.join()
+    finally:
+        retries.put(None)
+        retrier.join()
+        pool.shutdown()
+
+    return successful, failed, skipped, stats
+
+
+def write_error_report(decks: list[DeckJob], report_path: Path) -> None:
+    """
+    Write a JSON list of the slides that were not converted, and of decks
+    that failed entirely (slide null), as {deck, slide, code, message}.
+    """
+    entries = []
+    for deck in sorted(decks, key=lambda deck: deck.path.name):
+        if deck.error is not None:
+            entries.append({"deck": deck.path.name, "slide": None, "code": "deck-error",
+                            "message": deck.error})
+        for warning in sorted(deck.warnings, key=lambda w: w.slide):
+            if warning.code in FAILED_SLIDE_CODES:
+                entries.append({"deck": deck.path.name, "slide": warning.slide,
+                                "code": warning.code, "message": warning.message})
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(entries, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -19,9 +517,71 @@ def main():
     parser.add_argument("input_dir", type=Path, help="Directory containing PPTX files")
     parser.add_argument("output_dir", type=Path, help="Output directory for JSON files")
     parser.add_argument("--category", help="Category name for all files (optional)")
+    parser.add_argument(
+        "--output-format",
+        choices=["json", "ndjson"],
+        default="json",
+        help="Output format for each deck (default: json)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes converting images (default: CPU count)"
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        help="Maximum slide images read ahead of the workers (default: 2 per worker)"
+    )
+    parser.add_argument(
+        "--contestants",
+        type=Path,
+        help="JSON file mapping deck file names to contestant names, stored in each "
+             "category's metadata (optional)"
+    )
+    parser.add_argument(
+        "--bundle",
+        type=Path,
+        help="Also combine all converted decks into this file, with an index, for a "
+             "one-pass library import (.json, or .ndjson with --output-format ndjson)"
+    )
+    parser.add_argument(
+        "--slide-timeout",
+        type=float,
+        default=120,
+        help="Seconds allowed to convert one slide image before it is retried, 0 for no "
+             "limit (default: 120)"
+    )
+    parser.add_argument(
+        "--slide-memory-mb",
+        type=int,
+        default=4096,
+        help="Address space limit of each worker process in MB, 0 for no limit (default: 4096)"
+    )
+    parser.add_argument(
+        "--error-report",
+        type=Path,
+        help="Write a JSON list of slides that could not be converted, with the reason (optional)"
+    )
+    # A slide that still fails after its retry is often huge; embedding its original would
+    # bring back the output size and memory use the limits are there to prevent
+    add_conversion_arguments(parser, default_quality=85, default_on_error='substitute')
 
     args = parser.parse_args()
 
+    bundle_suffixes = (".ndjson", ".jsonl") if args.output_format == "ndjson" else (".json",)
+    if args.bundle and args.bundle.suffix.lower() not in bundle_suffixes:
+        parser.error(f"--bundle must be a {' or '.join(bundle_suffixes)} file "
+                     f"with --output-format {args.output_format}")
+
+    contestants = {}
+    if args.contestants:
+        try:
+            contestants = read_contestants(args.contestants)
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not read contestants file {args.contestants}: {e}")
+            sys.exit(1)
+
     # Validate input directory
     if not args.input_dir.exists():
         print(f"Error: Input directory not found: {args.input_dir}")
@@ -30,67 +590,69 @@ def main():
     # Create output directory
     args.output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Get script directory (where this script is located)
-    script_dir = Path(__file__).parent.resolve()
-    parse_script = script_dir / "parse_pptx.py"
-
-    # Find all PPTX files
-    pptx_files = list(args.input_dir.glob("*.pptx"))
+    # Find all PPTX files; largest first so big decks don't finish last on their own
+    pptx_files = sorted(args.input_dir.glob("*.pptx"), key=lambda p: p.stat().st_size, reverse=True)
 
     if not pptx_files:
         print(f"No PPTX files found in: {args.input_dir}")
         return
 
+    jobs = args.jobs or os.cpu_count() or 1
+    queue_size = args.queue_size or jobs * 2
+
     print(f"\nStarting batch conversion...")
     print(f"Input directory: {args.input_dir}")
     print(f"Output directory: {args.output_dir}")
     if args.category:
         print(f"Category: {args.category}")
-    print(f"\nFound {len(pptx_files)} PPTX files\n")
-
-    # Track statistics
-    successful = 0
-    failed = 0
+    print(f"\nFound {len(pptx_files)} PPTX files, converting with {jobs} workers\n")
 
-    # Process each file
-    for pptx_file in pptx_files:
-        output_file = args.output_dir / f"{pptx_file.stem}.json"
+    # Use provided category or filename as category name
+    decks = [
+        DeckJob(
+            path=pptx_file,
+            output=args.output_dir / f"{pptx_file.stem}.{args.output_format}",
+            category=args.category if args.category else pptx_file.stem,
+            contestant=contestants.get(pptx_file.stem),
+        )
+        for pptx_file in pptx_files
+    ]
 
-        print(f"Processing: {pptx_file.name}")
+    for deck_name in sorted(set(contestants) - {deck.path.stem for deck in decks}):
+        print(f"Warning: {args.contestants} names a contestant for {deck_name}, "
+              f"which is not in the input directory")
 
-        # Build command
-        cmd = ["poetry", "run", "python", str(parse_script), str(pptx_file), str(output_file)]
-
-        # Use provided category or filename as category name
-        category = args.category if args.category else pptx_file.stem
-        cmd.extend(["--category", category])
+    successful, failed, skipped, stats = run_pipeline(
+        decks, ConversionOptions.from_args(args), jobs, queue_size, args.output_format,
+        args.slide_timeout, args.slide_memory_mb
+    )
+    retried = sum(len(deck.retried) for deck in decks)
+    failed_slides = sum(1 for deck in decks for w in deck.warnings if w.code in FAILED_SLIDE_CODES)
 
-        # Run conversion
+    if args.error_report:
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=script_dir,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout per file
-            )
-
-            if result.returncode == 0:
-                print(f"✓ Success: {output_file.name}\n")
-                successful += 1
-            else:
-                print(f"✗ Failed: {pptx_file.name}")
-                print(f"  Error: {result.stderr[:200]}\n")
-                failed += 1
-
-        except subprocess.TimeoutExpired:
-            print(f"✗ Failed: {pptx_file.name} (timeout)\n")
+            write_error_report(decks, args.error_report)
+        except OSError as e:
+            print(f"✗ Could not write error report {args.error_report}: {e}")
             failed += 1
-        except Exception as e:
-            print(f"✗ Failed: {pptx_file.name} ({e})\n")
+
+    # The app rejects a bundle containing a category without slides, so empty decks are left out
+    bundled = [deck for deck in decks if deck.header is not None and deck.header["slideCount"]]
+    if args.bundle:
+        for deck in sorted(decks, key=lambda deck: deck.path.name):
+            if deck.header is not None and not deck.header["slideCount"]:
+                print(f"Warning: {deck.path.name} has no slides and is not included in the bundle")
+    bundle_written = False
+    if args.bundle and bundled:
+        try:
+            write_bundle(bundled, args.bundle, args.output_format)
+            bundle_written = True
+        except (OSError, ValueError) as e:
+            print(f"✗ Could not write bundle {args.bundle}: {e}")
             failed += 1
 
     # Print summary
+    print()
     print("=" * 40)
     print("Batch Conversion Complete")
     print("=" * 40)
@@ -98,6 +660,15 @@ def main():
     print(f"Successful:   {successful}")
     if failed > 0:
         print(f"Failed:       {failed}")
+    if retried > 0:
+        print(f"Slides retried: {retried}")
+    if failed_slides > 0:
+        print(f"Slides not converted: {failed_slides} ({skipped} skipped)")
+    if args.error_report:
+        print(f"Error report: {args.error_report}")
+    if bundle_written:
+        print(f"Bundle:       {args.bundle} ({len(bundled)} categories)")
+    print(stats.summary())
     print()
 
     sys.exit(1 if failed > 0 else 0)
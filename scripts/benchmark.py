@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the PPTX conversion pipeline
+
+Measures the hot stages of parse_pptx.py / downscale_pptx_images.py on real
+images so changes to them can be compared.
+
+Usage:
+    python scripts/benchmark.py resample deck.pptx photo.jpg ...
+    python scripts/benchmark.py serialize output.json ...
+    python scripts/benchmark.py handoff photo.jpg deck.pptx ...
+
+Benchmarks:
+    resample   Time each resampling strategy and compare its output against
+               plain LANCZOS (PSNR and SSIM on luminance)
+    serialize  Time and peak memory of hashing and writing parser output with write_json()
+               versus the previous asdict() + indented json.dump()
+    handoff    Time parallel strip resampling with the decoded image passed to
+               workers through shared memory versus pickled strips, against
+               resampling in one process
+
+Requirements:
+    pip install python-pptx pillow
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import math
+import os
+import pickle
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from dataclasses import asdict
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageMath
+except ImportError as e:
+    print(f"Error: Missing required library: {e}", file=sys.stderr)
+    print("Install with: pip install pillow", file=sys.stderr)
+    sys.exit(1)
+
+from parse_pptx import (
+    MAX_SOURCE_PIXELS,
+    RESAMPLE_STRATEGIES,
+    Category,
+    CensorBox,
+    ParsedData,
+    Slide,
+    build_parsed_data,
+    calculate_fit_size,
+    close_strip_pool,
+    open_image,
+    pixel_limit,
+    plan_strips,
+    read_output,
+    resample_strip,
+    resize_image,
+    resize_in_parallel_strips,
+    resize_in_strips,
+    slide_content_hash,
+    strip_mode,
+    strip_strategy,
+    write_json,
+)
+
+# SSIM constants for 8-bit data (Wang et al. 2004)
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+# SSIM window size; windows are non-overlapping blocks
+SSIM_WINDOW = 8
+
+
+def load_images(paths: list[Path], max_images: int) -> list[tuple[str, bytes]]:
+    """Collect (name, bytes) for image files and the media images inside PPTX files."""
+    images = []
+    for path in paths:
+        if path.suffix.lower() == '.pptx':
+            with zipfile.ZipFile(path) as zf:
+                for name in sorted(zf.namelist()):
+                    if name.startswith('ppt/media/') and Path(name).suffix.lower() in ('.jpg', '.jpeg', '.png'):
+                        images.append((f"{path.name}:{Path(name).name}", zf.read(name)))
+        else:
+            images.append((path.name, path.read_bytes()))
+    return images[:max_images]
+
+
+def mean_value(img: Image.Image) -> float:
+    """
+    Mean of a single-band float image. Reducing to one pixel keeps the work in C;
+    ImageStat is histogram-based and inaccurate for mode 'F'.
+    """
+    return img.reduce((img.width, img.height)).getpixel((0, 0))
+
+
+def psnr(reference: Image.Image, candidate: Image.Image) -> float:
+    """Peak signal-to-noise ratio in dB between two same-sized RGB images."""
+    diff = ImageMath.lambda_eval(
+        lambda a: (a['x'] - a['y']) * (a['x'] - a['y']),
+        x=reference.convert('L').convert('F'),
+        y=candidate.convert('L').convert('F'),
+    )
+    mse = mean_value(diff)
+    return math.inf if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+
+
+def ssim(reference: Image.Image, candidate: Image.Image) -> float:
+    """
+    Mean structural similarity on luminance over non-overlapping 8x8 windows.
+    Computed with Pillow alone: window means come from Image.reduce().
+    """
+    x = reference.convert('L').convert('F')
+    y = candidate.convert('L').convert('F')
+    square = lambda a: a['v'] * a['v']  # noqa: E731
+    mu_x = x.reduce(SSIM_WINDOW)
+    mu_y = y.reduce(SSIM_WINDOW)
+    mean_xx = ImageMath.lambda_eval(square, v=x).reduce(SSIM_WINDOW)
+    mean_yy = ImageMath.lambda_eval(square, v=y).reduce(SSIM_WINDOW)
+    mean_xy = ImageMath.lambda_eval(lambda a: a['x'] * a['y'], x=x, y=y).reduce(SSIM_WINDOW)
+
+    ssim_map = ImageMath.lambda_eval(
+        lambda a: ((2 * a['mx'] * a['my'] + SSIM_C1) * (2 * (a['xy'] - a['mx'] * a['my']) + SSIM_C2))
+        / ((a['mx'] * a['mx'] + a['my'] * a['my'] + SSIM_C1)
+           * ((a['xx'] - a['mx'] * a['mx']) + (a['yy'] - a['my'] * a['my']) + SSIM_C2)),
+        mx=mu_x, my=mu_y, xx=mean_xx, yy=mean_yy, xy=mean_xy,
+    )
+    return mean_value(ssim_map)
+
+
+def time_call(func, repeat: int):
+    """Run func repeat times; return (last result, median seconds)."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return result, statistics.median(timings)
+
+
+def bench_resample(args) -> int:
+    """Compare resampling strategies for downscaling each image to the target size."""
+    images = load_images(args.inputs, args.max_images)
+    if not images:
+        print("No images found", file=sys.stderr)
+        return 1
+
+    strategies = [s for s in RESAMPLE_STRATEGIES if s != 'auto']
+    totals = {strategy: [] for strategy in strategies}
+
+    print(f"{'Image':<36} {'Scale':>6} {'Strategy':<14} {'Time':>9} {'PSNR':>8} {'SSIM':>7}")
+    print("-" * 86)
+    for name, data in images:
+        source = Image.open(BytesIO(data))
+        source.load()
+        size = calculate_fit_size(source.width, source.height, args.max_width, args.max_height)
+        if size == source.size:
+            print(f"{name[:36]:<36} already within {args.max_width}x{args.max_height}, skipped")
+            continue
+        scale = min(source.width / size[0], source.height / size[1])
+
+        reference = None
+        for strategy in strategies:
+            result, seconds = time_call(lambda: resize_image(source, size, strategy), args.repeat)
+            if reference is None:
+                reference = result  # 'lanczos' is first: the quality baseline
+            quality = (psnr(reference, result), ssim(reference, result))
+            totals[strategy].append((seconds, *quality))
+            print(f"{name[:36]:<36} {scale:>5.1f}x {strategy:<14} {seconds * 1000:>7.0f}ms "
+                  f"{quality[0]:>7.1f}dB {quality[1]:>7.4f}")
+
+    print("=" * 86)
+    print(f"{'Strategy':<14} {'Total time':>11} {'vs lanczos':>11} {'Mean PSNR':>10} {'Mean SSIM':>10}")
+    baseline = sum(t[0] for t in totals['lanczos'])
+    for strategy, rows in totals.items():
+        if not rows:
+            continue
+        total = sum(r[0] for r in rows)
+        finite_psnr = [r[1] for r in rows if math.isfinite(r[1])]
+        mean_psnr = f"{statistics.mean(finite_psnr):.1f}dB" if finite_psnr else "identical"
+        print(f"{strategy:<14} {total:>10.2f}s {total / baseline if baseline else 0:>10.2f}x "
+              f"{mean_psnr:>10} {statistics.mean(r[2] for r in rows):>10.4f}")
+    return 0
+
+
+def synthetic_output(slides: int, image_kb: int) -> ParsedData:
+    """Build parser output with random image payloads of the given size."""
+    slide_list = [
+        Slide(
+            imageUrl="data:image/jpeg;base64," + base64.b64encode(os.urandom(image_kb * 1024)).decode('ascii'),
+            answer=f"Answer {i}",
+            censorBoxes=[CensorBox(x=10.5, y=20.25, width=30.0, height=8.75, color="#000000")],
+        )
+        for i in range(slides)
+    ]
+    return build_parsed_data(Category(name="Synthetic", slides=slide_list))
+
+
+def legacy_content_hash(slide: Slide) -> str:
+    """slide_content_hash() as it was: canonical JSON of the whole slide, built and encoded in memory."""
+    content = {key: value for key, value in asdict(slide).items()
+               if value is not None and key not in ('contentHash', 'sourceHash')}
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def legacy_write(parsed_data: ParsedData, f) -> None:
+    """
+    Hash and write output as parse_pptx.py did before write_json(): each slide
+    hashed with legacy_content_hash(), then asdict() walked again and indented.
+    """
+    for slide in parsed_data.category.slides:
+        legacy_content_hash(slide)
+
+    def to_dict(obj):
+        if isinstance(obj, list):
+            return [to_dict(item) for item in obj]
+        if hasattr(obj, '__dataclass_fields__'):
+            return {key: to_dict(value) for key, value in asdict(obj).items()}
+        return obj
+    json.dump(to_dict(parsed_data), f, indent=2, ensure_ascii=False)
+
+
+def hash_and_write_json(parsed_data: ParsedData, f) -> None:
+    """Hash every slide with slide_content_hash(), then write with write_json(), as parse_pptx.py does."""
+    for slide in parsed_data.category.slides:
+        slide_content_hash(slide)
+    write_json(parsed_data, f)
+
+
+def without_nulls(value):
+    """Drop null object members, which write_json() leaves out for optional fields."""
+    if isinstance(value, dict):
+        return {key: without_nulls(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [without_nulls(item) for item in value]
+    return value
+
+
+def measure_writer(writer, binary: bool, parsed_data: ParsedData, path: Path,
+                   repeat: int) -> tuple[float, int]:
+    """Return (median seconds, peak traced bytes) for writing parsed_data to path."""
+    def run():
+        with open(path, "wb") if binary else open(path, "w", encoding="utf-8") as f:
+            writer(parsed_data, f)
+
+    _, seconds = time_call(run, repeat)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def bench_serialize(args) -> int:
+    """Compare output writers on real or synthetic parser output."""
+    if args.inputs:
+        documents = [(path.name, read_output(path)) for path in args.inputs]
+    else:
+        documents = [(f"synthetic {args.slides}x{args.image_kb}KB", synthetic_output(args.slides, args.image_kb))]
+
+    print(f"{'Document':<32} {'Writer':<10} {'Size':>9} {'Time':>9} {'MB/s':>8} {'Peak mem':>10}")
+    print("-" * 84)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "output.json"
+        for name, parsed_data in documents:
+            results = {}
+            for label, writer, binary in (("legacy", legacy_write, False), ("write_json", hash_and_write_json, True)):
+                seconds, peak = measure_writer(writer, binary, parsed_data, path, args.repeat)
+                size = path.stat().st_size
+                results[label] = path.read_text(encoding="utf-8")
+                print(f"{name[:32]:<32} {label:<10} {size / 1e6:>7.1f}MB {seconds * 1000:>7.0f}ms "
+                      f"{size / 1e6 / seconds if seconds else 0:>8.0f} {peak / 1e6:>8.1f}MB")
+            if without_nulls(json.loads(results["legacy"])) != json.loads(results["write_json"]):
+                print(f"{name}: write_json output differs from the legacy writer", file=sys.stderr)
+                return 1
+            if any(slide_content_hash(slide) != legacy_content_hash(slide) for slide in parsed_data.category.slides):
+                print(f"{name}: slide_content_hash differs from the legacy hash", file=sys.stderr)
+                return 1
+    return 0
+
+
+def resample_pickled_strip(strip: Image.Image, mode: str, size: tuple[int, int],
+                           box: tuple[float, float, float, float], strategy: str) -> Image.Image:
+    """Worker for the pickling baseline: the strip's source pixels arrive pickled."""
+    return resample_strip(strip.convert(mode), size, box, strategy)
+
+
+def resize_pickled_strips(img: Image.Image, size: tuple[int, int],
+                          executor: ProcessPoolExecutor) -> Image.Image:
+    """resize_in_parallel_strips() as it would be without shared memory: each strip is pickled."""
+    mode = strip_mode(img)
+    box = (0, 0, *img.size)
+    strategy = strip_strategy('auto', box, size)
+    output = Image.new(mode, size)
+    futures = [
+        (y, executor.submit(resample_pickled_strip, img.crop(source_box), mode, (size[0], rows),
+                            strip_box, strategy))
+        for y, rows, source_box, strip_box in plan_strips(box, size, img.height)
+    ]
+    for y, future in futures:
+        output.paste(future.result(), (0, y))
+    return output
+
+
+def pickled_strip_bytes(img: Image.Image, size: tuple[int, int]) -> int:
+    """Bytes sent to workers when every strip's source is pickled."""
+    return sum(
+        len(pickle.dumps(img.crop(source_box), pickle.HIGHEST_PROTOCOL))
+        for _, _, source_box, _ in plan_strips((0, 0, *img.size), size, img.height)
+    )
+
+
+def bench_handoff(args) -> int:
+    """Compare serial, pickled and shared-memory strip resampling of large decoded images."""
+    images = load_images(args.inputs, args.max_images)
+    if not images:
+        print("No images found", file=sys.stderr)
+        return 1
+    workers = args.workers or os.cpu_count() or 1
+
+    print(f"{'Image':<36} {'Pixels':>7} {'Method':<14} {'Time':>9} {'vs serial':>10} {'Handoff':>10}")
+    print("-" * 92)
+    with ProcessPoolExecutor(max_workers=workers) as executor, pixel_limit(MAX_SOURCE_PIXELS):
+        for name, data in images:
+            source = open_image(data)
+            source.load()
+            size = calculate_fit_size(source.width, source.height, args.max_width, args.max_height)
+            if size == source.size:
+                print(f"{name[:36]:<36} already within {args.max_width}x{args.max_height}, skipped")
+                continue
+            box = (0, 0, *source.size)
+            # SharedImage stores 1 byte per pixel for 'L', else 4 ('RGBX' or 'RGBA')
+            shared_bytes = source.width * source.height * (1 if strip_mode(source) == 'L' else 4)
+
+            methods = (
+                ("serial", lambda: resize_in_strips(source, box, size), 0),
+                ("pickle", lambda: resize_pickled_strips(source, size, executor),
+                 pickled_strip_bytes(source, size)),
+                ("shared memory", lambda: resize_in_parallel_strips(source, box, size, workers),
+                 shared_bytes),
+            )
+            reference = None
+            baseline = None
+            for label, run, handoff_bytes in methods:
+                run()  # Warm up: start worker processes outside the timing
+                result, seconds = time_call(run, args.repeat)
+                if reference is None:
+                    reference, baseline = result.tobytes(), seconds
+                elif result.tobytes() != reference:
+                    print(f"{name}: {label} output differs from serial resampling", file=sys.stderr)
+                    return 1
+                print(f"{name[:36]:<36} {source.width * source.height / 1e6:>5.0f}MP {label:<14} "
+                      f"{seconds * 1000:>7.0f}ms {baseline / seconds if seconds else 0:>9.2f}x "
+                      f"{handoff_bytes / 1e6:>8.0f}MB")
+    close_strip_pool()
+    print(f"\n{workers} worker processes; handoff is pixel data copied for workers per image")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PPTX conversion stages")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    resample = subparsers.add_parser("resample", help="Compare resampling strategies")
+    resample.add_argument("inputs", type=Path, nargs='+', help="Image or PPTX files")
+    resample.add_argument("--max-width", type=int, default=3840, help="Target width (default: 3840)")
+    resample.add_argument("--max-height", type=int, default=2160, help="Target height (default: 2160)")
+    resample.add_argument("--max-images", type=int, default=10, help="Images to benchmark (default: 10)")
+    resample.add_argument("--repeat", type=int, default=3, help="Timed runs per strategy (default: 3)")
+    resample.set_defaults(func=bench_resample)
+
+    serialize = subparsers.add_parser("serialize", help="Compare output writers")
+    serialize.add_argument("inputs", type=Path, nargs='*', help="Parser output files (default: synthetic)")
+    serialize.add_argument("--slides", type=int, default=150, help="Synthetic slides (default: 150)")
+    serialize.add_argument("--image-kb", type=int, default=400, help="Synthetic image size (default: 400)")
+    serialize.add_argument("--repeat", type=int, default=3, help="Timed runs per writer (default: 3)")
+    serialize.set_defaults(func=bench_serialize)
+
+    handoff = subparsers.add_parser("handoff", help="Compare shared memory and pickling for parallel resampling")
+    handoff.add_argument("inputs", type=Path, nargs='+', help="Image or PPTX files")
+    handoff.add_argument("--max-width", type=int, default=3840, help="Target width (default: 3840)")
+    handoff.add_argument("--max-height", type=int, default=2160, help="Target height (default: 2160)")
+    handoff.add_argument("--max-images", type=int, default=5, help="Images to benchmark (default: 5)")
+    handoff.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    handoff.add_argument("--repeat", type=int, default=3, help="Timed runs per method (default: 3)")
+    handoff.set_defaults(func=bench_handoff)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
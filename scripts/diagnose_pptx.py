@@ -2,19 +2,50 @@
 """
 Diagnostic script to examine PPTX structure and coordinate systems.
 This helps understand how images and shapes are positioned.
+
+Usage:
+    python diagnose_pptx.py presentation.pptx [slide_number]   # Detailed text report
+    python diagnose_pptx.py --json presentation.pptx            # Fast JSON summary
+    python diagnose_pptx.py --json decks_dir/                   # JSON summary of every deck
+
+The --json mode reads only slide XML, zip member sizes and image headers
+(never full image data), so it is fast enough to run as a pre-flight check
+over a whole library.
 """
 
+import argparse
+import json
+import posixpath
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from xml.etree import ElementTree
 
 try:
     from pptx import Presentation
     from pptx.util import Emu
+    from PIL import Image
 except ImportError as e:
     print(f"Error: Missing required library: {e}", file=sys.stderr)
-    print("Install with: pip install python-pptx", file=sys.stderr)
+    print("Install with: pip install python-pptx pillow", file=sys.stderr)
     sys.exit(1)
 
+from parse_pptx import evaluate_censor_rect, get_visible_image_bounds
+
+# XML namespaces used in slide parts
+NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+}
+R_EMBED = f"{{{NS['r']}}}embed"
+R_ID = f"{{{NS['r']}}}id"
+NOTES_REL_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide'
+# spTree children that are shapes (the rest are the tree's own nvGrpSpPr/grpSpPr/extLst)
+SHAPE_TAGS = {f"{{{NS['p']}}}{tag}" for tag in ('sp', 'pic', 'graphicFrame', 'grpSp', 'cxnSp')}
+
 
 def diagnose_slide(prs, slide_index):
     """Examine a single slide in detail."""
@@ -168,20 +199,242 @@ def get_shape_type_name(shape_type):
     return types.get(shape_type, f"UNKNOWN_{shape_type}")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python diagnose_pptx.py <file.pptx> [slide_number]")
-        print("\nExample:")
-        print("  python diagnose_pptx.py presentation.pptx 2")
-        print("  (diagnoses slide 2, or all slides if number not specified)")
-        sys.exit(1)
+def read_rels(zf: zipfile.ZipFile, part_name: str) -> dict[str, tuple[str, str]]:
+    """
+    Read the relationships of a package part.
+    Returns {rId: (type, target part name)}; external targets are skipped.
+    """
+    part_dir, part_file = posixpath.split(part_name)
+    rels_name = posixpath.join(part_dir, '_rels', f"{part_file}.rels")
+    if rels_name not in zf.NameToInfo:
+        return {}
+
+    rels = {}
+    root = ElementTree.fromstring(zf.read(rels_name))
+    for rel in root.findall('rel:Relationship', NS):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = posixpath.normpath(posixpath.join(part_dir, rel.get('Target', '')))
+        rels[rel.get('Id')] = (rel.get('Type', ''), target.lstrip('/'))
+    return rels
+
+
+def shape_frame(shape_el, pr_tag: str) -> tuple[int, int, int, int] | None:
+    """Read (left, top, width, height) in EMU from a shape's xfrm, or None if inherited."""
+    xfrm = shape_el.find(f'{pr_tag}/a:xfrm', NS)
+    if xfrm is None:
+        return None
+    off = xfrm.find('a:off', NS)
+    ext = xfrm.find('a:ext', NS)
+    if off is None or ext is None:
+        return None
+    return (int(off.get('x', 0)), int(off.get('y', 0)), int(ext.get('cx', 0)), int(ext.get('cy', 0)))
+
+
+def is_placeholder(shape_el, nv_tag: str) -> bool:
+    return shape_el.find(f'{nv_tag}/p:nvPr/p:ph', NS) is not None
+
+
+def is_text_box(shape_el) -> bool:
+    c_nv_sp_pr = shape_el.find('p:nvSpPr/p:cNvSpPr', NS)
+    return c_nv_sp_pr is not None and c_nv_sp_pr.get('txBox') in ('1', 'true')
+
+
+def probe_image(zf: zipfile.ZipFile, part_name: str) -> dict:
+    """Report an image part's size in the zip and its pixel size from the header only."""
+    info = zf.getinfo(part_name)
+    result = {
+        'part': part_name,
+        'bytes': info.file_size,
+        'compressedBytes': info.compress_size,
+        'format': None,
+        'width': None,
+        'height': None,
+    }
+    try:
+        # Image.open only parses the header; pixel data is never decoded
+        with zf.open(part_name) as f, Image.open(f) as img:
+            result['format'] = img.format
+            result['width'], result['height'] = img.size
+    except Exception as e:
+        result['error'] = f"Unreadable image header: {e}"
+    return result
+
+
+def scan_slide(zf: zipfile.ZipFile, part_name: str, index: int) -> dict:
+    """
+    Summarise one slide from its XML: shape counts, the main image, crop,
+    notes, and each filled rectangle with the decision extract_censor_boxes()
+    would make for it.
+    """
+    rels = read_rels(zf, part_name)
+    sp_tree = ElementTree.fromstring(zf.read(part_name)).find('p:cSld/p:spTree', NS)
+    shapes = [el for el in sp_tree if el.tag in SHAPE_TAGS] if sp_tree is not None else []
+
+    pictures = [el for el in shapes if el.tag == f"{{{NS['p']}}}pic" and not is_placeholder(el, 'p:nvPicPr')]
+    auto_shapes = [
+        el for el in shapes
+        if el.tag == f"{{{NS['p']}}}sp"
+        and not is_placeholder(el, 'p:nvSpPr')
+        and el.find('p:spPr/a:custGeom', NS) is None
+        and el.find('p:spPr/a:prstGeom', NS) is not None
+        and not is_text_box(el)
+    ]
+
+    summary = {
+        'slide': index + 1,
+        'part': part_name,
+        'shapes': len(shapes),
+        'pictures': len(pictures),
+        'autoShapes': len(auto_shapes),
+        'hasNotes': False,
+        'image': None,
+        'crop': None,
+        'censorBoxes': [],
+        'warnings': [],
+    }
 
-    file_path = Path(sys.argv[1])
+    # Notes: the parser uses the notes text as the answer
+    notes_part = next((target for rel_type, target in rels.values() if rel_type == NOTES_REL_TYPE), None)
+    if notes_part and notes_part in zf.NameToInfo:
+        notes_root = ElementTree.fromstring(zf.read(notes_part))
+        for sp in notes_root.iter(f"{{{NS['p']}}}sp"):
+            ph = sp.find('p:nvSpPr/p:nvPr/p:ph', NS)
+            if ph is not None and ph.get('type') == 'body':
+                text = ''.join(t.text or '' for t in sp.iter(f"{{{NS['a']}}}t"))
+                summary['hasNotes'] = bool(text.strip())
+                break
+    if not summary['hasNotes']:
+        summary['warnings'].append("No speaker notes (answer will be empty)")
+
+    if not pictures:
+        summary['warnings'].append("No image found (slide will be skipped)")
+        return summary
+
+    # The parser uses the first picture on the slide
+    picture = pictures[0]
+    blip = picture.find('p:blipFill/a:blip', NS)
+    image_rel = rels.get(blip.get(R_EMBED)) if blip is not None else None
+    if image_rel and image_rel[1] in zf.NameToInfo:
+        summary['image'] = probe_image(zf, image_rel[1])
+    else:
+        summary['warnings'].append("Image part not found in package")
+
+    src_rect = picture.find('p:blipFill/a:srcRect', NS)
+    crop = tuple(
+        int(src_rect.get(side, 0)) / 100000 if src_rect is not None else 0.0
+        for side in ('l', 't', 'r', 'b')
+    )
+    summary['crop'] = dict(zip(('left', 'top', 'right', 'bottom'), crop))
+
+    frame = shape_frame(picture, 'p:spPr')
+    if frame is None:
+        summary['warnings'].append("Image has no position (inherited from layout), censor boxes not evaluated")
+        return summary
+    visible = get_visible_image_bounds(*frame, crop)
+
+    for shape in auto_shapes:
+        fill = shape.find('p:spPr/a:solidFill', NS)
+        if fill is None:
+            continue  # Not a solid fill, never considered by the parser
+        rect = shape_frame(shape, 'p:spPr')
+        name = shape.find('p:nvSpPr/p:cNvPr', NS).get('name')
+        if rect is None:
+            summary['censorBoxes'].append({'name': name, 'kept': False, 'reason': "no position"})
+            continue
+
+        srgb = fill.find('a:srgbClr', NS)
+        color = f"#{srgb.get('val').lower()}" if srgb is not None else "#000000"
+        box, reason = evaluate_censor_rect(*rect, visible)
+        entry = {'name': name, 'kept': box is not None, 'reason': reason, 'color': color}
+        if box is not None:
+            entry.update(zip(('x', 'y', 'width', 'height'), (round(v, 2) for v in box)))
+        summary['censorBoxes'].append(entry)
+
+    return summary
+
+
+def scan_pptx(file_path: Path) -> dict:
+    """Build a JSON-serializable summary of a deck without loading image data."""
+    result = {'file': str(file_path), 'size': file_path.stat().st_size}
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            pres_part = 'ppt/presentation.xml'
+            pres_root = ElementTree.fromstring(zf.read(pres_part))
+            sld_sz = pres_root.find('p:sldSz', NS)
+            result['slideWidth'] = int(sld_sz.get('cx')) if sld_sz is not None else None
+            result['slideHeight'] = int(sld_sz.get('cy')) if sld_sz is not None else None
+
+            pres_rels = read_rels(zf, pres_part)
+            slide_parts = [
+                pres_rels[sld_id.get(R_ID)][1]
+                for sld_id in pres_root.findall('p:sldIdLst/p:sldId', NS)
+                if sld_id.get(R_ID) in pres_rels
+            ]
+            slides = [scan_slide(zf, part, idx) for idx, part in enumerate(slide_parts)]
+    except Exception as e:
+        result['error'] = f"Failed to scan PPTX: {e}"
+        return result
+
+    images = [s['image'] for s in slides if s['image']]
+    result.update({
+        'slideCount': len(slides),
+        'slidesWithoutImage': sum(1 for s in slides if not s['pictures']),
+        'slidesWithoutNotes': sum(1 for s in slides if not s['hasNotes']),
+        'imageBytes': sum(img['bytes'] for img in images),
+        'censorBoxesKept': sum(1 for s in slides for b in s['censorBoxes'] if b['kept']),
+        'censorBoxesRejected': sum(1 for s in slides for b in s['censorBoxes'] if not b['kept']),
+        'slides': slides,
+    })
+    return result
+
+
+def run_json_scan(input_path: Path, jobs: int | None) -> int:
+    """Scan a deck or a directory of decks and print the JSON summary to stdout."""
+    pptx_files = sorted(input_path.glob("*.pptx")) if input_path.is_dir() else [input_path]
+    if len(pptx_files) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            decks = list(executor.map(scan_pptx, pptx_files))
+    else:
+        decks = [scan_pptx(f) for f in pptx_files]
+
+    json.dump({'decks': decks}, sys.stdout, indent=2)
+    print()
+    return 1 if any('error' in deck for deck in decks) else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Examine PPTX structure and coordinate systems"
+    )
+    parser.add_argument("input", type=Path, help="PPTX file (or directory of PPTX files with --json)")
+    parser.add_argument(
+        "slide_number",
+        type=int,
+        nargs='?',
+        help="Slide to diagnose (optional, defaults to all slides)"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print a fast JSON summary from slide XML and image headers only"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes for scanning a directory with --json (default: CPU count)"
+    )
+
+    args = parser.parse_args()
+    file_path = args.input
 
     if not file_path.exists():
         print(f"Error: File not found: {file_path}", file=sys.stderr)
         sys.exit(1)
 
+    if args.json:
+        sys.exit(run_json_scan(file_path, args.jobs))
+
     try:
         prs = Presentation(str(file_path))
     except Exception as e:
@@ -192,8 +445,8 @@ def main():
     print(f"Total slides: {len(prs.slides)}")
 
     # Determine which slides to diagnose
-    if len(sys.argv) >= 3:
-        slide_num = int(sys.argv[2])
+    if args.slide_number is not None:
+        slide_num = args.slide_number
         if slide_num < 1 or slide_num > len(prs.slides):
             print(f"Error: Slide number must be between 1 and {len(prs.slides)}", file=sys.stderr)
             sys.exit(1)
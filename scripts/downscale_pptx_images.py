@@ -31,6 +31,11 @@ except ImportError as e:
     print("Install with: pip install python-pptx pillow", file=sys.stderr)
     sys.exit(1)
 
+from parse_pptx import (
+    LARGE_IMAGE_PIXELS, EncodeStats, add_jpeg_arguments, add_resample_argument, add_resize_workers_argument,
+    close_strip_pool, encode_jpeg, parse_progressive_arg, resize_image, resize_in_parallel_strips
+)
+
 
 def get_image_crop_info(image_shape):
     """
@@ -83,7 +88,10 @@ def calculate_target_size_with_crop(original_width: int, original_height: int,
 
 
 def downscale_image(image_bytes: bytes, target_width: int, target_height: int,
-                    quality: int = 95) -> bytes:
+                    quality: int = 95, progressive: bool | None = None,
+                    subsampling: str = 'auto', qtables: str | None = None,
+                    stats: EncodeStats | None = None, resample: str = 'auto',
+                    resize_workers: int = 0) -> bytes:
     """
     Downscale an image to target dimensions.
 
@@ -92,6 +100,11 @@ def downscale_image(image_bytes: bytes, target_width: int, target_height: int,
         target_width: Target width in pixels
         target_height: Target height in pixels
         quality: JPEG quality (1-100, default: 95 for high quality)
+        progressive/subsampling/qtables: JPEG encoder settings, see parse_pptx.encode_jpeg()
+        stats: Optional EncodeStats to record encoding size and time into
+        resample: Resampling strategy, see parse_pptx.resize_image()
+        resize_workers: Processes resampling images above LARGE_IMAGE_PIXELS in parallel
+            strips, see parse_pptx.resize_in_parallel_strips() (0: resample in this process)
 
     Returns:
         Downscaled image bytes (as JPEG)
@@ -102,7 +115,12 @@ def downscale_image(image_bytes: bytes, target_width: int, target_height: int,
 
         # Only resize if target is smaller
         if target_width < original_size[0] or target_height < original_size[1]:
-            img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+            if resize_workers and img.width * img.height > LARGE_IMAGE_PIXELS:
+                img = resize_in_parallel_strips(
+                    img, (0, 0, *img.size), (target_width, target_height), resize_workers, resample
+                )
+            else:
+                img = resize_image(img, (target_width, target_height), resample)
             print(f"    Downscaled: {original_size} -> {img.size}", file=sys.stderr)
         else:
             print(f"    No downscale needed: {original_size}", file=sys.stderr)
@@ -118,9 +136,7 @@ def downscale_image(image_bytes: bytes, target_width: int, target_height: int,
             img = img.convert('RGB')
 
         # Save as JPEG with high quality
-        buffer = BytesIO()
-        img.save(buffer, format='JPEG', quality=quality, optimize=True)
-        return buffer.getvalue()
+        return encode_jpeg(img, quality, progressive, subsampling, qtables, stats)
 
     except Exception as e:
         print(f"    Warning: Failed to process image: {e}", file=sys.stderr)
@@ -129,7 +145,9 @@ def downscale_image(image_bytes: bytes, target_width: int, target_height: int,
 
 def process_pptx(input_path: Path, output_path: Path,
                  max_width: int = 3840, max_height: int = 2160,
-                 quality: int = 95) -> bool:
+                 quality: int = 95, progressive: bool | None = None,
+                 subsampling: str = 'auto', qtables: str | None = None,
+                 resample: str = 'auto', resize_workers: int = 0) -> bool:
     """
     Process a PPTX file and downscale all images.
 
@@ -139,6 +157,9 @@ def process_pptx(input_path: Path, output_path: Path,
         max_width: Maximum width for visible area (default: 3840)
         max_height: Maximum height for visible area (default: 2160)
         quality: JPEG quality (default: 95)
+        progressive/subsampling/qtables: JPEG encoder settings, see parse_pptx.encode_jpeg()
+        resample: Resampling strategy, see parse_pptx.resize_image()
+        resize_workers: Processes for resampling large images, see downscale_image()
 
     Returns:
         True if successful, False otherwise
@@ -149,6 +170,7 @@ def process_pptx(input_path: Path, output_path: Path,
 
         total_images = 0
         downscaled_images = 0
+        stats = EncodeStats()
 
         for slide_idx, slide in enumerate(prs.slides, 1):
             for shape in slide.shapes:
@@ -177,7 +199,8 @@ def process_pptx(input_path: Path, output_path: Path,
                         # Downscale if needed
                         if target_width < original_width or target_height < original_height:
                             new_image_bytes = downscale_image(
-                                image_bytes, target_width, target_height, quality
+                                image_bytes, target_width, target_height, quality,
+                                progressive, subsampling, qtables, stats, resample, resize_workers
                             )
 
                             # Replace image in shape
@@ -197,6 +220,7 @@ def process_pptx(input_path: Path, output_path: Path,
         prs.save(str(output_path))
 
         print(f"✓ Processed {total_images} images ({downscaled_images} downscaled)", file=sys.stderr)
+        print(f"  {stats.summary()}", file=sys.stderr)
         print(f"✓ Saved: {output_path}", file=sys.stderr)
 
         # Show file size comparison
@@ -230,14 +254,15 @@ def main():
         default=2160,
         help="Maximum height for visible area (default: 2160)"
     )
-    parser.add_argument(
-        "--quality",
-        type=int,
-        default=95,
-        help="JPEG quality 1-100 (default: 95)"
-    )
+    add_jpeg_arguments(parser, default_quality=95)
+    add_resample_argument(parser)
+    add_resize_workers_argument(parser)
 
     args = parser.parse_args()
+    encode_options = (
+        args.quality, parse_progressive_arg(args.progressive), args.subsampling, args.qtables,
+        args.resample, args.resize_workers
+    )
 
     # Validate input
     if not args.input.exists():
@@ -253,7 +278,8 @@ def main():
         # Create output directory if needed
         args.output.parent.mkdir(parents=True, exist_ok=True)
 
-        success = process_pptx(args.input, args.output, args.max_width, args.max_height, args.quality)
+        success = process_pptx(args.input, args.output, args.max_width, args.max_height, *encode_options)
+        close_strip_pool()
         sys.exit(0 if success else 1)
 
     # Batch directory mode
@@ -272,11 +298,12 @@ def main():
 
         for pptx_file in pptx_files:
             output_file = args.output / pptx_file.name
-            if process_pptx(pptx_file, output_file, args.max_width, args.max_height, args.quality):
+            if process_pptx(pptx_file, output_file, args.max_width, args.max_height, *encode_options):
                 successful += 1
             else:
                 failed += 1
             print()  # Blank line between files
+        close_strip_pool()
 
         print("=" * 50, file=sys.stderr)
         print(f"Complete: {successful} successful, {failed} failed", file=sys.stderr)
@@ -19,16 +19,26 @@ Requirements:
 
 import argparse
 import base64
+import hashlib
 import json
+import math
 import sys
-from dataclasses import dataclass, asdict
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field, fields, replace
 from io import BytesIO
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
+from typing import BinaryIO
 
 try:
     from pptx import Presentation
     from pptx.util import Emu
-    from PIL import Image
+    from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont
+    from PIL.JpegPresets import presets as JPEG_PRESETS
 except ImportError as e:
     print(f"Error: Missing required library: {e}", file=sys.stderr)
     print("Install with: pip install python-pptx pillow", file=sys.stderr)
@@ -40,7 +50,7 @@ except ImportError as e:
 # If you update these, update src/types/slide.ts and src/types/contestant.ts
 
 
-@dataclass
+@dataclass(slots=True)
 class CensorBox:
     """
     Represents a censorship box overlay on a slide image.
@@ -55,7 +65,7 @@ class CensorBox:
     color: str  # Color of the censor box (hex format)
 
 
-@dataclass
+@dataclass(slots=True)
 class Slide:
     """
     Represents a single slide in a category, containing an image,
@@ -66,9 +76,14 @@ class Slide:
     imageUrl: str  # Image data as base64 data URL
     answer: str  # The correct answer for this slide (from speaker notes)
     censorBoxes: list[CensorBox]  # Censorship boxes to overlay on the image
+    contentHash: str | None = None  # SHA-256 of the other fields but sourceHash (see slide_content_hash)
+    sourceHash: str | None = None  # SHA-256 of the PPTX parts the slide came from (see slide_source_hash)
+    imageWidth: int | None = None  # Pixel size of imageUrl, so the app can lay out before decoding
+    imageHeight: int | None = None
+    placeholderUrl: str | None = None  # Tiny JPEG data URL shown while imageUrl decodes
 
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     """
     Represents a category (topic) with a collection of slides for gameplay.
@@ -79,90 +94,1109 @@ class Category:
     slides: list[Slide]
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedData:
     """
     Output format for the parsed PPTX data.
-    Contains category data and optional metadata about contestant.
+    Contains category data and metadata: the category content hash
+    ("contentHash") and optionally the contestant ("contestantName").
     """
     category: Category
     metadata: dict[str, str] | None = None
 
 
+# JPEG encoder settings
+# Chroma subsampling modes accepted by Pillow, plus 'auto' (chosen per image)
+JPEG_SUBSAMPLING_MODES = ('auto', '4:4:4', '4:2:2', '4:2:0')
+# Quantisation table presets shipped with Pillow (PIL.JpegPresets)
+JPEG_QTABLE_PRESETS = tuple(sorted(JPEG_PRESETS))
+# Images at or above this many pixels are written as progressive JPEGs in 'auto' mode
+PROGRESSIVE_MIN_PIXELS = 1_000_000
+# Images with at most this many distinct colours are treated as graphics (logos, flags, text)
+GRAPHIC_MAX_COLORS = 256
+
+# Resampling strategies for downscaling, plus 'auto' (chosen from the scale ratio)
+RESAMPLE_STRATEGIES = ('auto', 'lanczos', 'bicubic', 'box-lanczos', 'reducing-gap')
+# Pillow reducing_gap for the 'reducing-gap' strategy, and for 'box-lanczos' on strips
+# (2.0 is fast and matches box-lanczos; 3.0+ is indistinguishable from LANCZOS)
+REDUCING_GAP = 2.0
+
+# Source image size limits (see ConversionOptions)
+MAX_SOURCE_PIXELS = 400_000_000
+LARGE_IMAGE_PIXELS = 50_000_000
+# Characters of a string hashed at a time (see update_json_string)
+HASH_CHUNK_CHARS = 1 << 16
+# Output rows resampled at a time for large images (see resize_in_strips)
+STRIP_ROWS = 256
+
+# Output image formats: 'jpeg' always, or 'auto' to pick per image (see encode_auto)
+CODEC_MODES = ('jpeg', 'auto')
+# In 'auto' mode, lossy WebP and reduced-palette PNG must reach this PSNR (dB) against the resized image
+MIN_PSNR = 40.0
+# Images with more colours are still tried as a 256-colour PNG above this edge density (0-1),
+# which catches anti-aliased text and line art
+GRAPHIC_EDGE_DENSITY = 0.05
+# FIND_EDGES response (0-255) counted as an edge pixel, and the size edges are measured at
+EDGE_THRESHOLD = 64
+ANALYSIS_SIZE = 512
+
+# What to embed for an image that cannot be converted (see fallback_slide_image):
+# the source image unchanged, a grey 'image unavailable' substitute, or nothing (drop the slide)
+ERROR_POLICIES = ('original', 'substitute', 'drop')
+# Size the 'substitute' image is fitted into
+SUBSTITUTE_SIZE = (1920, 1080)
+
+# --preview output size and JPEG quality (see preview_options)
+PREVIEW_MAX_WIDTH = 960
+PREVIEW_MAX_HEIGHT = 540
+PREVIEW_QUALITY = 60
+
+# Longest side of the per-slide placeholder thumbnail, and its JPEG quality
+PLACEHOLDER_SIZE = 32
+PLACEHOLDER_QUALITY = 50
+
+
+@dataclass
+class ParseWarning:
+    """
+    A problem found while parsing a slide, reported by parse_presentation().
+    Not part of the JSON output.
+    """
+    slide: int  # 1-based slide number
+    code: str  # One of WARNING_CODES
+    message: str
+
+
+# ParseWarning codes:
+#   no-image: slide has no picture and was skipped
+#   no-notes: slide has no speaker notes, so its answer is empty
+#   image-fallback: image could not be converted; the original or a substitute was embedded
+#                   (ConversionOptions.on_error)
+#   image-dropped: image could not be converted and on_error is 'drop'; slide was skipped
+#   image-too-large: image is above ConversionOptions.max_source_pixels; slide was skipped
+WARNING_CODES = ('no-image', 'no-notes', 'image-fallback', 'image-dropped', 'image-too-large')
+
+# Callback types for parse_presentation()
+LogCallback = Callable[[str], None]
+WarningCallback = Callable[[ParseWarning], None]
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass
+class ConversionOptions:
+    """
+    Image conversion settings, shared by parse_pptx(), batch_convert.py and
+    audit_library.py. Not part of the JSON output.
+    """
+    max_width: int = 3840  # Visible (cropped) image is fitted within max_width x max_height
+    max_height: int = 2160
+    quality: int = 85  # JPEG quality 1-100
+    progressive: bool | None = None  # None: decide from image size (see encode_jpeg)
+    subsampling: str = 'auto'  # One of JPEG_SUBSAMPLING_MODES
+    qtables: str | None = None  # One of JPEG_QTABLE_PRESETS, or None
+    resample: str = 'auto'  # One of RESAMPLE_STRATEGIES
+    max_source_pixels: int = MAX_SOURCE_PIXELS  # Larger images are rejected before decoding
+    large_image_pixels: int = LARGE_IMAGE_PIXELS  # Larger images take the bounded-memory path
+    placeholder_size: int = PLACEHOLDER_SIZE  # Placeholder thumbnail size; 0 for none
+    codec: str = 'jpeg'  # One of CODEC_MODES
+    draft: bool = False  # Decode JPEGs at reduced scale when the output is smaller (see draft_jpeg)
+    # One of ERROR_POLICIES. It only decides what replaces a slide that failed to convert,
+    # so changing it does not invalidate converted slides: left out of repr() and slide_source_hash()
+    on_error: str = field(default='original', repr=False)
+    min_psnr: float = MIN_PSNR  # Quality floor for lossy alternatives in 'auto' codec mode
+    # Processes resampling large images in parallel strips; 0 resamples in this process.
+    # Output is the same either way, so it is left out of repr() and slide_source_hash()
+    resize_workers: int = field(default=0, repr=False)
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> 'ConversionOptions':
+        """Build options from the flags added by add_conversion_arguments()."""
+        return cls(
+            max_width=args.max_width,
+            max_height=args.max_height,
+            quality=args.quality,
+            progressive=parse_progressive_arg(args.progressive),
+            subsampling=args.subsampling,
+            qtables=args.qtables,
+            resample=args.resample,
+            max_source_pixels=int(args.max_source_mp * 1_000_000),
+            large_image_pixels=int(args.large_image_mp * 1_000_000),
+            placeholder_size=args.placeholder_size,
+            codec=args.codec,
+            min_psnr=args.min_psnr,
+            on_error=args.on_error,
+        )
+
+
+def preview_options(options: ConversionOptions) -> ConversionOptions:
+    """
+    Options for --preview: small baseline JPEGs for checking answers and
+    censor boxes, made in a fraction of the full conversion time.
+
+    JPEGs are decoded at 1/2, 1/4 or 1/8 scale where that still covers the
+    output size, and no placeholder is made. Censor boxes are percentages of
+    the visible image, so they are the same as in full output.
+    """
+    return replace(
+        options,
+        max_width=min(options.max_width, PREVIEW_MAX_WIDTH),
+        max_height=min(options.max_height, PREVIEW_MAX_HEIGHT),
+        quality=PREVIEW_QUALITY,
+        progressive=False,
+        subsampling='4:2:0',
+        qtables=None,
+        resample='reducing-gap',
+        placeholder_size=0,
+        codec='jpeg',
+        draft=True,
+    )
+
+
+@dataclass(slots=True)
+class SlideImage:
+    """A converted slide image, with what the app needs before it is decoded."""
+    url: str  # Data URL
+    width: int | None = None  # Pixel size; None if the image could not be read
+    height: int | None = None
+    placeholder: str | None = None  # Tiny JPEG data URL (see make_placeholder)
+
+
+class ImageTooLargeError(ValueError):
+    """Raised when a source image is above ConversionOptions.max_source_pixels."""
+
+
+@dataclass
+class EncodeStats:
+    """
+    Running totals for image encoding, reported in the per-deck summary.
+    Not part of the JSON output.
+    """
+    images: int = 0
+    encoded_bytes: int = 0
+    encode_seconds: float = 0.0
+    progressive: int = 0
+    subsampling: dict[str, int] = field(default_factory=dict)
+    codecs: dict[str, int] = field(default_factory=dict)
+
+    def record(self, size: int, seconds: float, progressive: bool, subsampling: str | None,
+               codec: str = 'jpeg') -> None:
+        self.images += 1
+        self.encoded_bytes += size
+        self.encode_seconds += seconds
+        if progressive:
+            self.progressive += 1
+        if subsampling is not None:
+            self.subsampling[subsampling] = self.subsampling.get(subsampling, 0) + 1
+        self.codecs[codec] = self.codecs.get(codec, 0) + 1
+
+    def merge(self, other: 'EncodeStats') -> None:
+        """Add totals recorded elsewhere (e.g. in a worker process)."""
+        self.images += other.images
+        self.encoded_bytes += other.encoded_bytes
+        self.encode_seconds += other.encode_seconds
+        self.progressive += other.progressive
+        for mode, count in other.subsampling.items():
+            self.subsampling[mode] = self.subsampling.get(mode, 0) + count
+        for codec, count in other.codecs.items():
+            self.codecs[codec] = self.codecs.get(codec, 0) + count
+
+    def summary(self) -> str:
+        if not self.images:
+            return "Encoded 0 images"
+        modes = ", ".join(f"{mode}: {count}" for mode, count in sorted(self.subsampling.items()))
+        summary = (
+            f"Encoded {self.images} images: {self.encoded_bytes / (1024 * 1024):.2f}MB in "
+            f"{self.encode_seconds:.2f}s ({self.progressive} progressive; subsampling {modes or 'n/a'}"
+        )
+        if set(self.codecs) != {'jpeg'}:
+            summary += "; formats " + ", ".join(
+                f"{codec}: {count}" for codec, count in sorted(self.codecs.items())
+            )
+        return summary + ")"
+
+
+def update_json_string(digest, value: str) -> None:
+    """
+    Feed a string to a hash as canonical JSON, a chunk of HASH_CHUNK_CHARS at
+    a time. JSON escapes each character on its own, so the chunks add up to
+    the whole string's encoding without a full-size copy of it.
+    """
+    digest.update(b'"')
+    for start in range(0, len(value), HASH_CHUNK_CHARS):
+        chunk = json.dumps(value[start:start + HASH_CHUNK_CHARS], ensure_ascii=False)
+        digest.update(chunk[1:-1].encode('utf-8'))
+    digest.update(b'"')
+
+
+def slide_content_hash(slide: Slide) -> str:
+    """
+    Hash the serialized content of a slide: every field written to the
+    output except contentHash itself and sourceHash.
+
+    The hash is computed over canonical JSON (sorted keys, compact separators,
+    optional fields left out while None, as in the output), so it only
+    changes when what the app stores changes: the image, answer, censor
+    boxes, image size or placeholder. The app uses it to skip re-storing
+    slides and categories that were re-imported unchanged.
+
+    The JSON is fed to the hash field by field; the data URLs are never
+    copied whole (see update_json_string).
+    """
+    digest = hashlib.sha256(b"{")
+    names = sorted(
+        fld.name for fld in fields(slide)
+        if fld.name not in ('contentHash', 'sourceHash') and getattr(slide, fld.name) is not None
+    )
+    for i, name in enumerate(names):
+        value = getattr(slide, name)
+        digest.update(f'{"," if i else ""}"{name}":'.encode('ascii'))
+        if isinstance(value, str):
+            update_json_string(digest, value)
+        else:
+            if name == 'censorBoxes':
+                value = [asdict(box) for box in value]
+            digest.update(json.dumps(value, sort_keys=True, separators=(',', ':'),
+                                     ensure_ascii=False).encode('utf-8'))
+    digest.update(b"}")
+    return digest.hexdigest()
+
+
+def slide_source_hash(slide, presentation, options: ConversionOptions | None = None) -> str:
+    """
+    Hash everything a slide's output is generated from: the slide XML, its
+    picture, its speaker notes, the slide size and the conversion options.
+
+    Used by --update to find the slides that changed since the last run.
+    """
+    digest = hashlib.sha256(repr(options or ConversionOptions()).encode('utf-8'))
+    digest.update(f"{presentation.slide_width}x{presentation.slide_height}".encode('ascii'))
+    digest.update(slide.part.blob)
+    image_shape = find_image_shape(slide)
+    if image_shape is not None:
+        digest.update(image_shape.image.sha1.encode('ascii'))
+    if slide.has_notes_slide:
+        digest.update(slide.notes_slide.part.blob)
+    return digest.hexdigest()
+
+
+def category_content_hash(category: Category) -> str:
+    """Hash a category from its name and the ordered per-slide content hashes."""
+    digest = hashlib.sha256(category.name.encode('utf-8'))
+    for slide in category.slides:
+        digest.update(b"\n")
+        digest.update((slide.contentHash or "").encode('ascii'))
+    return digest.hexdigest()
+
+
 def emu_to_percentage(emu_value: int, slide_dimension_emu: int) -> float:
     """Convert EMU (English Metric Units) to percentage of slide dimension."""
     return (emu_value / slide_dimension_emu) * 100
 
 
-def extract_image_as_base64(slide, slide_index: int, max_width: int = 3840, max_height: int = 2160, quality: int = 85) -> str | None:
+def is_graphic_image(img: Image.Image, max_colors: int = GRAPHIC_MAX_COLORS) -> bool:
     """
-    Extract the main image from a slide and convert to base64.
-    Applies any cropping that was set in the PPTX.
-    Resizes images to 4K resolution for optimal quality on large displays.
+    Heuristic for logos, flags and text graphics: few distinct colours.
+    Photos blow past the limit almost immediately, so this is cheap.
+    """
+    return img.getcolors(maxcolors=max_colors) is not None
+
+
+def encode_jpeg(img: Image.Image, quality: int = 85, progressive: bool | None = None,
+                subsampling: str = 'auto', qtables: str | None = None,
+                stats: EncodeStats | None = None) -> bytes:
+    """
+    Encode an RGB image as JPEG.
 
     Args:
-        slide: The slide object
-        slide_index: Index of the slide (for logging)
-        max_width: Maximum width in pixels (default: 3840, 4K resolution)
-        max_height: Maximum height in pixels (default: 2160, 4K resolution)
-        quality: JPEG quality 1-100 (default: 85)
+        img: Image to encode (must already be RGB)
+        quality: JPEG quality 1-100
+        progressive: True/False to force, None to decide from image size
+        subsampling: One of JPEG_SUBSAMPLING_MODES. 'auto' keeps full chroma (4:4:4)
+            for graphics, where 4:2:0 smears coloured edges, and uses 4:2:0 for photos
+        qtables: Name of a Pillow quantisation table preset, or None for the
+            standard tables scaled by quality
+        stats: Optional EncodeStats to record size and encode time into
     """
-    for shape in slide.shapes:
-        if shape.shape_type == 13:  # MSO_SHAPE_TYPE.PICTURE
-            image = shape.image
-            image_bytes = image.blob
+    if progressive is None:
+        progressive = img.width * img.height >= PROGRESSIVE_MIN_PIXELS
+    if subsampling == 'auto':
+        subsampling = '4:4:4' if is_graphic_image(img) else '4:2:0'
+
+    save_kwargs = {
+        'format': 'JPEG',
+        'quality': quality,
+        'optimize': True,
+        'progressive': progressive,
+        'subsampling': subsampling,
+    }
+    if qtables:
+        save_kwargs['qtables'] = qtables
+
+    start = time.perf_counter()
+    buffer = BytesIO()
+    img.save(buffer, **save_kwargs)
+    data = buffer.getvalue()
+
+    if stats is not None:
+        stats.record(len(data), time.perf_counter() - start, progressive, subsampling)
+    return data
 
-            # Get crop information
-            crop_left, crop_top, crop_right, crop_bottom = get_image_crop_info(shape)
 
-            # Convert to PNG with white background if needed
-            try:
-                img = Image.open(BytesIO(image_bytes))
-                original_size = img.size
+@dataclass
+class ImageAnalysis:
+    """Content measures that decide which formats encode_auto() tries."""
+    colors: list[tuple[int, tuple[int, int, int]]] | None  # getcolors() result; None above GRAPHIC_MAX_COLORS
+    edge_density: float  # Fraction of pixels on a sharp edge (0-1)
+    has_alpha: bool  # The source image had transparency (flattened onto white)
+
+    @property
+    def try_palette(self) -> bool:
+        """Worth trying as a palette PNG: few colours, hard edges, or a cut-out."""
+        return self.colors is not None or self.edge_density >= GRAPHIC_EDGE_DENSITY or self.has_alpha
+
+    def describe(self) -> str:
+        colors = f"{len(self.colors)} colours" if self.colors is not None else f">{GRAPHIC_MAX_COLORS} colours"
+        alpha = ", transparent" if self.has_alpha else ""
+        return f"{colors}, {self.edge_density * 100:.0f}% edges{alpha}"
+
+
+@dataclass
+class EncodedCandidate:
+    """One format tried by encode_auto()."""
+    codec: str  # 'jpeg', 'png' or 'webp'
+    data: bytes
+    psnr: float  # Against the image it was encoded from; inf if lossless
+    stats: EncodeStats
+
+
+def has_transparency(img: Image.Image) -> bool:
+    """Whether an image has an alpha channel or a transparent palette entry."""
+    return img.mode in ('RGBA', 'LA', 'PA') or (img.mode == 'P' and 'transparency' in img.info)
+
+
+def analyse_image(img: Image.Image, has_alpha: bool = False) -> ImageAnalysis:
+    """
+    Measure an RGB image's colour count and edge density.
+
+    Edges are counted on a copy reduced to about ANALYSIS_SIZE pixels, where
+    text and line art still give far more hard edges than photos.
+    """
+    small = img.reduce(max(1, math.ceil(max(img.size) / ANALYSIS_SIZE)))
+    histogram = small.convert('L').filter(ImageFilter.FIND_EDGES).histogram()
+    return ImageAnalysis(
+        colors=img.getcolors(maxcolors=GRAPHIC_MAX_COLORS),
+        edge_density=sum(histogram[EDGE_THRESHOLD:]) / (small.width * small.height),
+        has_alpha=has_alpha,
+    )
+
+
+def image_psnr(reference: Image.Image, candidate: Image.Image) -> float:
+    """Peak signal-to-noise ratio in dB over all RGB channels of two same-sized images."""
+    histogram = ImageChops.difference(reference, candidate.convert('RGB')).histogram()
+    squared_error = sum(count * (value % 256) ** 2 for value, count in enumerate(histogram))
+    mse = squared_error / (reference.width * reference.height * 3)
+    return math.inf if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+
+
+def encode_palette_png(img: Image.Image, analysis: ImageAnalysis) -> EncodedCandidate:
+    """
+    Encode an RGB image as an 8-bit palette PNG. With at most
+    GRAPHIC_MAX_COLORS colours the palette is exact and the PNG lossless;
+    otherwise it is reduced to GRAPHIC_MAX_COLORS colours without dithering.
+    """
+    start = time.perf_counter()
+    if analysis.colors is not None:
+        palette = Image.new('P', (1, 1))
+        palette.putpalette([channel for _, color in analysis.colors for channel in color])
+        paletted = img.quantize(palette=palette, dither=Image.Dither.NONE)
+        psnr = math.inf
+    else:
+        paletted = img.quantize(GRAPHIC_MAX_COLORS, dither=Image.Dither.NONE)
+        psnr = image_psnr(img, paletted)
+    buffer = BytesIO()
+    paletted.save(buffer, format='PNG', optimize=True)
+    data = buffer.getvalue()
+    stats = EncodeStats()
+    stats.record(len(data), time.perf_counter() - start, False, None, 'png')
+    return EncodedCandidate('png', data, psnr, stats)
+
+
+def encode_webp(img: Image.Image, quality: int) -> EncodedCandidate:
+    """Encode an RGB image as lossy WebP and measure its PSNR."""
+    start = time.perf_counter()
+    buffer = BytesIO()
+    img.save(buffer, format='WEBP', quality=quality, method=4)
+    data = buffer.getvalue()
+    stats = EncodeStats()
+    stats.record(len(data), time.perf_counter() - start, False, '4:2:0', 'webp')
+    return EncodedCandidate('webp', data, image_psnr(img, Image.open(BytesIO(data))), stats)
+
+
+def encode_jpeg_candidate(img: Image.Image, options: ConversionOptions) -> EncodedCandidate:
+    """Encode with encode_jpeg() as the baseline for encode_auto() and measure its PSNR."""
+    stats = EncodeStats()
+    data = encode_jpeg(img, options.quality, options.progressive, options.subsampling, options.qtables, stats)
+    return EncodedCandidate('jpeg', data, image_psnr(img, Image.open(BytesIO(data))), stats)
+
+
+def encode_auto(img: Image.Image, options: ConversionOptions, has_alpha: bool = False,
+                stats: EncodeStats | None = None,
+                log: LogCallback | None = None) -> EncodedCandidate:
+    """
+    Pick the smallest of JPEG, WebP and palette PNG for an RGB image.
+
+    All candidates are encoded in parallel (Pillow releases the GIL while
+    encoding). JPEG at options.quality is always acceptable, as it is what
+    'jpeg' mode produces. A lossy WebP or reduced-palette PNG is only kept
+    if its PSNR reaches options.min_psnr, or the JPEG's PSNR if that is
+    lower; an exact palette PNG always is. PNG is only tried for images
+    analyse_image() finds graphic.
+
+    The choice and the size of every candidate are logged. stats records
+    the chosen image, plus the time spent encoding all candidates.
+    """
+    analysis = analyse_image(img, has_alpha)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(encode_jpeg_candidate, img, options),
+            pool.submit(encode_webp, img, options.quality),
+        ]
+        if analysis.try_palette:
+            futures.append(pool.submit(encode_palette_png, img, analysis))
+        candidates = [future.result() for future in futures]
+
+    quality_floor = min(options.min_psnr, candidates[0].psnr)
+    eligible = [c for c in candidates if c.psnr >= quality_floor]
+    chosen = min(eligible, key=lambda c: len(c.data))
+    if stats is not None:
+        stats.merge(chosen.stats)
+        stats.encode_seconds += sum(c.stats.encode_seconds for c in candidates if c is not chosen)
+    if log:
+        tried = ", ".join(
+            f"{c.codec} {len(c.data) / 1024:.1f}KB"
+            + (" lossless" if math.isinf(c.psnr) else f" {c.psnr:.1f}dB")
+            + ("" if c in eligible else " (below quality floor)")
+            for c in candidates
+        )
+        log(f"  Format: {chosen.codec} ({analysis.describe()}; {tried})")
+    return chosen
+
+
+def choose_resample_strategy(scale: float) -> str:
+    """
+    Pick a resampling strategy for a downscale by the given linear ratio
+    (source size / target size).
+
+    LANCZOS at full source resolution costs time proportional to the source
+    size, which dominates for large ratios (8K+ photos going to 4K or less).
+    From 4x, first reduce by an integer factor with a box filter, then
+    finish with LANCZOS over at least 2x the target size. Below 4x there is
+    no integer reduction to make, so plain LANCZOS is used.
+    """
+    if scale >= 4:
+        return 'box-lanczos'
+    return 'lanczos'
 
+
+def resize_image(img: Image.Image, size: tuple[int, int], strategy: str = 'auto') -> Image.Image:
+    """
+    Resize an image using one of RESAMPLE_STRATEGIES.
+
+    Args:
+        img: Source image
+        size: Target (width, height)
+        strategy: 'lanczos', 'bicubic', 'box-lanczos' (box reduce then LANCZOS),
+            'reducing-gap' (Pillow's built-in reduce-then-resample), or 'auto'
+    """
+    scale = min(img.width / size[0], img.height / size[1])
+    if strategy == 'auto':
+        strategy = choose_resample_strategy(scale)
+
+    if strategy == 'bicubic':
+        return img.resize(size, Image.Resampling.BICUBIC)
+    if strategy == 'reducing-gap':
+        return img.resize(size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+    if strategy == 'box-lanczos':
+        # Keep at least 2x the target size for the LANCZOS stage
+        factor = int(scale // 2)
+        if factor >= 2:
+            img = img.reduce(factor)
+        return img.resize(size, Image.Resampling.LANCZOS)
+    return img.resize(size, Image.Resampling.LANCZOS)
+
+
+# Limits of the pixel_limit() scopes currently open, and Pillow's limit before the first one
+_pixel_limits: list[int] = []
+_pillow_pixel_limit: int | None = None
+_pixel_limit_lock = threading.Lock()
+
+
+def _apply_pixel_limits() -> None:
+    if not _pixel_limits or _pillow_pixel_limit is None:
+        Image.MAX_IMAGE_PIXELS = _pillow_pixel_limit
+    else:
+        Image.MAX_IMAGE_PIXELS = max(_pillow_pixel_limit, *_pixel_limits)
+
+
+@contextmanager
+def pixel_limit(max_pixels: int) -> Iterator[None]:
+    """
+    Let Pillow handle images up to max_pixels while decoding, cropping and
+    resampling one. Pillow checks its decompression bomb limit in Image.open()
+    and again in Image.crop(), warning from 89MP and failing from 179MP.
+
+    Image.MAX_IMAGE_PIXELS is process-wide, so scopes open in other threads
+    are tracked: the limit is the largest in use (never below Pillow's own),
+    and Pillow's value is restored when the last scope ends. A
+    DecompressionBombError inside the scope is raised as ImageTooLargeError.
+    """
+    global _pillow_pixel_limit
+    with _pixel_limit_lock:
+        if not _pixel_limits:
+            _pillow_pixel_limit = Image.MAX_IMAGE_PIXELS
+        _pixel_limits.append(max_pixels)
+        _apply_pixel_limits()
+    try:
+        yield
+    except Image.DecompressionBombError as e:
+        raise ImageTooLargeError(str(e)) from e
+    finally:
+        with _pixel_limit_lock:
+            _pixel_limits.remove(max_pixels)
+            _apply_pixel_limits()
+
+
+def open_image(image_bytes: bytes, max_pixels: int = MAX_SOURCE_PIXELS) -> Image.Image:
+    """
+    Open an image without decoding it, enforcing max_pixels in place of
+    Pillow's decompression bomb limit. Decode and crop it within
+    pixel_limit(max_pixels) too, as prepare_image() does.
+
+    Raises:
+        ImageTooLargeError: If the image has more than max_pixels pixels
+    """
+    with pixel_limit(max_pixels):
+        img = Image.open(BytesIO(image_bytes))
+    pixels = img.width * img.height
+    if pixels > max_pixels:
+        raise ImageTooLargeError(
+            f"{img.width}x{img.height} image is {pixels / 1e6:.0f}MP, "
+            f"above the {max_pixels / 1e6:.0f}MP limit"
+        )
+    return img
+
+
+def strip_mode(img: Image.Image) -> str:
+    """Mode the strips of resize_in_strips() are resampled in."""
+    return 'RGBA' if has_transparency(img) else ('L' if img.mode == 'L' else 'RGB')
+
+
+def plan_strips(box: tuple[int, int, int, int], size: tuple[int, int], source_height: int
+                ) -> Iterator[tuple[int, int, tuple[int, int, int, int], tuple[float, float, float, float]]]:
+    """
+    Split resampling the box region of an image to size into STRIP_ROWS-row
+    output strips. Yields (output row, rows, source crop, resize box within
+    that crop); each crop has enough margin for the LANCZOS kernel.
+    """
+    left, top, right, bottom = box
+    scale_y = (bottom - top) / size[1]
+    margin = math.ceil(3 * max(scale_y, 1))  # LANCZOS support is 3 output pixels
+
+    for y in range(0, size[1], STRIP_ROWS):
+        rows = min(STRIP_ROWS, size[1] - y)
+        strip_top = top + y * scale_y
+        strip_bottom = top + (y + rows) * scale_y
+        source_top = max(0, math.floor(strip_top) - margin)
+        source_bottom = min(source_height, math.ceil(strip_bottom) + margin)
+        yield (y, rows, (left, source_top, right, source_bottom),
+               (0, strip_top - source_top, right - left, strip_bottom - source_top))
+
+
+def strip_strategy(strategy: str, box: tuple[int, int, int, int], size: tuple[int, int]) -> str:
+    """The resampling strategy for every strip of a region; 'auto' is chosen once from its scale."""
+    if strategy != 'auto':
+        return strategy
+    return choose_resample_strategy(min((box[2] - box[0]) / size[0], (box[3] - box[1]) / size[1]))
+
+
+def resample_strip(strip: Image.Image, size: tuple[int, int],
+                   box: tuple[float, float, float, float], strategy: str = 'lanczos') -> Image.Image:
+    """
+    Resample the box region of a strip cut by plan_strips() to size, with
+    one of RESAMPLE_STRATEGIES other than 'auto' (see strip_strategy).
+    The same call for serial and parallel strips, so both give the same output.
+
+    Strips are resampled through a box into their crop, which reduce()
+    cannot take, so 'box-lanczos' and 'reducing-gap' are the same here.
+    """
+    if strategy == 'bicubic':
+        return strip.resize(size, Image.Resampling.BICUBIC, box=box)
+    if strategy in ('box-lanczos', 'reducing-gap'):
+        # At REDUCING_GAP = 2.0 Pillow box-reduces by the integer factor that keeps at
+        # least 2x the target size, then applies LANCZOS: box-lanczos, done within the box
+        return strip.resize(size, Image.Resampling.LANCZOS, box=box, reducing_gap=REDUCING_GAP)
+    return strip.resize(size, Image.Resampling.LANCZOS, box=box)
+
+
+def resize_in_strips(img: Image.Image, box: tuple[int, int, int, int],
+                     size: tuple[int, int], strategy: str = 'auto') -> Image.Image:
+    """
+    Resample the box region of img to size, STRIP_ROWS output rows at a time,
+    with one of RESAMPLE_STRATEGIES.
+
+    Each strip is cut from the source with enough margin for the LANCZOS
+    kernel, converted and resampled on its own, so no cropped copy of the
+    source and no full-height intermediate buffer is ever allocated.
+    """
+    mode = strip_mode(img)
+    strategy = strip_strategy(strategy, box, size)
+    output = Image.new(mode, size)
+    for y, rows, source_box, strip_box in plan_strips(box, size, img.height):
+        strip = img.crop(source_box).convert(mode)
+        output.paste(resample_strip(strip, (size[0], rows), strip_box, strategy), (0, y))
+    return output
+
+
+@dataclass(frozen=True)
+class SharedImageRef:
+    """What a worker process needs to attach to a SharedImage."""
+    name: str  # SharedMemory block name
+    mode: str  # 'L', 'RGBA' or 'RGBX': modes Image.frombuffer() maps without copying
+    size: tuple[int, int]
+
+
+class SharedImage:
+    """
+    A decoded image copied into a multiprocessing.shared_memory block, so
+    worker processes read its pixels in place (Image.frombuffer over the
+    block, see attach_shared_image) instead of having them pickled.
+
+    The process that creates a SharedImage owns the block: close() unmaps
+    and unlinks it, normally by using the SharedImage as a context manager.
+    Workers only attach by name and detach; they never unlink.
+    """
+
+    def __init__(self, img: Image.Image):
+        mode = strip_mode(img)
+        self.mode = 'RGBX' if mode == 'RGB' else mode
+        self.size = img.size
+        row_bytes = img.width * len(self.mode)
+        self._shm = SharedMemory(create=True, size=max(row_bytes * img.height, 1))
+        try:
+            # Copied a strip at a time, so the only other full-size buffer is img itself
+            for y in range(0, img.height, STRIP_ROWS):
+                band = img.crop((0, y, img.width, min(y + STRIP_ROWS, img.height)))
+                data = band.convert(mode).tobytes('raw', self.mode)
+                self._shm.buf[y * row_bytes:y * row_bytes + len(data)] = data
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def ref(self) -> SharedImageRef:
+        return SharedImageRef(self._shm.name, self.mode, self.size)
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> 'SharedImage':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def attach_shared_image(ref: SharedImageRef, box: tuple[int, int, int, int]) -> Image.Image:
+    """
+    Copy the box region out of a SharedImage, from another process.
+    The block is attached only while the region is copied; the view over it
+    is released before detaching, as SharedMemory.close() requires.
+    """
+    shm = SharedMemory(name=ref.name)
+    try:
+        shared = Image.frombuffer(ref.mode, ref.size, shm.buf, 'raw', ref.mode, 0, 1)
+        # The owner already admitted the whole image (see pixel_limit)
+        with pixel_limit(ref.size[0] * ref.size[1]):
+            region = shared.crop(box)
+        del shared
+    finally:
+        shm.close()
+    return region
+
+
+def resample_shared_strip(ref: SharedImageRef, source_box: tuple[int, int, int, int],
+                          mode: str, size: tuple[int, int],
+                          box: tuple[float, float, float, float], strategy: str) -> Image.Image:
+    """Strip pool entry point: resample one strip of a SharedImage (see resize_in_parallel_strips)."""
+    return resample_strip(attach_shared_image(ref, source_box).convert(mode), size, box, strategy)
+
+
+# Process pool for resize_in_parallel_strips() and its size, see strip_pool()
+_strip_pool: tuple[ProcessPoolExecutor, int] | None = None
+
+
+def strip_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    The process pool that resamples strips, started on first use and kept
+    for later images until close_strip_pool() (which parse_presentation()
+    calls when its slides are done). Its workers start after the first
+    SharedImage exists, so they share this process's resource tracker and
+    attaching to a block does not make them its owner.
+    """
+    global _strip_pool
+    if _strip_pool is None or _strip_pool[1] != workers:
+        close_strip_pool()
+        _strip_pool = (ProcessPoolExecutor(max_workers=workers), workers)
+    return _strip_pool[0]
+
+
+def close_strip_pool() -> None:
+    """Shut down the strip pool, if one was started."""
+    global _strip_pool
+    if _strip_pool is not None:
+        _strip_pool[0].shutdown()
+        _strip_pool = None
+
+
+def resize_in_parallel_strips(img: Image.Image, box: tuple[int, int, int, int],
+                              size: tuple[int, int], workers: int,
+                              strategy: str = 'auto') -> Image.Image:
+    """
+    resize_in_strips() with the strips resampled by a pool of worker processes.
+
+    The decoded source is copied once into shared memory (SharedImage), and
+    each worker reads its strip from there, so only strip geometry is sent
+    to workers and only resampled strips come back. The block is unlinked
+    as soon as every strip is done. Output is the same as resize_in_strips().
+    """
+    mode = strip_mode(img)
+    strategy = strip_strategy(strategy, box, size)
+    output = Image.new(mode, size)
+    with SharedImage(img) as shared:
+        pool = strip_pool(workers)
+        futures = [
+            (y, pool.submit(resample_shared_strip, shared.ref, source_box, mode,
+                            (size[0], rows), strip_box, strategy))
+            for y, rows, source_box, strip_box in plan_strips(box, size, img.height)
+        ]
+        try:
+            for y, future in futures:
+                output.paste(future.result(), (0, y))
+        finally:
+            for _, future in futures:
+                future.cancel()
+    return output
+
+
+def downscale_large_image(img: Image.Image, crop: tuple[float, float, float, float],
+                          options: ConversionOptions,
+                          log: LogCallback | None = None) -> Image.Image:
+    """
+    Crop and fit an image above options.large_image_pixels with bounded memory.
+
+    JPEGs are decoded at reduced scale when possible (see draft_jpeg), so
+    the full-resolution image is never held in memory. The result is then
+    resampled in strips (resize_in_strips), in parallel worker processes
+    with options.resize_workers (resize_in_parallel_strips).
+    """
+    crop_box = calculate_crop_box(img.width, img.height, crop)
+    crop_width = crop_box[2] - crop_box[0]
+    crop_height = crop_box[3] - crop_box[1]
+    size = calculate_fit_size(crop_width, crop_height, options.max_width, options.max_height)
+    crop_box = draft_jpeg(img, crop, size, log)
+
+    if options.resize_workers:
+        if log:
+            log(f"  Resampling large image in strips on {options.resize_workers} processes: "
+                f"{crop_width}x{crop_height} -> {size}")
+        return resize_in_parallel_strips(img, crop_box, size, options.resize_workers, options.resample)
+    if log:
+        log(f"  Resampling large image in strips: {crop_width}x{crop_height} -> {size}")
+    return resize_in_strips(img, crop_box, size, options.resample)
+
+
+def draft_jpeg(img: Image.Image, crop: tuple[float, float, float, float],
+               size: tuple[int, int], log: LogCallback | None = None) -> tuple[int, int, int, int]:
+    """
+    Set an unloaded JPEG to decode at 1/2, 1/4 or 1/8 scale (libjpeg DCT
+    scaling) when its cropped region still covers size at that scale.
+    Other formats are left as they are.
+
+    Returns the pixel crop box in the image as it will be decoded.
+    """
+    crop_box = calculate_crop_box(img.width, img.height, crop)
+    if img.format == 'JPEG':
+        original_size = img.size
+        img.draft(None, (
+            math.ceil(size[0] * img.width / (crop_box[2] - crop_box[0])),
+            math.ceil(size[1] * img.height / (crop_box[3] - crop_box[1])),
+        ))
+        if img.size != original_size:
+            crop_box = calculate_crop_box(img.width, img.height, crop)
+            if log:
+                log(f"  Decoding JPEG at reduced scale: {original_size} -> {img.size}")
+    return crop_box
+
+
+def calculate_crop_box(width: int, height: int,
+                       crop: tuple[float, float, float, float]) -> tuple[int, int, int, int]:
+    """
+    Calculate the pixel crop box (left, top, right, bottom) for an image
+    from PPTX crop fractions (left, top, right, bottom).
+    """
+    crop_left, crop_top, crop_right, crop_bottom = crop
+    left_px = int(width * crop_left)
+    top_px = int(height * crop_top)
+    right_px = int(width * (1 - crop_right))
+    bottom_px = int(height * (1 - crop_bottom))
+    return (left_px, top_px, right_px, bottom_px)
+
+
+def calculate_fit_size(width: int, height: int, max_width: int, max_height: int) -> tuple[int, int]:
+    """Calculate the size an image is resized to so it fits within max_width x max_height."""
+    if width > max_width or height > max_height:
+        # Calculate new size maintaining aspect ratio
+        ratio = min(max_width / width, max_height / height)
+        return (int(width * ratio), int(height * ratio))
+    return (width, height)
+
+
+def calculate_output_size(width: int, height: int, crop: tuple[float, float, float, float],
+                          max_width: int = 3840, max_height: int = 2160) -> tuple[int, int]:
+    """
+    Calculate the final pixel size convert_image() produces for a source image,
+    without decoding it. Used for capacity planning.
+    """
+    if any(crop):
+        left_px, top_px, right_px, bottom_px = calculate_crop_box(width, height, crop)
+        width, height = right_px - left_px, bottom_px - top_px
+    return calculate_fit_size(width, height, max_width, max_height)
+
+
+def prepare_image(image_bytes: bytes, crop: tuple[float, float, float, float],
+                  options: ConversionOptions | None = None,
+                  log: LogCallback | None = None) -> Image.Image:
+    """
+    Decode, crop and resize a source image, flattened onto white as RGB.
+
+    Args:
+        image_bytes: Source image bytes
+        crop: Crop fractions (left, top, right, bottom) from get_image_crop_info()
+        options: Size and resampling settings (default: ConversionOptions())
+        log: Optional callback for crop/resize details
+
+    Raises:
+        ImageTooLargeError: If the image is above options.max_source_pixels
+        Any Pillow error if the image cannot be decoded
+    """
+    options = options or ConversionOptions()
+    crop_left, crop_top, crop_right, crop_bottom = crop
+
+    # Pillow checks its own pixel limit again when the image is cropped
+    with pixel_limit(options.max_source_pixels):
+        img = open_image(image_bytes, options.max_source_pixels)
+        original_size = img.size
+
+        if img.width * img.height > options.large_image_pixels:
+            # Crop and resize together with bounded memory
+            img = downscale_large_image(img, crop, options, log)
+        else:
+            crop_box = calculate_crop_box(img.width, img.height, crop)
+            if options.draft:
+                size = calculate_fit_size(crop_box[2] - crop_box[0], crop_box[3] - crop_box[1],
+                                          options.max_width, options.max_height)
+                crop_box = draft_jpeg(img, crop, size, log)
+            if any(crop):
                 # Apply cropping if specified
-                if any([crop_left, crop_top, crop_right, crop_bottom]):
-                    width, height = img.size
-
-                    # Calculate crop box in pixels
-                    left_px = int(width * crop_left)
-                    top_px = int(height * crop_top)
-                    right_px = int(width * (1 - crop_right))
-                    bottom_px = int(height * (1 - crop_bottom))
-
-                    # Crop the image
-                    img = img.crop((left_px, top_px, right_px, bottom_px))
-                    print(f"  Applied crop to image: {crop_left*100:.1f}%/{crop_top*100:.1f}%/{crop_right*100:.1f}%/{crop_bottom*100:.1f}%, new size: {img.size}", file=sys.stderr)
-
-                # Resize if image is too large
-                if img.width > max_width or img.height > max_height:
-                    # Calculate new size maintaining aspect ratio
-                    ratio = min(max_width / img.width, max_height / img.height)
-                    new_size = (int(img.width * ratio), int(img.height * ratio))
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-                    print(f"  Resized image: {original_size} -> {img.size}", file=sys.stderr)
-
-                # If image has transparency, add white background
-                if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                    img = background
-
-                # Convert to JPEG for better compression (smaller file size)
-                buffer = BytesIO()
-                img.convert('RGB').save(buffer, format='JPEG', quality=quality, optimize=True)
-                img_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-                return f"data:image/jpeg;base64,{img_base64}"
-            except Exception as e:
-                print(f"Warning: Failed to process image on slide {slide_index + 1}: {e}", file=sys.stderr)
-                # Fallback: return original image as base64
-                img_base64 = base64.b64encode(image_bytes).decode('utf-8')
-                ext = image.ext or 'png'
-                return f"data:image/{ext};base64,{img_base64}"
+                img = img.crop(crop_box)
+                if log:
+                    log(f"  Applied crop to image: {crop_left*100:.1f}%/{crop_top*100:.1f}%/{crop_right*100:.1f}%/{crop_bottom*100:.1f}%, new size: {img.size}")
+
+        # Resize if image is too large
+        new_size = calculate_fit_size(img.width, img.height, options.max_width, options.max_height)
+        if new_size != img.size:
+            img = resize_image(img, new_size, options.resample)
+            if log:
+                log(f"  Resized image: {original_size} -> {img.size}")
+
+        # If image has transparency, add white background
+        if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+            img = background
+
+        return img.convert('RGB')
+
+
+def convert_image(image_bytes: bytes, crop: tuple[float, float, float, float],
+                  options: ConversionOptions | None = None,
+                  stats: EncodeStats | None = None, log: LogCallback | None = None) -> bytes:
+    """
+    Crop, resize and encode a source image as JPEG (or, with the 'auto'
+    codec, whichever format encode_auto() picks).
 
-    return None
+    Args:
+        image_bytes: Source image bytes
+        crop: Crop fractions (left, top, right, bottom) from get_image_crop_info()
+        options: Size, resampling and JPEG settings (default: ConversionOptions())
+        stats: Optional EncodeStats to record encoding size and time into
+        log: Optional callback for crop/resize details
+
+    Raises:
+        ImageTooLargeError: If the image is above options.max_source_pixels
+        Any Pillow error if the image cannot be decoded or encoded
+    """
+    options = options or ConversionOptions()
+    img = prepare_image(image_bytes, crop, options, log)
+    return encode_image(img, image_bytes, options, stats, log)[1]
+
+
+def encode_image(img: Image.Image, image_bytes: bytes, options: ConversionOptions,
+                 stats: EncodeStats | None = None,
+                 log: LogCallback | None = None) -> tuple[str, bytes]:
+    """
+    Encode a prepared image in the format options.codec asks for.
+    Returns (codec, encoded bytes); image_bytes is the source, checked for transparency.
+    """
+    if options.codec == 'auto':
+        has_alpha = has_transparency(open_image(image_bytes, options.max_source_pixels))
+        encoded = encode_auto(img, options, has_alpha, stats, log)
+        return encoded.codec, encoded.data
+    # Convert to JPEG for better compression (smaller file size)
+    return 'jpeg', encode_jpeg(img, options.quality, options.progressive, options.subsampling, options.qtables, stats)
+
+
+def make_placeholder(img: Image.Image, size: int = PLACEHOLDER_SIZE) -> str:
+    """
+    Make a tiny JPEG data URL of an image (longest side = size), a few hundred
+    bytes, which the app shows blurred while the full image decodes.
+    """
+    thumb = img.copy()
+    thumb.thumbnail((size, size), Image.Resampling.BOX)
+    jpeg_bytes = encode_jpeg(thumb, PLACEHOLDER_QUALITY, progressive=False, subsampling='4:2:0')
+    return f"data:image/jpeg;base64,{base64.b64encode(jpeg_bytes).decode('ascii')}"
+
+
+def convert_slide_image(image_bytes: bytes, ext: str | None, crop: tuple[float, float, float, float],
+                        slide_index: int, options: ConversionOptions | None = None,
+                        stats: EncodeStats | None = None, log: LogCallback | None = None,
+                        on_warning: WarningCallback | None = None,
+                        fallback: bool = True) -> SlideImage | None:
+    """
+    Convert a slide's source image to a JPEG data URL (or, with the 'auto'
+    codec, whichever format encode_auto() picks), with its pixel size and a
+    placeholder made from the same decoded image.
+
+    If conversion fails, options.on_error decides what is embedded instead
+    (see fallback_slide_image); None means the slide is dropped. Images above
+    the pixel limit are never embedded: ImageTooLargeError is raised instead.
+
+    Args:
+        image_bytes: Source image bytes
+        ext: Source image file extension, used for the fallback data URL
+        crop: Crop fractions from get_image_crop_info()
+        slide_index: Index of the slide (for warnings)
+        options: Conversion settings, see convert_image()
+        stats: Optional EncodeStats to record encoding size and time into
+        log: Optional callback for crop/resize details
+        on_warning: Optional callback for the fallback warning
+        fallback: False to raise conversion errors instead (e.g. so a caller
+            can retry before calling fallback_slide_image itself)
+    """
+    options = options or ConversionOptions()
+    try:
+        img = prepare_image(image_bytes, crop, options, log)
+        codec, image_data = encode_image(img, image_bytes, options, stats, log)
+        img_base64 = base64.b64encode(image_data).decode('utf-8')
+        placeholder = make_placeholder(img, options.placeholder_size) if options.placeholder_size else None
+        return SlideImage(f"data:image/{codec};base64,{img_base64}", img.width, img.height, placeholder)
+    except ImageTooLargeError:
+        raise
+    except Exception as e:
+        if not fallback:
+            raise
+        return fallback_slide_image(image_bytes, ext, slide_index, options, e, on_warning)
+
+
+def fallback_slide_image(image_bytes: bytes, ext: str | None, slide_index: int,
+                         options: ConversionOptions, error: BaseException | str,
+                         on_warning: WarningCallback | None = None) -> SlideImage | None:
+    """
+    Apply options.on_error to a slide image that could not be converted:
+    embed the original image unchanged (without a placeholder), embed a
+    substitute (make_substitute_image), or return None to drop the slide.
+    Reports an 'image-fallback' or 'image-dropped' warning.
+    """
+    slide_number = slide_index + 1
+    if options.on_error == 'drop':
+        if on_warning:
+            on_warning(ParseWarning(
+                slide_number, 'image-dropped', f"Failed to process image on slide {slide_number}, "
+                f"slide skipped: {error}"
+            ))
+        return None
+
+    if on_warning:
+        embedded = "substitute embedded" if options.on_error == 'substitute' else "original embedded"
+        on_warning(ParseWarning(
+            slide_number, 'image-fallback', f"Failed to process image on slide {slide_number} "
+            f"({embedded}): {error}"
+        ))
+    if options.on_error == 'substitute':
+        return make_substitute_image(slide_number, options)
+
+    # Fallback: return original image as base64
+    img_base64 = base64.b64encode(image_bytes).decode('utf-8')
+    try:
+        width, height = open_image(image_bytes, options.max_source_pixels).size
+    except Exception:
+        width = height = None
+    return SlideImage(f"data:image/{ext or 'png'};base64,{img_base64}", width, height)
+
+
+def make_substitute_image(slide_number: int, options: ConversionOptions) -> SlideImage:
+    """A small grey 'image unavailable' JPEG, shown in place of an image that failed to convert."""
+    width, height = calculate_fit_size(*SUBSTITUTE_SIZE, options.max_width, options.max_height)
+    img = Image.new('RGB', (width, height), (64, 64, 64))
+    ImageDraw.Draw(img).text(
+        (width / 2, height / 2), f"Slide {slide_number}: image unavailable", fill=(200, 200, 200),
+        font=ImageFont.load_default(max(height // 20, 10)), anchor='mm'
+    )
+    jpeg_bytes = encode_jpeg(img, options.quality, progressive=False, subsampling='4:2:0')
+    return SlideImage(
+        f"data:image/jpeg;base64,{base64.b64encode(jpeg_bytes).decode('ascii')}", width, height
+    )
+
+
+def extract_slide_image(slide, slide_index: int, options: ConversionOptions | None = None,
+                        stats: EncodeStats | None = None, log: LogCallback | None = None,
+                        on_warning: WarningCallback | None = None) -> SlideImage | None:
+    """
+    Extract the main image from a slide and convert to base64.
+    Applies any cropping that was set in the PPTX.
+    Resizes images to 4K resolution (by default) for optimal quality on large displays.
+    Returns None if the slide has no picture, or its image failed to convert
+    and options.on_error is 'drop'.
+
+    Args:
+        slide: The slide object
+        slide_index: Index of the slide (for warnings)
+        options: Size, resampling and JPEG settings (default: ConversionOptions())
+        stats: Optional EncodeStats to record encoding size and time into
+        log, on_warning: Optional callbacks, see convert_slide_image()
+    """
+    image_shape = find_image_shape(slide)
+    if image_shape is None:
+        return None
+
+    image_bytes, ext = get_image_data(image_shape)
+    return convert_slide_image(
+        image_bytes, ext, get_image_crop_info(image_shape), slide_index, options, stats,
+        log, on_warning
+    )
 
 
 def extract_speaker_notes(slide) -> str:
@@ -183,6 +1217,16 @@ def find_image_shape(slide):
     return None
 
 
+def get_image_data(image_shape) -> tuple[bytes, str]:
+    """
+    Get a picture's bytes and file extension. The extension comes from the
+    part name: python-pptx's Image.ext opens the image with Pillow, which
+    warns about (or rejects) very large images before max_source_pixels applies.
+    """
+    image_part = image_shape.part.related_part(image_shape._element.blip_rId)
+    return image_part.blob, image_part.partname.ext
+
+
 def get_image_crop_info(image_shape):
     """
     Get crop information for an image shape.
@@ -195,7 +1239,99 @@ def get_image_crop_info(image_shape):
     return (crop_left, crop_top, crop_right, crop_bottom)
 
 
-def extract_censor_boxes(slide, presentation) -> list[CensorBox]:
+# Censor box filtering thresholds
+CENSOR_MIN_OVERLAP = 0.5  # Fraction of a rectangle that must lie over the visible image
+CENSOR_MAX_COVERAGE = 85  # Percent of the visible image above which a box is treated as background
+
+
+def get_visible_image_bounds(img_left: float, img_top: float, img_width: float, img_height: float,
+                             crop: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
+    """
+    Calculate the visible (cropped) area of an image frame in slide coordinates.
+    This represents what will actually be in the exported image.
+
+    Returns (visible_left, visible_top, visible_width, visible_height).
+    """
+    crop_left, crop_top, crop_right, crop_bottom = crop
+    visible_left = img_left + (img_width * crop_left)
+    visible_top = img_top + (img_height * crop_top)
+    visible_width = img_width * (1.0 - crop_left - crop_right)
+    visible_height = img_height * (1.0 - crop_top - crop_bottom)
+    return (visible_left, visible_top, visible_width, visible_height)
+
+
+def evaluate_censor_rect(left: float, top: float, width: float, height: float,
+                         visible: tuple[float, float, float, float]
+                         ) -> tuple[tuple[float, float, float, float] | None, str]:
+    """
+    Decide whether a filled rectangle is a censor box for the visible image.
+
+    Works on plain coordinates so diagnose_pptx.py can report the same
+    decisions from slide XML alone.
+
+    Args:
+        left/top/width/height: Rectangle in slide coordinates (EMU)
+        visible: Visible image bounds from get_visible_image_bounds()
+
+    Returns:
+        ((x, y, width, height) as percentages of the visible image, reason) if kept,
+        (None, reason) if rejected
+    """
+    visible_left, visible_top, visible_width, visible_height = visible
+    visible_right = visible_left + visible_width
+    visible_bottom = visible_top + visible_height
+
+    # Check if rectangle overlaps with visible (cropped) image bounds
+    rect_right = left + width
+    rect_bottom = top + height
+
+    # Calculate overlap region
+    overlap_left = max(left, visible_left)
+    overlap_top = max(top, visible_top)
+    overlap_right = min(rect_right, visible_right)
+    overlap_bottom = min(rect_bottom, visible_bottom)
+
+    # Check if there's any overlap
+    has_overlap = (overlap_right > overlap_left and overlap_bottom > overlap_top)
+    if not has_overlap:
+        return None, "rectangle with no overlap with visible image"
+
+    # Calculate overlap ratio
+    overlap_area = (overlap_right - overlap_left) * (overlap_bottom - overlap_top)
+    box_area = width * height
+    overlap_ratio = overlap_area / box_area
+
+    # Require at least 50% overlap to avoid including unrelated shapes
+    if overlap_ratio < CENSOR_MIN_OVERLAP:
+        return None, (f"rectangle with insufficient overlap ({overlap_ratio*100:.1f}% < "
+                      f"{CENSOR_MIN_OVERLAP*100:.0f}%)")
+
+    # For boxes that extend beyond visible bounds, clip to visible area
+    # This ensures the censor box aligns with what's actually in the exported image
+    clipped_width = overlap_right - overlap_left
+    clipped_height = overlap_bottom - overlap_top
+
+    # Calculate position RELATIVE TO VISIBLE (CROPPED) IMAGE using clipped coordinates
+    rel_left = overlap_left - visible_left
+    rel_top = overlap_top - visible_top
+
+    # Convert to percentages of VISIBLE IMAGE dimensions
+    x_percent = (rel_left / visible_width) * 100
+    y_percent = (rel_top / visible_height) * 100
+    width_percent = (clipped_width / visible_width) * 100
+    height_percent = (clipped_height / visible_height) * 100
+
+    # Skip boxes that cover nearly the entire visible image
+    # These are likely background fills for slides with transparent backgrounds
+    image_coverage_percent = width_percent * height_percent / 100  # Convert to percentage
+    if image_coverage_percent > CENSOR_MAX_COVERAGE:
+        return None, (f"near-full-image box (likely background): {image_coverage_percent:.1f}% "
+                      f"of visible image")
+
+    return (x_percent, y_percent, width_percent, height_percent), "censor box"
+
+
+def extract_censor_boxes(slide, presentation, log: LogCallback | None = None) -> list[CensorBox]:
     """
     Extract censorship boxes from a slide.
     Calculates positions RELATIVE TO THE VISIBLE (CROPPED) IMAGE.
@@ -203,24 +1339,24 @@ def extract_censor_boxes(slide, presentation) -> list[CensorBox]:
     Since we crop the exported image, censor box coordinates are calculated
     relative to what the user will actually see.
 
-    Filters out:
-    - Background rectangles (>50% of slide area)
-    - Rectangles outside visible image bounds
+    Filters out (see evaluate_censor_rect):
+    - Rectangles mostly outside visible image bounds
+    - Near-full-image background rectangles
 
     Note: This is a heuristic approach. For production use, consider:
     - Naming convention (e.g., shapes named "censor_*")
     - Specific colors or properties
     - Manual tagging in slide notes
+
+    Each shape's keep/skip decision is reported to the optional log callback.
     """
     censor_boxes: list[CensorBox] = []
-    slide_width = presentation.slide_width
-    slide_height = presentation.slide_height
-    slide_area = slide_width * slide_height
+    log = log or (lambda message: None)
 
     # Find the image on this slide
     image_shape = find_image_shape(slide)
     if not image_shape:
-        print(f"  Warning: No image found on slide, cannot calculate censor box positions", file=sys.stderr)
+        log(f"  Warning: No image found on slide, cannot calculate censor box positions")
         return censor_boxes
 
     # Image bounds (shape frame in PPTX coordinates)
@@ -230,88 +1366,28 @@ def extract_censor_boxes(slide, presentation) -> list[CensorBox]:
     img_height = image_shape.height
 
     # Get crop information
-    crop_left, crop_top, crop_right, crop_bottom = get_image_crop_info(image_shape)
+    crop = get_image_crop_info(image_shape)
+    crop_left, crop_top, crop_right, crop_bottom = crop
 
-    # Calculate the visible (cropped) area within the frame
-    # This represents what will actually be in the exported image
-    visible_left = img_left + (img_width * crop_left)
-    visible_top = img_top + (img_height * crop_top)
-    visible_width = img_width * (1.0 - crop_left - crop_right)
-    visible_height = img_height * (1.0 - crop_top - crop_bottom)
-    visible_right = visible_left + visible_width
-    visible_bottom = visible_top + visible_height
+    visible = get_visible_image_bounds(img_left, img_top, img_width, img_height, crop)
+    visible_left, visible_top, visible_width, visible_height = visible
 
-    if any([crop_left, crop_top, crop_right, crop_bottom]):
-        print(f"  Image cropped: L={crop_left*100:.1f}% T={crop_top*100:.1f}% R={crop_right*100:.1f}% B={crop_bottom*100:.1f}%", file=sys.stderr)
-        print(f"  Visible area: ({visible_left:.0f}, {visible_top:.0f}) size: ({visible_width:.0f} × {visible_height:.0f})", file=sys.stderr)
+    if any(crop):
+        log(f"  Image cropped: L={crop_left*100:.1f}% T={crop_top*100:.1f}% R={crop_right*100:.1f}% B={crop_bottom*100:.1f}%")
+        log(f"  Visible area: ({visible_left:.0f}, {visible_top:.0f}) size: ({visible_width:.0f} × {visible_height:.0f})")
     else:
-        print(f"  Image bounds: ({img_left}, {img_top}) size: ({img_width} × {img_height})", file=sys.stderr)
+        log(f"  Image bounds: ({img_left}, {img_top}) size: ({img_width} × {img_height})")
 
     for shape in slide.shapes:
         # Check if it's an auto shape (rectangle, etc.)
         if shape.shape_type == 1:  # MSO_SHAPE_TYPE.AUTO_SHAPE
             # Check if it has a fill (not an outline-only shape)
             if shape.fill.type == 1:  # SOLID fill
-                # Extract position and size
-                left = shape.left
-                top = shape.top
-                width = shape.width
-                height = shape.height
-
-                # Check if rectangle overlaps with visible (cropped) image bounds
-                # Allow boxes that are at least 50% within bounds to handle edge cases
-                rect_right = left + width
-                rect_bottom = top + height
-
-                # Calculate overlap region
-                overlap_left = max(left, visible_left)
-                overlap_top = max(top, visible_top)
-                overlap_right = min(rect_right, visible_right)
-                overlap_bottom = min(rect_bottom, visible_bottom)
-
-                # Check if there's any overlap
-                has_overlap = (overlap_right > overlap_left and overlap_bottom > overlap_top)
-
-                if not has_overlap:
-                    print(f"  Skipping rectangle with no overlap with visible image", file=sys.stderr)
-                    continue
-
-                # Calculate overlap ratio
-                overlap_area = (overlap_right - overlap_left) * (overlap_bottom - overlap_top)
-                box_area = width * height
-                overlap_ratio = overlap_area / box_area
-
-                # Require at least 50% overlap to avoid including unrelated shapes
-                overlap_threshold = 0.5
-                if overlap_ratio < overlap_threshold:
-                    print(f"  Skipping rectangle with insufficient overlap ({overlap_ratio*100:.1f}% < {overlap_threshold*100:.0f}%)", file=sys.stderr)
-                    continue
-
-                # For boxes that extend beyond visible bounds, clip to visible area
-                # This ensures the censor box aligns with what's actually in the exported image
-                clipped_left = max(left, visible_left)
-                clipped_top = max(top, visible_top)
-                clipped_right = min(rect_right, visible_right)
-                clipped_bottom = min(rect_bottom, visible_bottom)
-                clipped_width = clipped_right - clipped_left
-                clipped_height = clipped_bottom - clipped_top
-
-                # Calculate position RELATIVE TO VISIBLE (CROPPED) IMAGE using clipped coordinates
-                rel_left = clipped_left - visible_left
-                rel_top = clipped_top - visible_top
-
-                # Convert to percentages of VISIBLE IMAGE dimensions
-                x_percent = (rel_left / visible_width) * 100
-                y_percent = (rel_top / visible_height) * 100
-                width_percent = (clipped_width / visible_width) * 100
-                height_percent = (clipped_height / visible_height) * 100
-
-                # Skip boxes that cover nearly the entire visible image
-                # These are likely background fills for slides with transparent backgrounds
-                image_coverage_percent = width_percent * height_percent / 100  # Convert to percentage
-                if image_coverage_percent > 85:  # >85% of visible image area
-                    print(f"  Skipping near-full-image box (likely background): {image_coverage_percent:.1f}% of visible image", file=sys.stderr)
+                box, reason = evaluate_censor_rect(shape.left, shape.top, shape.width, shape.height, visible)
+                if box is None:
+                    log(f"  Skipping {reason}")
                     continue
+                x_percent, y_percent, width_percent, height_percent = box
 
                 # Extract fill color
                 try:
@@ -320,7 +1396,7 @@ def extract_censor_boxes(slide, presentation) -> list[CensorBox]:
                 except Exception:
                     color = "#000000"  # Default to black if color extraction fails
 
-                print(f"  Found censor box: pos=({x_percent:.1f}%, {y_percent:.1f}%), size=({width_percent:.1f}% × {height_percent:.1f}%), color={color}", file=sys.stderr)
+                log(f"  Found censor box: pos=({x_percent:.1f}%, {y_percent:.1f}%), size=({width_percent:.1f}% × {height_percent:.1f}%), color={color}")
 
                 censor_boxes.append(CensorBox(
                     x=round(x_percent, 2),
@@ -333,56 +1409,447 @@ def extract_censor_boxes(slide, presentation) -> list[CensorBox]:
     return censor_boxes
 
 
-def parse_pptx(file_path: Path, category_name: str) -> Category:
+@dataclass
+class ParseResult:
+    """
+    Result of parse_presentation(). slides is a lazy iterator: each slide is
+    converted when it is reached, and warnings fills in as iteration proceeds.
+    """
+    slide_count: int  # Slides in the deck, including any skipped for having no picture
+    slides: Iterator[Slide]
+    warnings: list[ParseWarning] = field(default_factory=list)
+    reused: int = 0  # Slides taken unchanged from previous (see parse_presentation)
+
+
+def parse_presentation(source: str | Path | bytes | BinaryIO,
+                       options: ConversionOptions | None = None,
+                       stats: EncodeStats | None = None,
+                       on_progress: ProgressCallback | None = None,
+                       on_warning: WarningCallback | None = None,
+                       log: LogCallback | None = None,
+                       previous: list[Slide] | None = None,
+                       slide_numbers: set[int] | None = None,
+                       every: int = 1) -> ParseResult:
     """
-    Parse a PPTX file and extract all relevant data.
+    Parse a PPTX deck from a path, bytes or a binary file-like object.
 
-    Returns a Category object with all slides.
+    Nothing is printed; progress, warnings and conversion details go to the
+    optional callbacks, and warnings are also collected on the result.
+
+    Given the slides of an earlier run (previous), only changed slides are
+    parsed again; the rest are reused as they are. Without slide_numbers, a
+    slide is reused when an earlier slide has the same sourceHash. With
+    slide_numbers, exactly those slides are parsed and the others are reused
+    by position, which requires the same slides to have pictures as before.
+
+    Without previous, slide_numbers and every select the slides to parse
+    (e.g. for --preview); the other slides are left out of the output.
+
+    The strip pool started for options.resize_workers is shut down when
+    the slides iterator is exhausted, closed or garbage collected.
+
+    Args:
+        source: PPTX file path, file contents, or an open binary file
+        options: Image conversion settings (default: ConversionOptions())
+        stats: Optional EncodeStats to record encoding size and time into
+        on_progress: Called with (slide number, slide count) before each slide
+        on_warning: Called with each ParseWarning as it is found
+        log: Called with crop, resize and censor box details
+        previous: Slides from an earlier run of the same deck, to reuse
+        slide_numbers: 1-based slide numbers to parse again, or without
+            previous, the only slides to parse. Numbers above
+            result.slide_count match no slide.
+        every: Without previous, parse only every Nth slide (1, 1 + N, ...)
+
+    Raises:
+        ValueError: If the deck cannot be opened, or slide_numbers is given
+            and the deck no longer lines up with previous
     """
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+    elif isinstance(source, Path):
+        source = str(source)
     try:
-        prs = Presentation(str(file_path))
+        prs = Presentation(source)
     except Exception as e:
         raise ValueError(f"Failed to open PPTX file: {e}")
 
-    slides: list[Slide] = []
-
-    for idx, pptx_slide in enumerate(prs.slides):
-        print(f"Processing slide {idx + 1}/{len(prs.slides)}...", file=sys.stderr)
+    result = ParseResult(slide_count=len(prs.slides), slides=iter(()))
+
+    if previous is not None and slide_numbers is not None:
+        picture_slides = sum(1 for pptx_slide in prs.slides if find_image_shape(pptx_slide) is not None)
+        if picture_slides != len(previous):
+            raise ValueError(
+                f"Deck has {picture_slides} slides with images but the existing output has "
+                f"{len(previous)}; slides cannot be matched by position"
+            )
+    previous_by_hash = {slide.sourceHash: slide for slide in previous or [] if slide.sourceHash}
+
+    def warn(warning: ParseWarning) -> None:
+        result.warnings.append(warning)
+        if on_warning:
+            on_warning(warning)
+
+    def selected(number: int) -> bool:
+        """Whether a slide is parsed when there are no previous slides to reuse."""
+        return (number - 1) % every == 0 and (slide_numbers is None or number in slide_numbers)
+
+    def convert_slides() -> Iterator[Slide]:
+        position = 0  # Index among slides with a picture, i.e. in the output
+        for idx, pptx_slide in enumerate(prs.slides):
+            if previous is None and not selected(idx + 1):
+                continue
+            if on_progress:
+                on_progress(idx + 1, result.slide_count)
+
+            source_hash = slide_source_hash(pptx_slide, prs, options)
+            if previous is not None and find_image_shape(pptx_slide) is not None:
+                if slide_numbers is not None:
+                    reusable = None if idx + 1 in slide_numbers else previous[position]
+                else:
+                    reusable = previous_by_hash.get(source_hash)
+                position += 1
+                if reusable is not None:
+                    # Kept as it was: a slide reused by position keeps its old sourceHash,
+                    # so a later --update still converts it if it has changed since
+                    result.reused += 1
+                    yield reusable
+                    continue
 
-        # Extract image
-        image_url = extract_image_as_base64(pptx_slide, idx)
-        if not image_url:
-            print(f"Warning: No image found on slide {idx + 1}, skipping", file=sys.stderr)
-            continue
+            if find_image_shape(pptx_slide) is None:
+                warn(ParseWarning(idx + 1, 'no-image', f"No image found on slide {idx + 1}, skipping"))
+                continue
 
-        # Extract speaker notes (answer)
-        answer = extract_speaker_notes(pptx_slide)
-        if not answer:
-            print(f"Warning: No speaker notes on slide {idx + 1}", file=sys.stderr)
+            # Extract image
+            try:
+                image = extract_slide_image(pptx_slide, idx, options, stats, log, warn)
+            except ImageTooLargeError as e:
+                warn(ParseWarning(idx + 1, 'image-too-large', f"Image on slide {idx + 1} skipped: {e}"))
+                continue
+            if image is None:
+                continue  # Failed to convert and dropped (options.on_error); already warned
+
+            # Extract speaker notes (answer)
+            answer = extract_speaker_notes(pptx_slide)
+            if not answer:
+                warn(ParseWarning(idx + 1, 'no-notes', f"No speaker notes on slide {idx + 1}"))
+
+            # Extract censor boxes
+            censor_boxes = extract_censor_boxes(pptx_slide, prs, log)
+
+            slide = Slide(
+                imageUrl=image.url,
+                answer=answer,
+                censorBoxes=censor_boxes,
+                sourceHash=source_hash,
+                imageWidth=image.width,
+                imageHeight=image.height,
+                placeholderUrl=image.placeholder
+            )
+            slide.contentHash = slide_content_hash(slide)
+            yield slide
+
+    def generate() -> Iterator[Slide]:
+        # Strip pool workers (options.resize_workers) live as long as the iteration
+        try:
+            yield from convert_slides()
+        finally:
+            close_strip_pool()
+
+    result.slides = generate()
+    return result
+
+
+def log_stderr(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+def parse_pptx(file_path: Path, category_name: str, options: ConversionOptions | None = None,
+               stats: EncodeStats | None = None, previous: list[Slide] | None = None,
+               slide_numbers: set[int] | None = None, every: int = 1) -> Category:
+    """
+    Parse a PPTX file and extract all relevant data, printing progress and
+    warnings to stderr. See parse_presentation() for the quiet, streaming API
+    and for how previous, slide_numbers and every select slides.
 
-        # Extract censor boxes
-        censor_boxes = extract_censor_boxes(pptx_slide, prs)
+    Returns a Category object with all slides.
+    """
+    result = parse_presentation(
+        file_path, options, stats,
+        on_progress=lambda number, count: log_stderr(f"Processing slide {number}/{count}..."),
+        on_warning=lambda warning: log_stderr(f"Warning: {warning.message}"),
+        log=log_stderr,
+        previous=previous,
+        slide_numbers=slide_numbers,
+        every=every,
+    )
+    missing = sorted(number for number in slide_numbers or () if number > result.slide_count)
+    if missing:
+        log_stderr(f"Warning: Deck has {result.slide_count} slides; ignoring slide numbers "
+                   f"past the end: {', '.join(map(str, missing))}")
+    slides = list(result.slides)
+    if previous is not None:
+        log_stderr(f"Reused {result.reused} unchanged slides, converted {len(slides) - result.reused}")
+    return Category(name=category_name, slides=slides)
 
-        slides.append(Slide(
-            imageUrl=image_url,
-            answer=answer,
-            censorBoxes=censor_boxes
-        ))
 
-    return Category(name=category_name, slides=slides)
+# Bytes that can appear unescaped inside a JSON string: printable ASCII except " and \\
+JSON_PLAIN_BYTES = bytes(c for c in range(0x20, 0x7f) if c not in b'"\\')
 
 
-def dataclass_to_dict(obj) -> dict:
-    """Convert dataclass to dictionary, handling nested dataclasses."""
-    if isinstance(obj, list):
-        return [dataclass_to_dict(item) for item in obj]
-    elif hasattr(obj, '__dataclass_fields__'):
-        return {
-            key: dataclass_to_dict(value)
-            for key, value in asdict(obj).items()
-        }
+def write_json_string(value: str, f) -> None:
+    """
+    Write a JSON string to a binary file. Strings that need no escaping (such
+    as base64 data URLs) are written as they are, without an escaped copy.
+    """
+    if value.isascii():
+        data = value.encode('ascii')
+        # Deleting every plain byte leaves nothing when no escaping is needed
+        if not data.translate(None, JSON_PLAIN_BYTES):
+            f.write(b'"')
+            f.write(data)
+            f.write(b'"')
+            return
+    f.write(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+
+def write_json(value, f) -> None:
+    """
+    Write a value as compact UTF-8 JSON to a binary file, streaming
+    dataclasses field by field.
+
+    Produces the same document as json.dump(asdict(value), separators=(',', ':'),
+    ensure_ascii=False), except that optional dataclass fields (default None)
+    are left out while None, matching the optional properties of the
+    TypeScript types. No intermediate dict tree is built and large strings
+    are not copied through the encoder.
+    """
+    if isinstance(value, str):
+        write_json_string(value, f)
+    elif isinstance(value, list):
+        f.write(b"[")
+        for i, item in enumerate(value):
+            if i:
+                f.write(b",")
+            write_json(item, f)
+        f.write(b"]")
+    elif isinstance(value, dict) or hasattr(value, '__dataclass_fields__'):
+        items = value.items() if isinstance(value, dict) else (
+            (fld.name, item) for fld in fields(value)
+            if (item := getattr(value, fld.name)) is not None or fld.default is not None
+        )
+        f.write(b"{")
+        for i, (key, item) in enumerate(items):
+            if i:
+                f.write(b",")
+            write_json_string(key, f)
+            f.write(b":")
+            write_json(item, f)
+        f.write(b"}")
     else:
-        return obj
+        f.write(json.dumps(value).encode('ascii'))
+
+
+def build_parsed_data(category: Category, contestant: str | None = None) -> ParsedData:
+    """Wrap a category with its output metadata (content hash and optional contestant)."""
+    metadata = {"contentHash": category_content_hash(category)}
+    if contestant:
+        metadata["contestantName"] = contestant
+    return ParsedData(category=category, metadata=metadata)
+
+
+def slide_from_dict(data: dict) -> Slide:
+    """Rebuild a Slide from its JSON form."""
+    return Slide(
+        imageUrl=data["imageUrl"],
+        answer=data["answer"],
+        censorBoxes=[CensorBox(**box) for box in data["censorBoxes"]],
+        contentHash=data.get("contentHash"),
+        sourceHash=data.get("sourceHash"),
+        imageWidth=data.get("imageWidth"),
+        imageHeight=data.get("imageHeight"),
+        placeholderUrl=data.get("placeholderUrl"),
+    )
+
+
+def read_output(input_path: Path) -> ParsedData:
+    """Read a file written by write_output(); .ndjson/.jsonl files are read as NDJSON."""
+    with open(input_path, encoding="utf-8") as f:
+        if input_path.suffix.lower() in (".ndjson", ".jsonl"):
+            header = json.loads(f.readline())
+            name, metadata = header["name"], header.get("metadata")
+            slide_dicts = [json.loads(line) for line in f if line.strip()]
+        else:
+            data = json.load(f)
+            name, metadata = data["category"]["name"], data.get("metadata")
+            slide_dicts = data["category"]["slides"]
+    category = Category(name=name, slides=[slide_from_dict(slide) for slide in slide_dicts])
+    return ParsedData(category=category, metadata=metadata)
+
+
+def write_output(parsed_data: ParsedData, output_path: Path, output_format: str = "json") -> None:
+    """Write parsed data as a JSON document or as NDJSON (see write_ndjson)."""
+    with open(output_path, "wb") as f:
+        if output_format == "ndjson":
+            write_ndjson(parsed_data, f)
+        else:
+            write_json(parsed_data, f)
+
+
+def category_header(parsed_data: ParsedData) -> dict:
+    """The NDJSON header line of a category, also used as its bundle index entry."""
+    return {
+        "name": parsed_data.category.name,
+        "metadata": parsed_data.metadata,
+        "slideCount": len(parsed_data.category.slides),
+    }
+
+
+def write_ndjson(parsed_data: ParsedData, f) -> None:
+    """
+    Write parsed data as NDJSON (one JSON document per line).
+
+    The first line is a header with the category name, metadata and slide
+    count; each following line is one Slide. This lets the importer parse
+    and store slides incrementally instead of parsing one huge document.
+    """
+    write_json(category_header(parsed_data), f)
+    f.write(b"\n")
+    for slide in parsed_data.category.slides:
+        write_json(slide, f)
+        f.write(b"\n")
+
+
+def add_conversion_arguments(parser: argparse.ArgumentParser, default_quality: int = 85,
+                             default_on_error: str = 'original') -> None:
+    """Add the flags read by ConversionOptions.from_args() to a command-line parser."""
+    parser.add_argument(
+        "--max-width",
+        type=int,
+        default=3840,
+        help="Maximum output width in pixels (default: 3840)"
+    )
+    parser.add_argument(
+        "--max-height",
+        type=int,
+        default=2160,
+        help="Maximum output height in pixels (default: 2160)"
+    )
+    parser.add_argument(
+        "--max-source-mp",
+        type=float,
+        default=MAX_SOURCE_PIXELS / 1_000_000,
+        help=f"Skip slides whose image is larger than this many megapixels "
+             f"(default: {MAX_SOURCE_PIXELS // 1_000_000})"
+    )
+    parser.add_argument(
+        "--placeholder-size",
+        type=int,
+        default=PLACEHOLDER_SIZE,
+        help=f"Longest side in pixels of the placeholder thumbnail stored with each slide, "
+             f"0 for none (default: {PLACEHOLDER_SIZE})"
+    )
+    parser.add_argument(
+        "--large-image-mp",
+        type=float,
+        default=LARGE_IMAGE_PIXELS / 1_000_000,
+        help=f"Downscale images above this many megapixels with bounded memory: reduced-scale "
+             f"JPEG decoding and strip-wise resampling (default: {LARGE_IMAGE_PIXELS // 1_000_000})"
+    )
+    parser.add_argument(
+        "--codec",
+        choices=CODEC_MODES,
+        default="jpeg",
+        help="Output image format (default: jpeg). auto encodes JPEG, WebP and, for graphics, "
+             "palette PNG in parallel and keeps the smallest that meets --min-psnr"
+    )
+    parser.add_argument(
+        "--on-error",
+        choices=ERROR_POLICIES,
+        default=default_on_error,
+        help="For an image that cannot be converted: embed the original unchanged, a grey "
+             f"'image unavailable' substitute, or drop the slide (default: {default_on_error})"
+    )
+    parser.add_argument(
+        "--min-psnr",
+        type=float,
+        default=MIN_PSNR,
+        help=f"With --codec auto, lowest PSNR in dB accepted from WebP or a reduced-palette PNG "
+             f"(default: {MIN_PSNR:g})"
+    )
+    add_jpeg_arguments(parser, default_quality)
+    add_resample_argument(parser)
+
+
+def add_jpeg_arguments(parser: argparse.ArgumentParser, default_quality: int) -> None:
+    """Add the shared JPEG encoder options to a command-line parser."""
+    parser.add_argument(
+        "--quality",
+        type=int,
+        default=default_quality,
+        help=f"JPEG quality 1-100 (default: {default_quality})"
+    )
+    parser.add_argument(
+        "--progressive",
+        choices=["auto", "on", "off"],
+        default="auto",
+        help=f"Progressive JPEG encoding (default: auto, progressive for images of "
+             f"{PROGRESSIVE_MIN_PIXELS // 1_000_000}MP or more)"
+    )
+    parser.add_argument(
+        "--subsampling",
+        choices=JPEG_SUBSAMPLING_MODES,
+        default="auto",
+        help="Chroma subsampling (default: auto, 4:4:4 for graphics and 4:2:0 for photos)"
+    )
+    parser.add_argument(
+        "--qtables",
+        choices=JPEG_QTABLE_PRESETS,
+        help="Quantisation table preset (default: standard tables scaled by --quality)"
+    )
+
+
+def add_resample_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --resample option to a command-line parser."""
+    parser.add_argument(
+        "--resample",
+        choices=RESAMPLE_STRATEGIES,
+        default="auto",
+        help="Downscale resampling strategy (default: auto, lanczos below a 4x "
+             "reduction and box-lanczos from 4x)"
+    )
+
+
+def add_resize_workers_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the --resize-workers flag (ConversionOptions.resize_workers) to a command-line parser."""
+    parser.add_argument(
+        "--resize-workers",
+        type=int,
+        default=0,
+        help="Processes that resample images above --large-image-mp in parallel strips, "
+             "reading the decoded image from shared memory (default: 0, resample in this process)"
+    )
+
+
+def parse_slide_numbers(value: str) -> set[int]:
+    """Parse a --slides value such as "3,7-9" into 1-based slide numbers."""
+    numbers: set[int] = set()
+    try:
+        for part in value.split(","):
+            first, _, last = part.strip().partition("-")
+            start = int(first)
+            end = int(last) if last else start
+            if start < 1 or end < start:
+                raise ValueError
+            numbers.update(range(start, end + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid slide range: {value!r} (expected e.g. 3,7-9)")
+    return numbers
+
+
+def parse_progressive_arg(value: str) -> bool | None:
+    """Map the --progressive choice to encode_jpeg()'s progressive argument."""
+    return {"auto": None, "on": True, "off": False}[value]
 
 
 def main():
@@ -394,7 +1861,7 @@ def main():
         "output",
         type=Path,
         nargs='?',
-        help="Output JSON file path (optional, defaults to input name with .json extension)"
+        help="Output JSON file path (optional, defaults to input name with .json or .ndjson extension)"
     )
     parser.add_argument(
         "--contestant",
@@ -407,12 +1874,62 @@ def main():
         required=True,
         help="Category name (required)"
     )
+    parser.add_argument(
+        "--output-format",
+        choices=["json", "ndjson"],
+        default="json",
+        help="Output format: a single JSON document, or NDJSON with a header line "
+             "followed by one line per slide (default: json)"
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Reuse slides from the existing output file and only convert slides whose "
+             "XML, picture or notes changed (or those given by --slides)"
+    )
+    parser.add_argument(
+        "--slides",
+        type=parse_slide_numbers,
+        help="With --update, the slides to convert again; with --preview, the slides to "
+             "include. E.g. 3,7-9 (default: detect changes / all slides)"
+    )
+    parser.add_argument(
+        "--preview",
+        action="store_true",
+        help=f"Quick check of answers and censor boxes: {PREVIEW_MAX_WIDTH}x{PREVIEW_MAX_HEIGHT} "
+             f"quality {PREVIEW_QUALITY} JPEGs with reduced-scale decoding, written to "
+             f"<input>.preview.json by default"
+    )
+    parser.add_argument(
+        "--every",
+        type=int,
+        default=1,
+        help="With --preview, include only every Nth slide (default: 1)"
+    )
+    add_conversion_arguments(parser, default_quality=85)
+    add_resize_workers_argument(parser)
 
     args = parser.parse_args()
 
-    # Default output to input filename with .json extension if not provided
+    if args.preview and args.update:
+        parser.error("--preview cannot be combined with --update")
+    if args.slides and not (args.update or args.preview):
+        parser.error("--slides requires --update or --preview")
+    if args.every != 1 and not args.preview:
+        parser.error("--every requires --preview")
+    if args.every < 1:
+        parser.error("--every must be at least 1")
+    if args.resize_workers < 0:
+        parser.error("--resize-workers must not be negative")
+
+    # Default output to input filename with .json/.ndjson extension if not provided
     if args.output is None:
-        args.output = args.input.with_suffix('.json')
+        suffix = f'.preview.{args.output_format}' if args.preview else f'.{args.output_format}'
+        args.output = args.input.with_suffix(suffix)
+
+    options = replace(ConversionOptions.from_args(args), resize_workers=args.resize_workers)
+    if args.preview:
+        options = preview_options(options)
 
     # Validate input file
     if not args.input.exists():
@@ -423,34 +1940,48 @@ def main():
         print("Error: Input file must be a .pptx file", file=sys.stderr)
         sys.exit(1)
 
+    # Load the slides to reuse
+    previous = None
+    contestant = args.contestant
+    if args.update:
+        if args.output.exists():
+            try:
+                previous_data = read_output(args.output)
+            except Exception as e:
+                print(f"Error: Failed to read existing output {args.output}: {e}", file=sys.stderr)
+                sys.exit(1)
+            previous = previous_data.category.slides
+            # Keep the contestant unless --contestant names a new one
+            contestant = contestant or (previous_data.metadata or {}).get("contestantName")
+        else:
+            print(f"No existing output at {args.output}, converting all slides", file=sys.stderr)
+
     # Parse PPTX
     print(f"Parsing {args.input}...", file=sys.stderr)
+    stats = EncodeStats()
     try:
-        category = parse_pptx(args.input, args.category)
+        # Without an existing output, --update converts every slide
+        slide_numbers = args.slides if previous is not None or args.preview else None
+        category = parse_pptx(
+            args.input, args.category, options, stats, previous, slide_numbers, args.every
+        )
     except Exception as e:
         print(f"Error: Failed to parse PPTX: {e}", file=sys.stderr)
         sys.exit(1)
 
     # Build output data
-    metadata = None
-    if args.contestant:
-        metadata = {"contestantName": args.contestant}
-
-    parsed_data = ParsedData(category=category, metadata=metadata)
-
-    # Convert to dictionary for JSON serialization
-    output_dict = dataclass_to_dict(parsed_data)
+    parsed_data = build_parsed_data(category, contestant)
 
     # Write output JSON
     print(f"Writing output to {args.output}...", file=sys.stderr)
     try:
-        with open(args.output, "w", encoding="utf-8") as f:
-            json.dump(output_dict, f, indent=2, ensure_ascii=False)
+        write_output(parsed_data, args.output, args.output_format)
     except Exception as e:
         print(f"Error: Failed to write output file: {e}", file=sys.stderr)
         sys.exit(1)
 
     print(f"✓ Successfully parsed {len(category.slides)} slides", file=sys.stderr)
+    print(f"  {stats.summary()}", file=sys.stderr)
     print(f"✓ Output written to {args.output}", file=sys.stderr)
 
 
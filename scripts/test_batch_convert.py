@@ -0,0 +1,175 @@
+"""Tests for batch_convert.py."""
+
+import json
+import multiprocessing
+import os
+import signal
+import time
+from functools import partial
+
+import pytest
+
+import batch_convert
+from batch_convert import DeckJob, Watchdog, init_worker, main, write_bundle
+from parse_pptx import ConversionOptions, make_substitute_image
+from test_parse_pptx import make_deck
+
+# The pipeline tests replace convert_slide_image before the worker pools start,
+# so only forked workers see the replacement
+needs_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method() != 'fork', reason="workers must be forked"
+)
+
+
+def make_written_deck(tmp_path, name: str) -> DeckJob:
+    """A DeckJob whose one-slide JSON output has been written."""
+    output = tmp_path / f"{name}.json"
+    slide = {"imageUrl": "data:image/jpeg;base64,QUJD", "answer": name, "censorBoxes": []}
+    category = {"name": name, "slides": [slide]}
+    output.write_text(json.dumps({"category": category, "metadata": {"contentHash": name}}))
+    deck = DeckJob(path=tmp_path / f"{name}.pptx", output=output, category=name)
+    deck.header = {"name": name, "metadata": {"contentHash": name}, "slideCount": 1}
+    return deck
+
+
+def test_json_bundle_holds_every_deck(tmp_path):
+    decks = [make_written_deck(tmp_path, name) for name in ("movies", "flags")]
+    bundle = tmp_path / "season.json"
+
+    write_bundle(decks, bundle, "json")
+
+    data = json.loads(bundle.read_text())
+    assert [entry["name"] for entry in data["index"]] == ["flags", "movies"]
+    assert [c["category"]["name"] for c in data["categories"]] == ["flags", "movies"]
+
+
+def test_json_bundle_too_large_for_the_app_is_refused(tmp_path, monkeypatch):
+    decks = [make_written_deck(tmp_path, name) for name in ("movies", "flags")]
+    monkeypatch.setattr(batch_convert, "JSON_BUNDLE_MAX_BYTES", decks[0].output.stat().st_size)
+
+    with pytest.raises(ValueError, match="ndjson"):
+        write_bundle(decks, tmp_path / "season.json", "json")
+    assert not (tmp_path / "season.json").exists()
+
+    # NDJSON bundles are read line by line, so they have no limit
+    write_bundle(decks, tmp_path / "season.ndjson", "ndjson")
+
+
+def wait_for_watchdog(seconds: float | None) -> None:
+    """Set a Watchdog deadline, clear it if seconds is None, and outlive it."""
+    watchdog = Watchdog()
+    watchdog.set(0.1)
+    if seconds is None:
+        watchdog.set(None)
+    time.sleep(1)
+
+
+@pytest.mark.parametrize('seconds, exitcode', [(0.1, 1), (None, 0)])
+def test_watchdog_exits_the_process_after_its_deadline(seconds, exitcode):
+    process = multiprocessing.Process(target=wait_for_watchdog, args=(seconds,))
+    process.start()
+    process.join(timeout=10)
+
+    assert process.exitcode == exitcode
+
+
+def test_worker_starts_when_memory_limit_is_refused(monkeypatch, capsys):
+    def refuse(*args):
+        raise ValueError("not allowed")
+
+    monkeypatch.setattr(batch_convert.resource, 'setrlimit', refuse)
+    monkeypatch.setattr(batch_convert, 'watchdog', None)
+    handler = signal.getsignal(signal.SIGALRM)
+    try:
+        init_worker(64)
+    finally:
+        signal.signal(signal.SIGALRM, handler)
+
+    assert batch_convert.watchdog is not None
+    assert "Could not limit worker memory to 64MB: not allowed" in capsys.readouterr().out
+
+
+def fail_slide_2(convert, image_bytes, ext, crop, slide_index, *args, **kwargs):
+    if slide_index == 1:
+        raise RuntimeError("broken image")
+    return convert(image_bytes, ext, crop, slide_index, *args, **kwargs)
+
+
+def fail_slide_2_once(marker, convert, image_bytes, ext, crop, slide_index, *args, **kwargs):
+    if slide_index == 1 and not marker.exists():
+        marker.touch()
+        raise RuntimeError("broken image")
+    return convert(image_bytes, ext, crop, slide_index, *args, **kwargs)
+
+
+def kill_worker_on_slide_2(convert, image_bytes, ext, crop, slide_index, *args, **kwargs):
+    if slide_index == 1:
+        os._exit(1)
+    return convert(image_bytes, ext, crop, slide_index, *args, **kwargs)
+
+
+def hang_on_slide_2(convert, image_bytes, ext, crop, slide_index, *args, **kwargs):
+    if slide_index == 1:
+        time.sleep(30)
+    return convert(image_bytes, ext, crop, slide_index, *args, **kwargs)
+
+
+def convert_batch(tmp_path, monkeypatch, fake, *extra) -> tuple[list[dict], str]:
+    """Run batch_convert.py on a three-slide deck with fake(convert_slide_image, ...) converting it."""
+    decks = tmp_path / 'decks'
+    decks.mkdir()
+    (decks / 'deck.pptx').write_bytes(make_deck(3))
+    monkeypatch.setattr(batch_convert, 'convert_slide_image', partial(fake, batch_convert.convert_slide_image))
+    monkeypatch.setattr('sys.argv', [
+        'batch_convert.py', str(decks), str(tmp_path / 'out'), '--jobs', '1',
+        '--slide-memory-mb', '0', '--error-report', str(tmp_path / 'errors.json'), *extra
+    ])
+
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == 0
+    slides = json.loads((tmp_path / 'out' / 'deck.json').read_text())['category']['slides']
+    return slides, (tmp_path / 'errors.json').read_text()
+
+
+@needs_fork
+def test_slide_failing_twice_gets_substitute_image(tmp_path, monkeypatch, capsys):
+    slides, errors = convert_batch(tmp_path, monkeypatch, fail_slide_2)
+
+    assert "Retrying slide 2 of deck.pptx: broken image" in capsys.readouterr().out
+    # The batch default is --on-error substitute, not the original image
+    assert slides[1]['imageUrl'] == make_substitute_image(2, ConversionOptions()).url
+    assert slides[0]['imageUrl'] != slides[1]['imageUrl'] != slides[2]['imageUrl']
+    assert [(e['slide'], e['code']) for e in json.loads(errors)] == [(2, 'image-fallback')]
+
+
+@needs_fork
+def test_slide_failing_once_is_converted_by_its_retry(tmp_path, monkeypatch, capsys):
+    marker = tmp_path / 'failed-once'
+    slides, errors = convert_batch(tmp_path, monkeypatch, partial(fail_slide_2_once, marker))
+
+    assert "Retrying slide 2 of deck.pptx: broken image" in capsys.readouterr().out
+    assert marker.exists()
+    assert slides[1]['imageUrl'] != make_substitute_image(2, ConversionOptions()).url
+    assert json.loads(errors) == []
+
+
+@needs_fork
+def test_slide_killing_its_worker_does_not_fail_the_deck(tmp_path, monkeypatch, capsys):
+    slides, errors = convert_batch(tmp_path, monkeypatch, kill_worker_on_slide_2, '--on-error', 'drop')
+
+    assert "Retrying slide 2 of deck.pptx: worker process died" in capsys.readouterr().out
+    assert len(slides) == 2
+    assert [(e['slide'], e['code']) for e in json.loads(errors)] == [(2, 'image-dropped')]
+
+
+@needs_fork
+def test_slide_past_its_timeout_is_retried_then_substituted(tmp_path, monkeypatch, capsys):
+    start = time.monotonic()
+    slides, errors = convert_batch(tmp_path, monkeypatch, hang_on_slide_2, '--slide-timeout', '0.5')
+
+    assert time.monotonic() - start < 20
+    assert "Retrying slide 2 of deck.pptx: conversion took longer than 0.5s" in capsys.readouterr().out
+    assert slides[1]['imageUrl'] == make_substitute_image(2, ConversionOptions()).url
+    assert [(e['slide'], e['code']) for e in json.loads(errors)] == [(2, 'image-fallback')]
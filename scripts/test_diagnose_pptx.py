@@ -0,0 +1,55 @@
+"""Tests for the diagnose_pptx.py --json scan."""
+
+import io
+
+from PIL import Image
+from pptx import Presentation
+from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+from pptx.util import Inches
+
+from diagnose_pptx import NS, scan_pptx
+
+
+def make_deck(path):
+    """Write a one-slide deck with a picture, a rectangle, a text box, a connector and a group."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+
+    image = io.BytesIO()
+    Image.new('RGB', (64, 48), 'white').save(image, 'PNG')
+    image.seek(0)
+    slide.shapes.add_picture(image, 0, 0, Inches(4), Inches(3))
+    slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(1), Inches(1), Inches(1), Inches(1))
+    slide.shapes.add_textbox(Inches(5), Inches(1), Inches(2), Inches(1))
+    slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, 0, 0, Inches(1), Inches(1))
+    group = slide.shapes.add_group_shape()
+    group.shapes.add_shape(MSO_SHAPE.OVAL, Inches(6), Inches(4), Inches(1), Inches(1))
+
+    prs.save(path)
+
+
+def test_scan_counts_only_shapes(tmp_path):
+    path = tmp_path / 'deck.pptx'
+    make_deck(path)
+
+    slide = scan_pptx(path)['slides'][0]
+
+    # The spTree's own nvGrpSpPr/grpSpPr are not shapes; grouped shapes count as one
+    assert slide['shapes'] == 5
+    assert slide['pictures'] == 1
+    assert slide['autoShapes'] == 1
+
+
+def test_scan_tolerates_shape_without_cnvsppr(tmp_path):
+    path = tmp_path / 'deck.pptx'
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, Inches(1), Inches(1))
+    nv_sp_pr = shape._element.find('p:nvSpPr', NS)
+    nv_sp_pr.remove(nv_sp_pr.find('p:cNvSpPr', NS))
+    prs.save(path)
+
+    result = scan_pptx(path)
+
+    assert 'error' not in result
+    assert result['slides'][0]['autoShapes'] == 1
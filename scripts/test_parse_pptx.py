@@ -0,0 +1,242 @@
+"""Tests for parse_pptx.py image conversion."""
+
+import hashlib
+import json
+import random
+from dataclasses import asdict
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+import parse_pptx
+
+from parse_pptx import (
+    CensorBox,
+    Category,
+    ConversionOptions,
+    ImageTooLargeError,
+    Slide,
+    close_strip_pool,
+    encode_auto,
+    encode_jpeg_candidate,
+    encode_webp,
+    image_psnr,
+    open_image,
+    build_parsed_data,
+    main,
+    parse_pptx as parse_deck,
+    parse_presentation,
+    read_output,
+    pixel_limit,
+    prepare_image,
+    resize_image,
+    resize_in_strips,
+    slide_content_hash,
+)
+
+NO_CROP = (0.0, 0.0, 0.0, 0.0)
+
+
+def png_bytes(img: Image.Image) -> bytes:
+    out = BytesIO()
+    img.save(out, 'PNG', compress_level=1)
+    return out.getvalue()
+
+
+def photo(size: tuple[int, int] = (960, 640), seed: int = 0) -> Image.Image:
+    """Smooth colour fields with a little grain, standing in for a photograph."""
+    rng = random.Random(seed)
+    base = Image.frombytes('RGB', (12, 8), rng.randbytes(12 * 8 * 3)).resize(size, Image.Resampling.BICUBIC)
+    grain = bytes(min(255, max(0, round(rng.gauss(128, 20)))) for _ in range(size[0] * size[1]))
+    return Image.blend(base, Image.frombytes('L', size, grain).convert('RGB'), 0.1)
+
+
+def make_deck(slide_count: int, answers: dict[int, str] | None = None) -> bytes:
+    """
+    A deck of slide_count slides, each with a picture and speaker notes
+    ("Answer <number>" unless answers gives another for that slide number).
+    """
+    prs = Presentation()
+    for number in range(1, slide_count + 1):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+        slide.shapes.add_picture(BytesIO(png_bytes(photo((320, 200), number))), 0, 0, Inches(4))
+        slide.notes_slide.notes_text_frame.text = (answers or {}).get(number, f"Answer {number}")
+    out = BytesIO()
+    prs.save(out)
+    return out.getvalue()
+
+
+@pytest.fixture(scope='module')
+def wide_png() -> bytes:
+    """A 60000x3200 (192MP) panorama: above Pillow's 179MP error limit, below the 400MP cap."""
+    img = Image.new('L', (60000, 3200), 128)
+    img.paste(255, (0, 0, 30000, 1600))
+    return png_bytes(img)
+
+
+@pytest.mark.filterwarnings('error::PIL.Image.DecompressionBombWarning')
+@pytest.mark.parametrize('resize_workers', [0, 2])
+def test_wide_image_below_cap_converts(wide_png, resize_workers):
+    options = ConversionOptions(resize_workers=resize_workers)
+    try:
+        img = prepare_image(wide_png, NO_CROP, options)
+    finally:
+        close_strip_pool()
+
+    assert img.size == (3840, 204)
+    assert img.getpixel((0, 0)) == (255, 255, 255)
+    assert img.getpixel((3839, 203)) == (128, 128, 128)
+
+
+def test_pixel_limit_restores_pillow_limit():
+    pillow_limit = Image.MAX_IMAGE_PIXELS
+    with pixel_limit(500_000_000):
+        with pixel_limit(300_000_000):
+            assert Image.MAX_IMAGE_PIXELS == 500_000_000
+        assert Image.MAX_IMAGE_PIXELS == 500_000_000
+    assert Image.MAX_IMAGE_PIXELS == pillow_limit
+
+
+def test_pixel_limit_raises_image_too_large(monkeypatch):
+    monkeypatch.setattr(Image, 'MAX_IMAGE_PIXELS', 1_000)
+
+    with pytest.raises(ImageTooLargeError):
+        with pixel_limit(1_000):
+            Image.new('L', (100, 100)).crop((0, 0, 100, 100))
+
+
+def test_open_image_rejects_image_above_cap():
+    data = png_bytes(Image.new('L', (200, 100)))
+
+    with pytest.raises(ImageTooLargeError):
+        open_image(data, max_pixels=10_000)
+
+
+def test_auto_codec_picks_smaller_webp_at_jpeg_quality():
+    # At quality 30 the JPEG is below the 40dB floor; WebP is smaller and no worse
+    img = photo()
+    options = ConversionOptions(codec='auto', quality=30)
+    jpeg = encode_jpeg_candidate(img, options)
+    webp = encode_webp(img, options.quality)
+    assert jpeg.psnr < options.min_psnr
+    assert len(webp.data) < len(jpeg.data) and webp.psnr >= jpeg.psnr
+
+    assert encode_auto(img, options).codec == 'webp'
+
+
+@pytest.mark.parametrize('slides_read', [1, 2])
+def test_parse_presentation_closes_strip_pool(slides_read):
+    # Every image counts as large, so it is resampled by the strip pool
+    options = ConversionOptions(large_image_pixels=1, resize_workers=1)
+    result = parse_presentation(make_deck(2), options)
+
+    slides = [next(result.slides) for _ in range(slides_read)]
+    assert parse_pptx._strip_pool is not None
+    result.slides.close()
+
+    assert len(slides) == slides_read
+    assert parse_pptx._strip_pool is None
+
+
+def test_slide_numbers_past_the_end_are_reported(tmp_path, capsys):
+    path = tmp_path / 'deck.pptx'
+    path.write_bytes(make_deck(2))
+
+    category = parse_deck(path, 'Test', slide_numbers={2, 5, 9})
+
+    assert [slide.answer for slide in category.slides] == ['Answer 2']
+    assert "ignoring slide numbers past the end: 5, 9" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('strategy', ['lanczos', 'bicubic'])
+def test_strips_use_the_resample_strategy(strategy):
+    img = photo((1200, 900))
+    size = (400, 300)
+
+    strips = resize_in_strips(img, (0, 0, *img.size), size, strategy)
+
+    # Same filter as resizing the whole image; the other filter is far off
+    other = 'bicubic' if strategy == 'lanczos' else 'lanczos'
+    assert image_psnr(resize_image(img, size, strategy), strips) > 80
+    assert image_psnr(resize_image(img, size, other), strips) < 60
+
+
+def test_update_converts_only_changed_slides():
+    previous = list(parse_presentation(make_deck(3)).slides)
+
+    result = parse_presentation(make_deck(3, {2: "Edited"}), previous=previous)
+    slides = list(result.slides)
+
+    assert result.reused == 2
+    assert [slide.answer for slide in slides] == ['Answer 1', 'Edited', 'Answer 3']
+    assert slides[0] is previous[0] and slides[2] is previous[2]
+
+
+def test_update_slides_keeps_other_slides_changed_for_later():
+    previous = list(parse_presentation(make_deck(3)).slides)
+    edited = make_deck(3, {2: "Edited 2", 3: "Edited 3"})
+
+    # Only slide 2 is converted; slide 3 is kept by position, edit and all
+    partial = list(parse_presentation(edited, previous=previous, slide_numbers={2}).slides)
+    assert [slide.answer for slide in partial] == ['Answer 1', 'Edited 2', 'Answer 3']
+    assert partial[2].sourceHash == previous[2].sourceHash
+
+    # A plain update still finds the edit to slide 3
+    result = parse_presentation(edited, previous=partial)
+    assert [slide.answer for slide in result.slides] == ['Answer 1', 'Edited 2', 'Edited 3']
+    assert result.reused == 2
+
+
+def test_on_error_does_not_change_source_hash():
+    deck = make_deck(1)
+    original = next(parse_presentation(deck, ConversionOptions(on_error='original')).slides)
+    substitute = next(parse_presentation(deck, ConversionOptions(on_error='substitute')).slides)
+
+    assert original.sourceHash == substitute.sourceHash
+
+
+def test_update_keeps_contestant(tmp_path, monkeypatch):
+    deck = tmp_path / 'deck.pptx'
+    deck.write_bytes(make_deck(1))
+    output = tmp_path / 'deck.json'
+
+    for extra in (['--contestant', 'Alice'], ['--update']):
+        monkeypatch.setattr('sys.argv', ['parse_pptx.py', str(deck), str(output), '--category', 'Test', *extra])
+        main()
+
+    assert read_output(output).metadata['contestantName'] == 'Alice'
+
+
+def test_content_hash_covers_placeholder_and_size():
+    deck = make_deck(1)
+    with_placeholder = next(parse_presentation(deck).slides)
+    without_placeholder = next(parse_presentation(deck, ConversionOptions(placeholder_size=0)).slides)
+    assert with_placeholder.placeholderUrl and without_placeholder.placeholderUrl is None
+
+    assert with_placeholder.contentHash != without_placeholder.contentHash
+    metadata = [
+        build_parsed_data(Category(name='Test', slides=[slide])).metadata
+        for slide in (with_placeholder, without_placeholder)
+    ]
+    assert metadata[0]['contentHash'] != metadata[1]['contentHash']
+
+
+def test_content_hash_is_sha256_of_canonical_json(monkeypatch):
+    # Chunks far smaller than the strings, split between escaped characters
+    monkeypatch.setattr(parse_pptx, 'HASH_CHUNK_CHARS', 3)
+    slide = Slide(
+        imageUrl="data:image/jpeg;base64," + "QUJD" * 10,
+        answer='Caf\u00e9 "Ol\u00e9"\\\n\U0001f600',
+        censorBoxes=[CensorBox(x=1.5, y=2.0, width=3.25, height=4.0, color="#000000")],
+        sourceHash="ignored",
+        imageWidth=640,
+        imageHeight=480,
+    )
+
+    content = {key: value for key, value in asdict(slide).items()
+               if value is not None and key not in ('contentHash', 'sourceHash')}
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    assert slide_content_hash(slide) == hashlib.sha256(canonical.encode('utf-8')).hexdigest()
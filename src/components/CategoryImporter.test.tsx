@@ -47,7 +47,7 @@ describe('CategoryImporter', () => {
     // Check for file input element
     const fileInput = container.querySelector('input[type="file"]');
     expect(fileInput).toBeInTheDocument();
-    expect(fileInput).toHaveAttribute('accept', '.json,application/json');
+    expect(fileInput).toHaveAttribute('accept', '.json,.ndjson,.jsonl,application/json');
   });
 
   it('should accept JSON file and parse category', async () => {
@@ -181,6 +181,37 @@ describe('CategoryImporter', () => {
     ]);
   });
 
+  it('should add every category in a bundle with its contestant name', async () => {
+    const user = userEvent.setup();
+    const secondCategory: Category = { ...validCategory, name: 'Second Category' };
+    const bundle = {
+      index: [
+        { name: validCategory.name, metadata: { contestantName: 'Alice' }, slideCount: 1 },
+        { name: secondCategory.name, metadata: null, slideCount: 1 },
+      ],
+      categories: [
+        { category: validCategory, metadata: { contestantName: 'Alice' } },
+        { category: secondCategory, metadata: null },
+      ],
+    };
+    const file = createMockFile(JSON.stringify(bundle), 'season.json');
+
+    const { container } = render(
+      <CategoryImporter onImport={mockOnImport} onCancel={mockOnCancel} />
+    );
+
+    const fileInput = container.querySelector('input[type="file"]') as HTMLInputElement;
+    await user.upload(fileInput, file);
+
+    await waitFor(() => {
+      expect(screen.getByDisplayValue('Alice')).toBeInTheDocument();
+    });
+    expect(screen.getByText(/File 1 of 2/)).toBeInTheDocument();
+
+    await user.click(screen.getByRole('button', { name: /Next/i }));
+    expect(screen.getByDisplayValue('Second Category')).toBeInTheDocument();
+  });
+
   it('should show loading state while parsing file', async () => {
     const user = userEvent.setup();
     const jsonContent = JSON.stringify({ category: validCategory });
@@ -4,11 +4,13 @@
  * Allows users to import category data from JSON files (generated by scripts/parse_pptx.py)
  * and review/edit the data before adding it to the application.
  * Supports importing multiple contestants - shows one at a time with Next button.
+ * A bundle from scripts/batch_convert.py --bundle adds all of its categories, with
+ * their contestant names, from a single file.
  */
 
 import { useState, useEffect } from 'react';
 import type { Category } from '@types';
-import { loadCategoryJSON, JSONImportError } from '@utils/jsonImport';
+import { loadCategoryFile, JSONImportError } from '@utils/jsonImport';
 import { SlidePreview } from '@components/slide/SlidePreview';
 import { createLogger } from '@/utils/logger';
 import styles from './CategoryImporter.module.css';
@@ -88,22 +90,24 @@ export function CategoryImporter({
 
     const contestants: ContestantData[] = [];
 
-    // Process all selected files
+    // Process all selected files; a bundle file adds one entry per category
     for (const file of files) {
       try {
-        const loadedCategory = await loadCategoryJSON(file);
-
-        // Use initialContestantName if provided, otherwise leave blank
-        const name = initialContestantName ?? '';
-
-        contestants.push({
-          file,
-          category: loadedCategory,
-          contestantName: name,
-          categoryName: loadedCategory.name, // Always use category.name from JSON
-          error: null,
-          sizeBytes: file.size,
-        });
+        const loadedCategories = await loadCategoryFile(file);
+
+        for (const { category: loadedCategory, contestantName } of loadedCategories) {
+          // Use initialContestantName, then the name stored by the parser, otherwise blank
+          const name = initialContestantName ?? contestantName ?? '';
+
+          contestants.push({
+            file,
+            category: loadedCategory,
+            contestantName: name,
+            categoryName: loadedCategory.name, // Always use category.name from JSON
+            error: null,
+            sizeBytes: file.size,
+          });
+        }
       } catch (err) {
         contestants.push({
           file,
@@ -259,7 +263,7 @@ export function CategoryImporter({
             <input
               id="json-file-input"
               type="file"
-              accept=".json,application/json"
+              accept=".json,.ndjson,.jsonl,application/json"
               onChange={(e) => {
                 void handleFileChange(e);
               }}
@@ -275,7 +279,7 @@ export function CategoryImporter({
                   <div className={dropIconClass}>📁</div>
                   <div className={dropTextPrimaryClass}>Drag & drop category files here</div>
                   <div className={dropTextSecondaryClass}>or click to browse</div>
-                  <div className={dropSupportedTypesClass}>Supported: .json</div>
+                  <div className={dropSupportedTypesClass}>Supported: .json, .ndjson</div>
                 </>
               )}
             </label>
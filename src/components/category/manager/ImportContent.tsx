@@ -36,6 +36,10 @@ export function ImportContent({ initialContestantName = '' }: ImportContentProps
     void commitAndPushView(samplesView);
   };
 
+  // name is the contestant name stored in the file, if any
+  const toPreviewFile = ({ name, category }: { name: string; category: Category }) =>
+    name ? { filename: name, category, contestantName: name } : { filename: name, category };
+
   const handleFilesLoaded = (categories: { name: string; category: Category }[]) => {
     if (categories.length === 0) return;
 
@@ -51,14 +55,8 @@ export function ImportContent({ initialContestantName = '' }: ImportContentProps
       content: (
         <IndividualPreview
           key={`upload-${firstCategory.name}-1`}
-          currentFile={{
-            filename: firstCategory.name,
-            category: firstCategory.category,
-          }}
-          remainingFiles={remainingCategories.map((c) => ({
-            filename: c.name,
-            category: c.category,
-          }))}
+          currentFile={toPreviewFile(firstCategory)}
+          remainingFiles={remainingCategories.map(toPreviewFile)}
           source="upload"
           initialContestantName={initialContestantName}
           categoryNumber={1}
@@ -21,6 +21,9 @@ vi.mock('@/storage/indexedDB', () => ({
   deleteCategory: vi.fn().mockResolvedValue(undefined),
   addContestant: vi.fn().mockResolvedValue(undefined),
   deleteContestant: vi.fn().mockResolvedValue(undefined),
+  addCategories: vi.fn().mockResolvedValue(undefined),
+  addContestants: vi.fn().mockResolvedValue(undefined),
+  findCategoryByContentHash: vi.fn().mockResolvedValue(null),
 }));
 
 vi.mock('@/utils/broadcastSync', () => ({
@@ -630,6 +633,55 @@ describe('IndividualPreview', () => {
     });
   });
 
+  describe('Import All', () => {
+    it('should not offer Import All for files that are not loaded yet', () => {
+      render(
+        <ViewStack isOpen={true} onClose={vi.fn()}>
+          <IndividualPreviewWrapper
+            viewId="preview"
+            viewTitle="Preview"
+            currentFile={{ filename: 'test.json', category: mockCategory }}
+            remainingFiles={[{ filename: 'next.json' }]}
+            source="samples"
+          />
+        </ViewStack>
+      );
+
+      expect(screen.queryByRole('button', { name: /Import All/i })).not.toBeInTheDocument();
+    });
+
+    it('should import every uploaded category in one batch', async () => {
+      render(
+        <ViewStack isOpen={true} onClose={vi.fn()}>
+          <IndividualPreviewWrapper
+            viewId="preview"
+            viewTitle="Preview"
+            currentFile={{ filename: 'Alice', category: mockCategory, contestantName: 'Alice' }}
+            remainingFiles={[
+              {
+                filename: 'Bob',
+                category: { ...mockCategory, name: 'Second' },
+                contestantName: 'Bob',
+              },
+              { filename: '', category: { ...mockCategory, name: 'Third' } },
+            ]}
+            source="upload"
+          />
+        </ViewStack>
+      );
+
+      fireEvent.click(screen.getByRole('button', { name: 'Import All (3)' }));
+
+      await waitFor(() => {
+        expect(indexedDB.addCategories).toHaveBeenCalledTimes(1);
+      });
+      const categories = vi.mocked(indexedDB.addCategories).mock.calls[0]?.[0] as Category[];
+      expect(categories.map(({ name }) => name)).toEqual(['Test Category', 'Second', 'Third']);
+      expect(indexedDB.addContestants).toHaveBeenCalledTimes(1);
+      expect(indexedDB.addCategory).not.toHaveBeenCalled();
+    });
+  });
+
   describe('State Persistence', () => {
     it('should preserve edited names through useViewState', async () => {
       const user = userEvent.setup();
@@ -674,6 +726,23 @@ describe('IndividualPreview', () => {
       const contestantInput = screen.getByPlaceholderText(/Leave empty to import category only/i);
       expect((contestantInput as HTMLInputElement).value).toBe('Preset Name');
     });
+
+    it('should use the contestant name stored in the file', () => {
+      render(
+        <ViewStack isOpen={true} onClose={vi.fn()}>
+          <IndividualPreviewWrapper
+            viewId="preview"
+            viewTitle="Preview"
+            currentFile={{ filename: 'Alice', category: mockCategory, contestantName: 'Alice' }}
+            remainingFiles={[]}
+            source="upload"
+          />
+        </ViewStack>
+      );
+
+      const contestantInput = screen.getByPlaceholderText(/Leave empty to import category only/i);
+      expect((contestantInput as HTMLInputElement).value).toBe('Alice');
+    });
   });
 
   describe('Error Handling', () => {
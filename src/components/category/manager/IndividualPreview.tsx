@@ -9,11 +9,13 @@ import { useState, useEffect, useMemo } from 'react';
 import type { Category } from '@types';
 import { SlideList } from '@components/slide/SlideList';
 import { calculateCategorySize } from '@utils/storageUtils';
+import { toStoredCategoryData } from '@utils/categoryImport';
 import { useViewStack, type View } from '@components/common/ViewStack';
 import { fetchSampleCategory } from '@utils/sampleCategories';
 import { useViewState } from '@hooks/useViewState';
 import { AddCategoryCommand } from './commands/AddCategoryCommand';
 import { AddContestantCommand } from './commands/AddContestantCommand';
+import { ImportCategoriesCommand } from './commands/ImportCategoriesCommand';
 import type { Command } from '@components/common/Command';
 import { createLogger } from '@/utils/logger';
 import styles from '../../CategoryImporter.module.css';
@@ -23,6 +25,7 @@ const log = createLogger('IndividualPreview');
 interface PreviewFile {
   filename: string;
   category?: Category;
+  contestantName?: string; // Stored in the import file's metadata (e.g. a batch_convert.py bundle)
 }
 
 export interface PreviewState extends Record<string, unknown> {
@@ -64,7 +67,8 @@ export function IndividualPreview({
 
   // Persisted state using object mode for related values
   const [persistedState, setPersistedState] = useViewState<PreviewState>({
-    contestantName: initialContestantName,
+    // eslint-disable-next-line @typescript-eslint/prefer-nullish-coalescing
+    contestantName: initialContestantName || currentFile.contestantName || '',
     categoryName: '',
   });
 
@@ -158,13 +162,9 @@ export function IndividualPreview({
       const commands: Command[] = [];
 
       // Create category command with current values
-      const categoryCommand = new AddCategoryCommand({
-        name: editedCategoryName,
-        slides: category.slides,
-        createdAt: new Date().toISOString(),
-        thumbnailUrl: category.slides[0]?.imageUrl ?? '',
-        sizeInBytes: calculateCategorySize(category),
-      });
+      const categoryCommand = new AddCategoryCommand(
+        toStoredCategoryData({ ...category, name: editedCategoryName })
+      );
       commands.push(categoryCommand);
 
       // Optionally add contestant
@@ -192,6 +192,9 @@ export function IndividualPreview({
           const nextFileWithCategory: PreviewFile = usePreloaded
             ? { filename: nextFile.filename, category: nextCategory }
             : { filename: nextFile.filename };
+          if (nextFile.contestantName) {
+            nextFileWithCategory.contestantName = nextFile.contestantName;
+          }
 
           const nextView: View<PreviewState> = {
             id: `preview-${nextFile.filename}-${String(categoryNumber + 1)}`,
@@ -222,6 +225,33 @@ export function IndividualPreview({
     }
   };
 
+  // Uploaded files (e.g. a bundle) are all loaded already and can be imported in one batch
+  const remainingCategories = remainingFiles.flatMap((file) =>
+    file.category ? [{ category: file.category, contestantName: file.contestantName ?? '' }] : []
+  );
+  const canImportAll =
+    remainingFiles.length > 0 && remainingCategories.length === remainingFiles.length;
+
+  const handleImportAll = async () => {
+    if (!category || !editedCategoryName.trim()) return;
+
+    setIsImporting(true);
+    try {
+      const command = new ImportCategoriesCommand([
+        {
+          category: { ...category, name: editedCategoryName },
+          contestantName: editedContestantName,
+        },
+        ...remainingCategories,
+      ]);
+      await commitAndReturn({ commands: [command] });
+    } catch (err) {
+      log.error('Import failed', err);
+    } finally {
+      setIsImporting(false);
+    }
+  };
+
   const toggleSlideExpanded = (slideIndex: number) => {
     setExpandedSlideIndex((prev) => (prev === slideIndex ? null : slideIndex));
   };
@@ -297,6 +327,18 @@ export function IndividualPreview({
               ? 'Import & Next'
               : 'Import & Finish'}
         </button>
+        {canImportAll && (
+          <button
+            type="button"
+            onClick={() => {
+              void handleImportAll();
+            }}
+            disabled={!editedCategoryName.trim() || isImporting}
+            className={styles['import-button-inline'] ?? ''}
+          >
+            Import All ({remainingFiles.length + 1})
+          </button>
+        )}
       </div>
 
       {/* Preview section */}
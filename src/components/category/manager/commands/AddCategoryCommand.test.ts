@@ -13,6 +13,7 @@ import * as indexedDB from '@/storage/indexedDB';
 vi.mock('@/storage/indexedDB', () => ({
   addCategory: vi.fn(),
   deleteCategory: vi.fn(),
+  findCategoryByContentHash: vi.fn(),
 }));
 
 // Mock nanoid
@@ -145,6 +146,56 @@ describe('AddCategoryCommand', () => {
     });
   });
 
+  describe('content hash', () => {
+    const hashedData: Omit<StoredCategory, 'id'> = {
+      ...mockCategoryData,
+      contentHash: 'abc123',
+    };
+
+    it('should reuse an unchanged stored category instead of adding it again', async () => {
+      vi.mocked(indexedDB.findCategoryByContentHash).mockResolvedValueOnce({
+        ...hashedData,
+        id: 'existing-id',
+      });
+
+      const command = new AddCategoryCommand(hashedData);
+      await command.execute();
+
+      expect(indexedDB.findCategoryByContentHash).toHaveBeenCalledWith('Test Category', 'abc123');
+      expect(indexedDB.addCategory).not.toHaveBeenCalled();
+      expect(command.getCategoryId()).toBe('existing-id');
+    });
+
+    it('should not delete a reused category on undo', async () => {
+      vi.mocked(indexedDB.findCategoryByContentHash).mockResolvedValueOnce({
+        ...hashedData,
+        id: 'existing-id',
+      });
+
+      const command = new AddCategoryCommand(hashedData);
+      await command.execute();
+      await command.undo();
+
+      expect(indexedDB.deleteCategory).not.toHaveBeenCalled();
+    });
+
+    it('should add the category when no stored copy matches', async () => {
+      vi.mocked(indexedDB.findCategoryByContentHash).mockResolvedValueOnce(null);
+
+      const command = new AddCategoryCommand(hashedData);
+      await command.execute();
+
+      expect(indexedDB.addCategory).toHaveBeenCalledWith({ ...hashedData, id: 'test-id-123' });
+    });
+
+    it('should not look up categories without a content hash', async () => {
+      const command = new AddCategoryCommand(mockCategoryData);
+      await command.execute();
+
+      expect(indexedDB.findCategoryByContentHash).not.toHaveBeenCalled();
+    });
+  });
+
   describe('getCategoryId', () => {
     it('should throw error if called before execute', () => {
       const command = new AddCategoryCommand(mockCategoryData);
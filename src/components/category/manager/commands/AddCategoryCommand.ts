@@ -1,11 +1,12 @@
 import { nanoid } from 'nanoid';
-import { addCategory, deleteCategory } from '@/storage/indexedDB';
+import { addCategory, deleteCategory, findCategoryByContentHash } from '@/storage/indexedDB';
 import type { StoredCategory } from '@/types';
 import type { Command } from '@/components/common/Command';
 
 export class AddCategoryCommand implements Command {
   private categoryId: string | null = null;
   private executed = false;
+  private reusedExisting = false;
   private categoryData: Omit<StoredCategory, 'id'>;
 
   constructor(categoryData: Omit<StoredCategory, 'id'>) {
@@ -15,6 +16,18 @@ export class AddCategoryCommand implements Command {
   async execute(): Promise<void> {
     if (this.executed) return;
 
+    // Re-importing an unchanged category: reuse the stored copy instead of writing it again
+    const { name, contentHash } = this.categoryData;
+    if (contentHash) {
+      const existing = await findCategoryByContentHash<StoredCategory>(name, contentHash);
+      if (existing) {
+        this.categoryId = existing.id;
+        this.reusedExisting = true;
+        this.executed = true;
+        return;
+      }
+    }
+
     this.categoryId = nanoid();
     await addCategory({
       ...this.categoryData,
@@ -26,8 +39,12 @@ export class AddCategoryCommand implements Command {
   async undo(): Promise<void> {
     if (!this.executed || !this.categoryId) return;
 
-    await deleteCategory(this.categoryId);
+    // Never delete a category this command did not create
+    if (!this.reusedExisting) {
+      await deleteCategory(this.categoryId);
+    }
     this.executed = false;
+    this.reusedExisting = false;
   }
 
   getCategoryId(): string {
@@ -0,0 +1,98 @@
+/**
+ * ImportCategoriesCommand Tests
+ */
+
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { ImportCategoriesCommand } from './ImportCategoriesCommand';
+import type { Category, StoredCategory } from '@/types';
+import * as indexedDB from '@/storage/indexedDB';
+
+vi.mock('@/storage/indexedDB', () => ({
+  addCategories: vi.fn(),
+  addContestants: vi.fn(),
+  deleteCategory: vi.fn(),
+  deleteContestant: vi.fn(),
+  findCategoryByContentHash: vi.fn(),
+}));
+
+let nextId = 0;
+vi.mock('nanoid', () => ({
+  nanoid: () => `category-${String(++nextId)}`,
+}));
+
+const makeCategory = (name: string, contentHash?: string): Category => ({
+  name,
+  slides: [{ imageUrl: 'https://example.com/image.jpg', answer: 'Answer', censorBoxes: [] }],
+  ...(contentHash ? { contentHash } : {}),
+});
+
+describe('ImportCategoriesCommand', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    nextId = 0;
+    vi.mocked(indexedDB.findCategoryByContentHash).mockResolvedValue(null);
+  });
+
+  it('adds all categories and contestants in one bulk call each', async () => {
+    const command = new ImportCategoriesCommand([
+      { category: makeCategory('Movies'), contestantName: 'Alice' },
+      { category: makeCategory('Music'), contestantName: '' },
+      { category: makeCategory('Sports'), contestantName: 'Bob' },
+    ]);
+
+    await command.execute();
+
+    expect(indexedDB.addCategories).toHaveBeenCalledTimes(1);
+    const categories = vi.mocked(indexedDB.addCategories).mock.calls[0]?.[0] as StoredCategory[];
+    expect(categories.map(({ name }) => name)).toEqual(['Movies', 'Music', 'Sports']);
+
+    expect(indexedDB.addContestants).toHaveBeenCalledTimes(1);
+    const contestants = vi.mocked(indexedDB.addContestants).mock.calls[0]?.[0];
+    expect(contestants).toEqual([
+      expect.objectContaining({ name: 'Alice', categoryId: 'category-1' }),
+      expect.objectContaining({ name: 'Bob', categoryId: 'category-3' }),
+    ]);
+  });
+
+  it('does not add a category that is already stored unchanged', async () => {
+    vi.mocked(indexedDB.findCategoryByContentHash).mockResolvedValue({
+      id: 'stored-1',
+    } as StoredCategory);
+    const command = new ImportCategoriesCommand([
+      { category: makeCategory('Movies', 'hash-1'), contestantName: 'Alice' },
+    ]);
+
+    await command.execute();
+
+    expect(indexedDB.addCategories).not.toHaveBeenCalled();
+    expect(vi.mocked(indexedDB.addContestants).mock.calls[0]?.[0]).toEqual([
+      expect.objectContaining({ name: 'Alice', categoryId: 'stored-1' }),
+    ]);
+  });
+
+  it('undo removes only what it added', async () => {
+    vi.mocked(indexedDB.findCategoryByContentHash).mockImplementation((name) =>
+      Promise.resolve(name === 'Movies' ? ({ id: 'stored-1' } as StoredCategory) : null)
+    );
+    const command = new ImportCategoriesCommand([
+      { category: makeCategory('Movies', 'hash-1'), contestantName: '' },
+      { category: makeCategory('Music', 'hash-2'), contestantName: 'Bob' },
+    ]);
+
+    await command.execute();
+    await command.undo();
+
+    expect(indexedDB.deleteCategory).toHaveBeenCalledTimes(1);
+    expect(indexedDB.deleteCategory).toHaveBeenCalledWith('category-1');
+    expect(indexedDB.deleteContestant).toHaveBeenCalledTimes(1);
+  });
+
+  it('describes the number of categories', () => {
+    const command = new ImportCategoriesCommand([
+      { category: makeCategory('Movies'), contestantName: '' },
+      { category: makeCategory('Music'), contestantName: '' },
+    ]);
+
+    expect(command.describe()).toBe('Import 2 categories');
+  });
+});
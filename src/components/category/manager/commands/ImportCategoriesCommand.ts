@@ -0,0 +1,73 @@
+import { addCategories, addContestants, deleteCategory, deleteContestant } from '@/storage/indexedDB';
+import { prepareCategoryImport } from '@/utils/categoryImport';
+import { createContestantFromCategory } from '@/utils/jsonImport';
+import type { Category, Contestant } from '@/types';
+import type { Command } from '@/components/common/Command';
+
+export interface CategoryImportItem {
+  category: Category;
+  // Empty to import the category only
+  contestantName: string;
+}
+
+/**
+ * Import several categories (e.g. a batch_convert.py bundle) in one batch:
+ * all new categories in one IndexedDB transaction, then all contestants in another.
+ * Categories already stored unchanged are reused (see prepareCategoryImport).
+ */
+export class ImportCategoriesCommand implements Command {
+  private executed = false;
+  private addedCategoryIds: string[] = [];
+  private addedContestantIds: string[] = [];
+  private items: CategoryImportItem[];
+
+  constructor(items: CategoryImportItem[]) {
+    this.items = items;
+  }
+
+  async execute(): Promise<void> {
+    if (this.executed) return;
+
+    const { categoryIds, categoriesToAdd } = await prepareCategoryImport(
+      this.items.map(({ category }) => category)
+    );
+    const contestants: Contestant[] = [];
+    this.items.forEach(({ category, contestantName }, index) => {
+      if (contestantName.trim()) {
+        contestants.push({
+          ...createContestantFromCategory(category, contestantName),
+          categoryId: categoryIds[index] ?? '',
+        });
+      }
+    });
+
+    if (categoriesToAdd.length > 0) {
+      await addCategories(categoriesToAdd);
+    }
+    this.addedCategoryIds = categoriesToAdd.map(({ id }) => id);
+    if (contestants.length > 0) {
+      await addContestants(contestants);
+    }
+    this.addedContestantIds = contestants.map(({ id }) => id);
+    this.executed = true;
+  }
+
+  async undo(): Promise<void> {
+    if (!this.executed) return;
+
+    // Only remove what this command added; reused categories stay
+    for (const id of this.addedContestantIds) {
+      await deleteContestant(id);
+    }
+    for (const id of this.addedCategoryIds) {
+      await deleteCategory(id);
+    }
+    this.addedCategoryIds = [];
+    this.addedContestantIds = [];
+    this.executed = false;
+  }
+
+  describe(): string {
+    return `Import ${String(this.items.length)} categories`;
+  }
+}
@@ -328,6 +328,45 @@ describe('SlideViewer', () => {
     expect(screen.getByText('Loading slide...')).toBeInTheDocument();
   });
 
+  it('shows the placeholder thumbnail at the image size while loading', () => {
+    const slideWithPlaceholder: Slide = {
+      ...mockSlide,
+      imageWidth: 1920,
+      imageHeight: 1080,
+      placeholderUrl: 'data:image/jpeg;base64,placeholder',
+    };
+
+    const { container } = render(<SlideViewer slide={slideWithPlaceholder} />);
+
+    const placeholder = container.querySelector('img[src="data:image/jpeg;base64,placeholder"]');
+    expect(placeholder).toBeInTheDocument();
+    expect(placeholder).toHaveAttribute('width', '1920');
+    expect(placeholder).toHaveAttribute('height', '1080');
+    expect(screen.queryByText('Loading slide...')).not.toBeInTheDocument();
+  });
+
+  it('keeps the placeholder underneath after the image loads', async () => {
+    const slideWithPlaceholder: Slide = {
+      ...mockSlide,
+      placeholderUrl: 'data:image/jpeg;base64,placeholder',
+    };
+
+    const { container } = render(<SlideViewer slide={slideWithPlaceholder} />);
+
+    const img = screen.getByAltText('Slide content');
+    act(() => {
+      img.dispatchEvent(new Event('load'));
+    });
+
+    await waitFor(() => {
+      expect(img).toHaveStyle({ display: 'block' });
+    });
+
+    const placeholder = container.querySelector('img[src="data:image/jpeg;base64,placeholder"]');
+    expect(placeholder).toBeInTheDocument();
+    expect(placeholder).not.toHaveAttribute('width');
+  });
+
   it('handles missing image ref gracefully', () => {
     const slideWithEmptyUrl: Slide = {
       imageUrl: '',
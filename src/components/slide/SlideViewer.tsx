@@ -13,6 +13,8 @@ export interface SlideViewerProps {
  * SlideViewer component displays slide images with censorship boxes overlaid
  * at precise positions. Handles aspect ratio preservation with letterboxing.
  * Censor boxes are always rendered fully opaque (handled by CensorBox component).
+ * If the slide has a placeholderUrl, it is shown blurred at the image's final
+ * size and position until the full image has decoded, so slides never flash blank.
  */
 export function SlideViewer({ slide, showAnswer = false, className = '' }: SlideViewerProps) {
   const [imageLoaded, setImageLoaded] = useState(false);
@@ -90,6 +92,7 @@ export function SlideViewer({ slide, showAnswer = false, className = '' }: Slide
   const imageClass = styles['image'] ?? '';
   const loadedClass = imageLoaded ? (styles['loaded'] ?? '') : '';
   const placeholderClass = styles['placeholder'] ?? '';
+  const placeholderImageClass = styles['placeholder-image'] ?? '';
   const errorClass = styles['error'] ?? '';
   const overlayContainerClass = styles['overlay-container'] ?? '';
   const censorBoxClass = styles['censor-box'] ?? '';
@@ -102,8 +105,21 @@ export function SlideViewer({ slide, showAnswer = false, className = '' }: Slide
     <div className={combinedContainerClass} ref={containerRef}>
       {/* White background layer */}
       <div className={imageContainerClass} ref={imageContainerRef}>
-        {/* Show placeholder while loading */}
-        {!imageLoaded && !imageError && <div className={placeholderClass}>Loading slide...</div>}
+        {/* Placeholder: the blurred thumbnail, kept underneath so the fade-in never shows blank,
+            or a message while loading */}
+        {!imageError &&
+          (slide.placeholderUrl ? (
+            <img
+              src={slide.placeholderUrl}
+              alt=""
+              className={placeholderImageClass}
+              {...(slide.imageWidth && slide.imageHeight
+                ? { width: slide.imageWidth, height: slide.imageHeight }
+                : {})}
+            />
+          ) : (
+            !imageLoaded && <div className={placeholderClass}>Loading slide...</div>
+          ))}
 
         {/* Show error state */}
         {imageError && (
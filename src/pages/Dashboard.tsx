@@ -1,7 +1,6 @@
 import { useState, useEffect, useRef, useCallback } from 'react';
 import { useNavigate, Navigate } from 'react-router-dom';
-import { nanoid } from 'nanoid';
-import type { Category, Contestant, StoredCategory } from '@types';
+import type { Category, Contestant } from '@types';
 import { CategoryImporter } from '@components/CategoryImporter';
 import { CategoryManager } from '@components/category/CategoryManager';
 import { ContestantCard } from '@components/contestant/ContestantCard';
@@ -16,7 +15,7 @@ import { Modal } from '@components/common/Modal';
 import { ThemeToggle } from '@components/common/ThemeToggle';
 import { createContestantFromCategory } from '@utils/jsonImport';
 import { resetAppState } from '@utils/resetApp';
-import { calculateCategorySize } from '@utils/storageUtils';
+import { prepareCategoryImport } from '@utils/categoryImport';
 import { useContestants } from '@hooks/useIndexedDB';
 import { useCategories } from '@hooks/useCategories';
 import { useContestantSelection } from '@hooks/useContestantSelection';
@@ -96,30 +95,16 @@ function Dashboard() {
     setIsImporting(true);
 
     try {
-      // Prepare all categories and contestants for bulk import
-      const categoriesToAdd: StoredCategory[] = [];
+      // Prepare all categories and contestants for bulk import; categories already
+      // stored unchanged (same name and content hash) are reused, not written again
+      const { categoryIds, categoriesToAdd } = await prepareCategoryImport(
+        contestants.map(({ category }) => category)
+      );
       const contestantsToAdd: Contestant[] = [];
       const importResults: { categoryId: string; contestantId?: string }[] = [];
 
-      for (const { name, category } of contestants) {
-        const categoryId = nanoid();
-
-        const firstSlide = category.slides[0];
-        const thumbnailUrl = firstSlide?.imageUrl ?? '';
-
-        // Calculate actual in-memory size
-        const sizeInBytes = calculateCategorySize(category);
-
-        const storedCategory: StoredCategory = {
-          id: categoryId,
-          name: category.name,
-          slides: category.slides,
-          createdAt: new Date().toISOString(),
-          thumbnailUrl,
-          sizeInBytes,
-        };
-
-        categoriesToAdd.push(storedCategory);
+      contestants.forEach(({ name, category }, index) => {
+        const categoryId = categoryIds[index] ?? '';
 
         // Only create contestant if name is provided
         if (name.trim()) {
@@ -130,7 +115,7 @@ function Dashboard() {
         } else {
           importResults.push({ categoryId });
         }
-      }
+      });
 
       // Bulk add categories and contestants in parallel using hooks (updates UI)
       await Promise.all([
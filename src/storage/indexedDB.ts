@@ -484,6 +484,19 @@ export async function getCategoriesByName<T>(name: string): Promise<T[]> {
   }
 }
 
+/**
+ * Find a stored category with the given name and content hash
+ * (content hashes are written by scripts/parse_pptx.py).
+ * Used to skip re-storing a category that was re-imported unchanged.
+ */
+export async function findCategoryByContentHash<T extends { contentHash?: string }>(
+  name: string,
+  contentHash: string
+): Promise<T | null> {
+  const matches = await getCategoriesByName<T>(name);
+  return matches.find((category) => category.contentHash === contentHash) ?? null;
+}
+
 /**
  * Add a new category to IndexedDB
  */
@@ -15,6 +15,9 @@ import type { Slide } from './slide';
 export interface Category {
   name: string;
   slides: Slide[];
+
+  /** SHA-256 of the category content, from the parser's metadata.contentHash (optional) */
+  contentHash?: string;
 }
 
 /**
@@ -43,4 +43,19 @@ export interface Slide {
 
   /** Censorship boxes to overlay on the image */
   censorBoxes: CensorBox[];
+
+  /** SHA-256 of the slide content, set by the PPTX parser (optional) */
+  contentHash?: string;
+
+  /** SHA-256 of the PPTX parts the slide was parsed from, used by the parser's --update (optional) */
+  sourceHash?: string;
+
+  /** Pixel width of imageUrl, known before the image is decoded (optional) */
+  imageWidth?: number;
+
+  /** Pixel height of imageUrl, known before the image is decoded (optional) */
+  imageHeight?: number;
+
+  /** Tiny data URL thumbnail shown (blurred) while imageUrl decodes (optional) */
+  placeholderUrl?: string;
 }
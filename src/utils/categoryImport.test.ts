@@ -0,0 +1,85 @@
+/**
+ * Tests for category import helpers
+ */
+
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { prepareCategoryImport, toStoredCategoryData } from './categoryImport';
+import * as indexedDB from '@/storage/indexedDB';
+import type { Category, StoredCategory } from '@types';
+
+vi.mock('@/storage/indexedDB', () => ({
+  findCategoryByContentHash: vi.fn(),
+}));
+
+let nextId = 0;
+vi.mock('nanoid', () => ({
+  nanoid: () => `new-${String(++nextId)}`,
+}));
+
+const makeCategory = (name: string, contentHash?: string): Category => ({
+  name,
+  slides: [{ imageUrl: `data:image/jpeg;base64,${name}`, answer: 'Answer', censorBoxes: [] }],
+  ...(contentHash ? { contentHash } : {}),
+});
+
+describe('categoryImport', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    nextId = 0;
+    vi.mocked(indexedDB.findCategoryByContentHash).mockResolvedValue(null);
+  });
+
+  describe('toStoredCategoryData', () => {
+    it('keeps the content hash and uses the first slide as thumbnail', () => {
+      const data = toStoredCategoryData(makeCategory('Movies', 'hash-1'));
+
+      expect(data.name).toBe('Movies');
+      expect(data.contentHash).toBe('hash-1');
+      expect(data.thumbnailUrl).toBe('data:image/jpeg;base64,Movies');
+    });
+
+    it('leaves contentHash out when the category has none', () => {
+      expect(toStoredCategoryData(makeCategory('Movies'))).not.toHaveProperty('contentHash');
+    });
+  });
+
+  describe('prepareCategoryImport', () => {
+    it('adds new categories with their content hash', async () => {
+      const result = await prepareCategoryImport([makeCategory('Movies', 'hash-1')]);
+
+      expect(result.categoryIds).toEqual(['new-1']);
+      expect(result.categoriesToAdd).toHaveLength(1);
+      expect(result.categoriesToAdd[0]).toMatchObject({ id: 'new-1', contentHash: 'hash-1' });
+    });
+
+    it('reuses a stored category with the same name and content hash', async () => {
+      vi.mocked(indexedDB.findCategoryByContentHash).mockResolvedValue({
+        id: 'stored-1',
+      } as StoredCategory);
+
+      const result = await prepareCategoryImport([makeCategory('Movies', 'hash-1')]);
+
+      expect(indexedDB.findCategoryByContentHash).toHaveBeenCalledWith('Movies', 'hash-1');
+      expect(result.categoryIds).toEqual(['stored-1']);
+      expect(result.categoriesToAdd).toEqual([]);
+    });
+
+    it('adds a duplicate within the same import only once', async () => {
+      const result = await prepareCategoryImport([
+        makeCategory('Movies', 'hash-1'),
+        makeCategory('Movies', 'hash-1'),
+      ]);
+
+      expect(result.categoryIds).toEqual(['new-1', 'new-1']);
+      expect(result.categoriesToAdd).toHaveLength(1);
+    });
+
+    it('always adds categories without a content hash', async () => {
+      const result = await prepareCategoryImport([makeCategory('Movies'), makeCategory('Movies')]);
+
+      expect(indexedDB.findCategoryByContentHash).not.toHaveBeenCalled();
+      expect(result.categoryIds).toEqual(['new-1', 'new-2']);
+      expect(result.categoriesToAdd).toHaveLength(2);
+    });
+  });
+});
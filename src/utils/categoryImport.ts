@@ -0,0 +1,69 @@
+/**
+ * Helpers for storing imported categories
+ *
+ * Shared by the dashboard importer and the category manager. Categories whose
+ * parser contentHash matches a stored category are reused instead of being
+ * written to IndexedDB again.
+ */
+
+import { nanoid } from 'nanoid';
+import { findCategoryByContentHash } from '@/storage/indexedDB';
+import { calculateCategorySize } from './storageUtils';
+import type { Category, StoredCategory } from '@types';
+
+/**
+ * Build the record stored for an imported category (without its id)
+ */
+export function toStoredCategoryData(category: Category): Omit<StoredCategory, 'id'> {
+  return {
+    name: category.name,
+    slides: category.slides,
+    createdAt: new Date().toISOString(),
+    thumbnailUrl: category.slides[0]?.imageUrl ?? '',
+    sizeInBytes: calculateCategorySize(category),
+    ...(category.contentHash ? { contentHash: category.contentHash } : {}),
+  };
+}
+
+export interface PreparedCategoryImport {
+  /** Stored category id for each imported category, in input order */
+  categoryIds: string[];
+  /** Categories that are not stored yet, to be added in one batch */
+  categoriesToAdd: StoredCategory[];
+}
+
+/**
+ * Assign ids to categories for a bulk import.
+ *
+ * A category with the same name and contentHash as a stored one, or as an
+ * earlier one in the same import, reuses that category's id and is not added
+ * again. Categories without a contentHash are always added.
+ */
+export async function prepareCategoryImport(
+  categories: Category[]
+): Promise<PreparedCategoryImport> {
+  const categoryIds: string[] = [];
+  const categoriesToAdd: StoredCategory[] = [];
+  const seen = new Map<string, string>();
+
+  for (const category of categories) {
+    const { name, contentHash } = category;
+    const key = contentHash ? JSON.stringify([name, contentHash]) : null;
+
+    let categoryId = key ? seen.get(key) : undefined;
+    if (!categoryId && contentHash) {
+      categoryId = (await findCategoryByContentHash<StoredCategory>(name, contentHash))?.id;
+    }
+    if (!categoryId) {
+      categoryId = nanoid();
+      categoriesToAdd.push({ ...toStoredCategoryData(category), id: categoryId });
+    }
+
+    if (key) {
+      seen.set(key, categoryId);
+    }
+    categoryIds.push(categoryId);
+  }
+
+  return { categoryIds, categoriesToAdd };
+}
@@ -2,8 +2,15 @@
  * Tests for JSON import utility
  */
 
-import { describe, it, expect } from 'vitest';
-import { loadCategoryJSON, createContestantFromCategory, JSONImportError } from './jsonImport';
+import { describe, it, expect, vi } from 'vitest';
+import {
+  loadCategoryJSON,
+  loadCategoryNDJSON,
+  loadCategoryFile,
+  createContestantFromCategory,
+  JSONImportError,
+  MAX_JSON_FILE_BYTES,
+} from './jsonImport';
 import type { Category } from '@types';
 
 // Helper to create a File-like object from JSON data
@@ -22,6 +29,30 @@ function createJSONFile(data: unknown, filename = 'test.json'): File {
   return file;
 }
 
+// Helper to create a streamable File-like object from NDJSON lines
+function createNDJSONFile(lines: unknown[], filename = 'test.ndjson'): File {
+  const text = lines.map((line) => JSON.stringify(line)).join('\n') + '\n';
+  const file = new File([text], filename, { type: 'application/x-ndjson' });
+
+  // Split into small chunks so lines straddle chunk boundaries
+  const bytes = new TextEncoder().encode(text);
+  Object.defineProperty(file, 'stream', {
+    value: () =>
+      new ReadableStream<Uint8Array>({
+        start(controller) {
+          for (let i = 0; i < bytes.length; i += 7) {
+            controller.enqueue(bytes.slice(i, i + 7));
+          }
+          controller.close();
+        },
+      }),
+    writable: true,
+    configurable: true,
+  });
+
+  return file;
+}
+
 describe('loadCategoryJSON', () => {
   it('should load valid category JSON', async () => {
     const validData = {
@@ -65,6 +96,31 @@ describe('loadCategoryJSON', () => {
     expect(result.slides).toHaveLength(1);
   });
 
+  it('should carry the content hash from parser metadata', async () => {
+    const wrappedData = {
+      category: {
+        name: 'Movies',
+        slides: [
+          {
+            imageUrl: 'data:image/png;base64,abc123',
+            answer: 'The Matrix',
+            censorBoxes: [],
+            contentHash: 'slide-hash',
+          },
+        ],
+      },
+      metadata: {
+        contentHash: 'category-hash',
+      },
+    };
+
+    const file = createJSONFile(wrappedData);
+    const result = await loadCategoryJSON(file);
+
+    expect(result.contentHash).toBe('category-hash');
+    expect(result.slides[0]?.contentHash).toBe('slide-hash');
+  });
+
   it('should validate censor boxes with positive numbers', async () => {
     const validData = {
       name: 'Movies',
@@ -224,6 +280,132 @@ describe('loadCategoryJSON', () => {
   });
 });
 
+describe('loadCategoryNDJSON', () => {
+  const slide = {
+    imageUrl: 'data:image/jpeg;base64,abc123',
+    answer: 'The Matrix',
+    censorBoxes: [{ x: 10, y: 20, width: 30, height: 15, color: '#000000' }],
+  };
+
+  it('should load header and slides line by line', async () => {
+    const file = createNDJSONFile([
+      { name: 'Movies', metadata: { contestantName: 'John' }, slideCount: 2 },
+      slide,
+      { ...slide, answer: 'Inception' },
+    ]);
+    const result = await loadCategoryNDJSON(file);
+
+    expect(result.name).toBe('Movies');
+    expect(result.slides).toHaveLength(2);
+    expect(result.slides[1]?.answer).toBe('Inception');
+  });
+
+  it('should be used by loadCategoryJSON for .ndjson files', async () => {
+    const file = createNDJSONFile([{ name: 'Movies', metadata: null, slideCount: 1 }, slide]);
+    const result = await loadCategoryJSON(file);
+
+    expect(result).toEqual({ name: 'Movies', slides: [slide] });
+  });
+
+  it('should reject a header without name', async () => {
+    const file = createNDJSONFile([{ slideCount: 1 }, slide]);
+    await expect(loadCategoryNDJSON(file)).rejects.toThrow(JSONImportError);
+  });
+
+  it('should reject invalid slide lines', async () => {
+    const file = createNDJSONFile([
+      { name: 'Movies', slideCount: 1 },
+      { ...slide, imageUrl: 'not-a-data-url' },
+    ]);
+    await expect(loadCategoryNDJSON(file)).rejects.toThrow(/line 2/);
+  });
+
+  it('should reject truncated files', async () => {
+    const file = createNDJSONFile([{ name: 'Movies', slideCount: 3 }, slide]);
+    await expect(loadCategoryNDJSON(file)).rejects.toThrow(/truncated/);
+  });
+});
+
+describe('loadCategoryFile', () => {
+  const slide = {
+    imageUrl: 'data:image/jpeg;base64,abc123',
+    answer: 'The Matrix',
+    censorBoxes: [],
+  };
+  const movies = {
+    category: { name: 'Movies', slides: [slide] },
+    metadata: { contentHash: 'hash-movies', contestantName: 'Alice' },
+  };
+  const flags = {
+    category: { name: 'Flags', slides: [slide, slide] },
+    metadata: { contentHash: 'hash-flags' },
+  };
+  const index = [
+    { name: 'Movies', metadata: movies.metadata, slideCount: 1 },
+    { name: 'Flags', metadata: flags.metadata, slideCount: 2 },
+  ];
+
+  it('should load a single category with its contestant name', async () => {
+    const result = await loadCategoryFile(createJSONFile(movies));
+
+    expect(result).toEqual([
+      {
+        category: { name: 'Movies', slides: [slide], contentHash: 'hash-movies' },
+        contestantName: 'Alice',
+      },
+    ]);
+  });
+
+  it('should load every category in a JSON bundle', async () => {
+    const result = await loadCategoryFile(createJSONFile({ index, categories: [movies, flags] }));
+
+    expect(result).toHaveLength(2);
+    expect(result[0]?.contestantName).toBe('Alice');
+    expect(result[1]).toEqual({
+      category: { name: 'Flags', slides: [slide, slide], contentHash: 'hash-flags' },
+    });
+  });
+
+  it('should load every category in an NDJSON bundle', async () => {
+    const file = createNDJSONFile([{ index }, index[0], slide, index[1], slide, slide]);
+    const result = await loadCategoryFile(file);
+
+    expect(result.map((entry) => entry.category.name)).toEqual(['Movies', 'Flags']);
+    expect(result[0]?.contestantName).toBe('Alice');
+    expect(result[1]?.category.slides).toHaveLength(2);
+  });
+
+  it('should reject bundles with fewer categories than the index', async () => {
+    await expect(
+      loadCategoryFile(createJSONFile({ index, categories: [movies] }))
+    ).rejects.toThrow(/index lists 2 categories/);
+    await expect(
+      loadCategoryFile(createNDJSONFile([{ index }, index[0], slide]))
+    ).rejects.toThrow(/truncated/);
+  });
+
+  it('should report which bundle category is invalid', async () => {
+    const invalid = { category: { name: 'Flags', slides: [] } };
+    await expect(
+      loadCategoryFile(createJSONFile({ index, categories: [movies, invalid] }))
+    ).rejects.toThrow(/category 2 in bundle/);
+  });
+
+  it('should reject a JSON file too large to read as one string', async () => {
+    const file = createJSONFile({ index, categories: [movies, flags] }, 'season.json');
+    Object.defineProperty(file, 'size', { value: MAX_JSON_FILE_BYTES + 1 });
+    const text = vi.spyOn(file, 'text');
+
+    await expect(loadCategoryFile(file)).rejects.toThrow(/too large to read as JSON/);
+    expect(text).not.toHaveBeenCalled();
+  });
+
+  it('should not load a bundle as a single category', async () => {
+    const file = createNDJSONFile([{ index }, index[0], slide, index[1], slide, slide]);
+    await expect(loadCategoryNDJSON(file)).rejects.toThrow(/bundle/);
+  });
+});
+
 describe('createContestantFromCategory', () => {
   const mockCategory: Category = {
     name: 'Movies',
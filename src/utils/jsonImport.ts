@@ -94,11 +94,254 @@ export function isCategory(category: unknown): category is Category {
   );
 }
 
+/**
+ * A category read from an import file, with the contestant name from parser metadata
+ */
+export interface ImportedCategory {
+  category: Category;
+  contestantName?: string;
+}
+
+/**
+ * Read a string field from parser metadata, if present
+ */
+function getMetadataString(metadata: unknown, key: string): string | undefined {
+  if (typeof metadata !== 'object' || metadata === null) {
+    return undefined;
+  }
+  const value = (metadata as Record<string, unknown>)[key];
+  return isNonEmptyString(value) ? value : undefined;
+}
+
+/**
+ * Read the category content hash from parser metadata, if present
+ */
+function getContentHash(metadata: unknown): string | undefined {
+  return getMetadataString(metadata, 'contentHash');
+}
+
+/**
+ * Build an ImportedCategory, leaving out fields that are not set
+ */
+function toImportedCategory(
+  category: Category,
+  contentHash: string | undefined,
+  contestantName: string | undefined
+): ImportedCategory {
+  const imported: ImportedCategory = {
+    category: contentHash ? { ...category, contentHash } : category,
+  };
+  if (contestantName) {
+    imported.contestantName = contestantName;
+  }
+  return imported;
+}
+
+/**
+ * Index of a bundle written by `batch_convert.py --bundle`: one entry per category
+ */
+function getBundleIndex(data: unknown): unknown[] | null {
+  if (typeof data !== 'object' || data === null || 'name' in data) {
+    return null;
+  }
+  const index = (data as Record<string, unknown>)['index'];
+  return Array.isArray(index) ? index : null;
+}
+
+/**
+ * Whether a file uses the NDJSON format written by `parse_pptx.py --output-format ndjson`
+ */
+function isNDJSONFile(file: File): boolean {
+  return /\.(ndjson|jsonl)$/i.test(file.name);
+}
+
+/**
+ * Read a file line by line, decoding it in chunks so the whole file
+ * is never held as a single string
+ */
+async function* readLines(file: File): AsyncGenerator<string> {
+  const reader = file.stream().getReader();
+  const decoder = new TextDecoder();
+  let buffered = '';
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    buffered += decoder.decode(value, { stream: !done });
+
+    let newline = buffered.indexOf('\n');
+    while (newline !== -1) {
+      yield buffered.slice(0, newline);
+      buffered = buffered.slice(newline + 1);
+      newline = buffered.indexOf('\n');
+    }
+
+    if (done) {
+      break;
+    }
+  }
+
+  if (buffered.length > 0) {
+    yield buffered;
+  }
+}
+
+interface NDJSONCategory {
+  name: string;
+  slideCount: number | null;
+  contentHash: string | undefined;
+  contestantName: string | undefined;
+  slides: Slide[];
+}
+
+/**
+ * Read every category in an NDJSON file: an optional bundle index line,
+ * then for each category a header line ({ name, metadata, slideCount })
+ * followed by its slides. Each line is parsed and validated as it is read,
+ * so large files never go through one giant JSON.parse call.
+ */
+async function readNDJSONCategories(file: File): Promise<ImportedCategory[]> {
+  let index: unknown[] | null = null;
+  const categories: NDJSONCategory[] = [];
+  let lineNumber = 0;
+
+  try {
+    for await (const line of readLines(file)) {
+      lineNumber++;
+      if (line.trim().length === 0) {
+        continue;
+      }
+
+      let data: unknown;
+      try {
+        data = JSON.parse(line);
+      } catch (error) {
+        throw new JSONImportError(
+          `Failed to parse NDJSON line ${String(lineNumber)}: ${error instanceof Error ? error.message : String(error)}`
+        );
+      }
+
+      if (index === null && categories.length === 0) {
+        index = getBundleIndex(data);
+        if (index !== null) {
+          continue;
+        }
+      }
+
+      // A header starts the next category once the current one has all its slides
+      const current = categories[categories.length - 1];
+      if (
+        current === undefined ||
+        (current.slideCount !== null && current.slides.length >= current.slideCount)
+      ) {
+        const header = data as Record<string, unknown> | null;
+        if (typeof header !== 'object' || header === null || !isNonEmptyString(header['name'])) {
+          throw new JSONImportError(
+            current === undefined
+              ? 'Invalid NDJSON header: must have name (string)'
+              : `Invalid NDJSON header on line ${String(lineNumber)}: must have name (string)`
+          );
+        }
+        categories.push({
+          name: header['name'],
+          slideCount: isNumber(header['slideCount']) ? header['slideCount'] : null,
+          contentHash: getContentHash(header['metadata']),
+          contestantName: getMetadataString(header['metadata'], 'contestantName'),
+          slides: [],
+        });
+        continue;
+      }
+
+      if (!isSlide(data)) {
+        throw new JSONImportError(`Invalid slide on NDJSON line ${String(lineNumber)}`);
+      }
+      current.slides.push(data);
+    }
+  } catch (error) {
+    if (error instanceof JSONImportError) {
+      throw error;
+    }
+    throw new JSONImportError(
+      `Failed to read file: ${error instanceof Error ? error.message : String(error)}`
+    );
+  }
+
+  if (categories.length === 0) {
+    throw new JSONImportError('Invalid NDJSON: missing header line');
+  }
+
+  if (index !== null && categories.length !== index.length) {
+    throw new JSONImportError(
+      `Invalid bundle: index lists ${String(index.length)} categories but found ${String(categories.length)} (file may be truncated)`
+    );
+  }
+
+  return categories.map(({ name, slideCount, contentHash, contestantName, slides }) => {
+    if (slideCount !== null && slides.length !== slideCount) {
+      throw new JSONImportError(
+        `Invalid NDJSON: expected ${String(slideCount)} slides but found ${String(slides.length)} (file may be truncated)`
+      );
+    }
+
+    const category: Category = { name, slides };
+    if (!isCategory(category)) {
+      throw new JSONImportError(
+        'Invalid category data: must have name (string) and slides (non-empty array)'
+      );
+    }
+
+    return toImportedCategory(category, contentHash, contestantName);
+  });
+}
+
+/**
+ * Load and validate NDJSON from a File object (uploaded file)
+ *
+ * The first line is a header ({ name, metadata, slideCount }) and every
+ * following line is one slide (see readNDJSONCategories). Bundles of
+ * several categories are read with loadCategoryFile.
+ */
+export async function loadCategoryNDJSON(file: File): Promise<Category> {
+  const [first, ...rest] = await readNDJSONCategories(file);
+  if (first === undefined || rest.length > 0) {
+    throw new JSONImportError('File is a bundle of several categories, not a single category');
+  }
+  return first.category;
+}
+
 /**
  * Load and validate JSON from a File object (uploaded file)
  * Returns the parsed Category data
+ *
+ * Files with an .ndjson or .jsonl extension are read line by line
+ * (see loadCategoryNDJSON)
  */
 export async function loadCategoryJSON(file: File): Promise<Category> {
+  if (isNDJSONFile(file)) {
+    return loadCategoryNDJSON(file);
+  }
+
+  return parseCategoryDocument(await readJSONFile(file)).category;
+}
+
+/**
+ * Largest file read as one JSON document: the whole file becomes one string,
+ * and V8 strings hold at most 2^29 - 24 characters. NDJSON files are read
+ * line by line and have no such limit.
+ * Keep in sync with JSON_BUNDLE_MAX_BYTES in scripts/batch_convert.py
+ */
+export const MAX_JSON_FILE_BYTES = 2 ** 29 - 24;
+
+/**
+ * Read and parse a JSON file
+ */
+async function readJSONFile(file: File): Promise<unknown> {
+  if (file.size > MAX_JSON_FILE_BYTES) {
+    throw new JSONImportError(
+      `File is too large to read as JSON (${String(Math.round(file.size / 1e6))} MB); ` +
+        'convert it with --output-format ndjson instead'
+    );
+  }
+
   // Read file as text
   let text: string;
   try {
@@ -110,19 +353,26 @@ export async function loadCategoryJSON(file: File): Promise<Category> {
   }
 
   // Parse JSON
-  let data: unknown;
   try {
-    data = JSON.parse(text);
+    return JSON.parse(text) as unknown;
   } catch (error) {
     throw new JSONImportError(
       `Failed to parse JSON: ${error instanceof Error ? error.message : String(error)}`
     );
   }
+}
 
+/**
+ * Validate a parsed category document: parser output ({ category, metadata })
+ * or a bare Category
+ */
+function parseCategoryDocument(data: unknown): ImportedCategory {
   // Check if data has a 'category' field (from Python script output)
+  let metadata: unknown;
   if (typeof data === 'object' && data !== null && 'category' in data) {
     const dataObj = data as Record<string, unknown>;
     data = dataObj['category'];
+    metadata = dataObj['metadata'];
   }
 
   // Validate structure
@@ -132,7 +382,51 @@ export async function loadCategoryJSON(file: File): Promise<Category> {
     );
   }
 
-  return data;
+  return toImportedCategory(
+    data,
+    getContentHash(metadata),
+    getMetadataString(metadata, 'contestantName')
+  );
+}
+
+/**
+ * Load every category in an uploaded file: a single category, or a bundle
+ * written by `batch_convert.py --bundle`
+ *
+ * JSON bundles are { index, categories: [parser output, ...] }; NDJSON
+ * bundles are an index line followed by each category's header and slide
+ * lines. Contestant names stored in parser metadata are returned with
+ * their categories so a whole library can be imported in one pass.
+ */
+export async function loadCategoryFile(file: File): Promise<ImportedCategory[]> {
+  if (isNDJSONFile(file)) {
+    return readNDJSONCategories(file);
+  }
+
+  const data = await readJSONFile(file);
+  const index = getBundleIndex(data);
+  if (index === null) {
+    return [parseCategoryDocument(data)];
+  }
+
+  const categories = (data as Record<string, unknown>)['categories'];
+  if (!Array.isArray(categories)) {
+    throw new JSONImportError('Invalid bundle: must have categories (array)');
+  }
+  if (categories.length !== index.length) {
+    throw new JSONImportError(
+      `Invalid bundle: index lists ${String(index.length)} categories but found ${String(categories.length)}`
+    );
+  }
+  return categories.map((entry: unknown, i) => {
+    try {
+      return parseCategoryDocument(entry);
+    } catch (error) {
+      throw new JSONImportError(
+        `Invalid category ${String(i + 1)} in bundle: ${error instanceof Error ? error.message : String(error)}`
+      );
+    }
+  });
 }
 
 /**